@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: selective component JSON loading vs. json.load.
+
+Builds a corpus of component JSON files from a real GDT output folder, padding
+each file's `metadata` block (research sources, competitors analyzed, market
+metrics) up to a target size, then converts every component with both loaders.
+Reports wall time and peak traced memory, and checks the converted components
+are identical.
+
+Usage:
+    python scripts/benchmark_component_loading.py
+    python scripts/benchmark_component_loading.py --sizes-kb 16 256 4096 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gdt_converter_v3 import convert_component_from_json, index_brand_folder  # noqa: E402
+
+DEFAULT_SOURCE = Path(__file__).parent.parent / 'outputs' / 'zyn-usa-2025-12-30'
+
+
+# ============================================================================
+# CORPUS
+# ============================================================================
+
+def pad_metadata(data: dict, target_bytes: int) -> dict:
+    """Grow the metadata block with research-panel style entries until the file reaches target size."""
+    metadata = data.setdefault('metadata', {})
+    sources = metadata.setdefault('research_sources', [])
+    competitors = metadata.setdefault('competitors_analyzed', [])
+    metrics = metadata.setdefault('key_market_metrics', {})
+
+    # Sizes are estimated per entry (indent depth aside) rather than re-serializing the file
+    size = len(json.dumps(data, indent=2))
+    i = 0
+    while size < target_bytes:
+        source = (f"Research panel {i}: category tracker wave {i % 12}, n=1,200 adults 21+, "
+                  f"\"unaided awareness\" and consideration by region")
+        competitor = {'name': f'Competitor {i}', 'share': round(i * 0.37 % 30, 2),
+                      'notes': ['price-led', 'regional', 'flavor breadth']}
+        metric = {'value': i * 1.5, 'unit': '%', 'source': f'panel-{i}'}
+        sources.append(source)
+        competitors.append(competitor)
+        metrics[f'metric_{i}'] = metric
+        size += sum(len(json.dumps(entry, indent=2)) for entry in (source, competitor, metric)) + 64
+        i += 1
+    return data
+
+
+def build_corpus(source: Path, out_dir: Path, target_kb: int) -> dict:
+    """Write padded copies of every component JSON in `source`. Returns {comp_id: path}."""
+    index = index_brand_folder(source)
+    corpus = {}
+    for comp_id, files in sorted(index.components.items()):
+        if files.json_path is None:
+            continue
+        with open(files.json_path, 'r') as f:
+            data = json.load(f)
+        padded = pad_metadata(data, target_kb * 1024)
+        path = out_dir / f'{comp_id}-{target_kb}kb.json'
+        with open(path, 'w') as f:
+            json.dump(padded, f, indent=2)
+        corpus[comp_id] = path
+    return corpus
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def convert_full(corpus: dict) -> list:
+    results = []
+    for comp_id, path in corpus.items():
+        with open(path, 'r') as f:
+            data = json.load(f)
+        results.append(convert_component_from_json(comp_id, None, data))
+    return results
+
+
+def convert_subset(corpus: dict) -> list:
+    return [convert_component_from_json(comp_id, path) for comp_id, path in corpus.items()]
+
+
+def measure(fn, repeat: int):
+    """(median seconds, peak traced bytes, results)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = fn()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark component JSON loading')
+    parser.add_argument('--source', type=Path, default=DEFAULT_SOURCE,
+                        help='GDT output folder whose component JSONs seed the corpus')
+    parser.add_argument('--sizes-kb', type=int, nargs='+', default=[16, 256, 1024, 4096],
+                        help='Target size of each component file')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    args = parser.parse_args()
+
+    print(f"{'File size':>9} | {'Files':>5} | {'json.load (ms)':>14} | {'subset (ms)':>11} | "
+          f"{'json.load peak (MB)':>19} | {'subset peak (MB)':>16} | Same")
+    print(f"{'-' * 9}-+-{'-' * 5}-+-{'-' * 14}-+-{'-' * 11}-+-{'-' * 19}-+-{'-' * 16}-+-----")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_kb in args.sizes_kb:
+            corpus = build_corpus(args.source, Path(tmp), size_kb)
+            if not corpus:
+                print(f"❌ No component JSON files in {args.source}")
+                return 1
+
+            full_s, full_peak, full_results = measure(lambda: convert_full(corpus), args.repeat)
+            sub_s, sub_peak, sub_results = measure(lambda: convert_subset(corpus), args.repeat)
+            same = '✓' if full_results == sub_results else '✗'
+
+            print(f"{size_kb:>6} KB | {len(corpus):>5} | {full_s * 1000:>14.1f} | {sub_s * 1000:>11.1f} | "
+                  f"{full_peak / 1e6:>19.2f} | {sub_peak / 1e6:>16.2f} | {same:>4}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark: numpy mask background replacement vs. the per-pixel img.load() loop.
+
+Builds synthetic covers (near-black background with cream line art, like the
+GDT image style), runs the original loop and the vectorized engine in memory,
+checks the outputs are pixel-identical, and reports throughput in
+megapixels per second. The "2 variants" row produces page and secondary
+images from one decode and one mask.
+
+--memory compares whole-image and banded (strip) processing of PNG files on
+disk instead: each run happens in a fresh process so its peak RSS is its own
+(an idle process with the same imports is shown for reference), and the two
+outputs are checked to be byte-identical.
+
+Usage:
+    python scripts/benchmark_fix_background.py
+    python scripts/benchmark_fix_background.py --sizes 1024 2048 4096 --repeat 3
+    python scripts/benchmark_fix_background.py --memory --sizes 2048 4096 8192
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fix_image_background import (  # noqa: E402
+    COLORS,
+    DEFAULT_THRESHOLD,
+    STRIP_PIXELS,
+    apply_background,
+    dark_mask,
+    fix_image,
+    hex_to_rgb,
+)
+
+
+# ============================================================================
+# BASELINE: per-pixel loop (fix_background before the numpy engine)
+# ============================================================================
+
+def legacy_fix(img, target_rgb, threshold=DEFAULT_THRESHOLD):
+    img = img.convert('RGBA')
+    pixels = img.load()
+    width, height = img.size
+    for y in range(height):
+        for x in range(width):
+            r, g, b, a = pixels[x, y]
+            if r < threshold and g < threshold and b < threshold:
+                pixels[x, y] = (target_rgb[0], target_rgb[1], target_rgb[2], a)
+    return img
+
+
+# ============================================================================
+# SYNTHETIC COVER
+# ============================================================================
+
+def build_cover(size):
+    """Noisy near-black background with cream line art and an accent shape."""
+    rng = np.random.default_rng(7)
+    base = rng.integers(0, 48, size=(size, size, 3), dtype=np.uint8)
+    img = Image.fromarray(base, 'RGB').convert('RGBA')
+    draw = ImageDraw.Draw(img)
+    step = max(size // 16, 8)
+    for i in range(0, size, step):
+        draw.line([(i, 0), (size - i, size)], fill=(237, 232, 223, 255), width=max(size // 256, 1))
+    draw.ellipse([size // 3, size // 3, size * 2 // 3, size * 2 // 3], outline=(229, 75, 123, 255),
+                 width=max(size // 128, 2))
+    return img
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def run_legacy(img):
+    return legacy_fix(img, hex_to_rgb(COLORS['page']))
+
+
+def run_vectorized(img):
+    pixels = np.asarray(img.convert('RGBA'))
+    mask = dark_mask(pixels)
+    return apply_background(pixels, mask, hex_to_rgb(COLORS['page']))
+
+
+def run_variants(img):
+    pixels = np.asarray(img.convert('RGBA'))
+    mask = dark_mask(pixels)
+    return [apply_background(pixels, mask, hex_to_rgb(COLORS[name])) for name in ('page', 'secondary')]
+
+
+def median_seconds(fn, img, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(img)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+# ============================================================================
+# MEMORY: whole image vs. strips
+# ============================================================================
+
+def _peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _in_child(fn, *args):
+    """Run fn in a fresh process. Linux keeps ru_maxrss across fork/exec, so the
+    parent never holds a large image itself."""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(fn, *args).result()
+
+
+def _write_cover(size, path):
+    build_cover(size).save(path, 'PNG')
+
+
+def _fix_and_measure(source, output, strip_rows):
+    """(seconds, peak RSS in bytes, sha256 of the output)."""
+    start = time.perf_counter()
+    fix_image(source, [(output, COLORS['page'])], strip_rows=strip_rows)
+    seconds = time.perf_counter() - start
+    return seconds, _peak_rss_bytes(), hashlib.sha256(Path(output).read_bytes()).hexdigest()
+
+
+def run_memory(sizes, strip_rows):
+    print(f"Idle worker peak RSS: {_in_child(_peak_rss_bytes) / 1e6:.1f} MB\n")
+    print(f"{'Size':>11} | {'Mode':<17} | {'Time (ms)':>10} | {'Peak RSS (MB)':>13} | Output")
+    print(f"{'-' * 11}-+-{'-' * 17}-+-{'-' * 10}-+-{'-' * 13}-+-{'-' * 9}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            source = Path(tmp) / f"cover-{size}.png"
+            _in_child(_write_cover, size, source)
+
+            rows_per_band = strip_rows or max(1, STRIP_PIXELS // size)
+            digests = set()
+            for mode, rows in (('whole image', 0), (f'strips ({rows_per_band} rows)', rows_per_band)):
+                output = Path(tmp) / f"fixed-{size}-{rows}.png"
+                seconds, peak, digest = _in_child(_fix_and_measure, source, output, rows)
+                output.unlink()
+                digests.add(digest)
+                same = "identical" if len(digests) == 1 else "DIFFERS"
+                print(f"{size:>5}x{size:<5} | {mode:<17} | {seconds * 1000:>10.1f} | "
+                      f"{peak / 1e6:>13.1f} | {same}")
+
+            if len(digests) != 1:
+                print(f"❌ Strip output differs from the whole-image output at {size}x{size}")
+                return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark background replacement')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        help='Square image sizes to test (default: 512 1024 2048; --memory: 2048 4096)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    parser.add_argument('--legacy-repeat', type=int, default=1,
+                        help='Runs of the (slow) per-pixel loop')
+    parser.add_argument('--memory', action='store_true',
+                        help='Compare peak memory of whole-image and strip processing instead')
+    parser.add_argument('--strip-rows', type=int,
+                        help='Rows per band for --memory (default: sized by STRIP_PIXELS)')
+    args = parser.parse_args()
+
+    if args.memory:
+        return run_memory(args.sizes or [2048, 4096], args.strip_rows)
+    args.sizes = args.sizes or [512, 1024, 2048]
+
+    print(f"{'Size':>9} | {'Engine':<20} | {'Time (ms)':>10} | {'Mpx/s':>8} | {'Speedup':>7}")
+    print(f"{'-' * 9}-+-{'-' * 20}-+-{'-' * 10}-+-{'-' * 8}-+-{'-' * 7}")
+
+    for size in args.sizes:
+        img = build_cover(size)
+        megapixels = size * size / 1e6
+
+        if not np.array_equal(np.asarray(run_legacy(img)), run_vectorized(img)):
+            print(f"❌ Engines disagree on the {size}x{size} image")
+            return 1
+
+        legacy = median_seconds(run_legacy, img, args.legacy_repeat)
+        rows = [
+            ('per-pixel loop', legacy),
+            ('numpy mask', median_seconds(run_vectorized, img, args.repeat)),
+            ('numpy, 2 variants', median_seconds(run_variants, img, args.repeat)),
+        ]
+        for name, seconds in rows:
+            print(f"{size:>4}x{size:<4} | {name:<20} | {seconds * 1000:>10.1f} | "
+                  f"{megapixels / seconds:>8.1f} | {legacy / seconds:>6.1f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
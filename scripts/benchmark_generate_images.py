@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: generate_images.py driver throughput against the local images.edit stand-in.
+
+Starts mock_images_server.py in-process, runs the same batch of jobs through
+the async driver at each concurrency level over real HTTP with the OpenAI
+SDK, and reports wall time, images per second, retries and the server's
+response counts. Every written image is checked byte for byte against the
+synthetic image the server should have returned, so the b64_json and URL
+download paths are verified too.
+
+Fault injection (--error-rate, --rate-limit-rate, --rpm) shows what retries
+and backoff cost; --backoff-base and --retry-after default low so a run
+takes seconds, not minutes.
+
+Usage:
+    python scripts/benchmark_generate_images.py
+    python scripts/benchmark_generate_images.py --jobs 32 --concurrency 1 4 8 16 --latency 1
+    python scripts/benchmark_generate_images.py --error-rate 0.1 --rate-limit-rate 0.1 --response-format url
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openai import AsyncOpenAI
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_images import DONE, STYLE_REF, Driver, ImageJob  # noqa: E402
+from generation_queue import TokenBucket  # noqa: E402
+from mock_images_server import ServerConfig, serve_in_background, synthetic_image  # noqa: E402
+
+ACCENTS = ['#E54B7B', '#3B82F6', '#F59E0B', '#10B981', '#8B5CF6', '#EF4444']
+
+
+def build_jobs(count, size, output_dir):
+    return [
+        ImageJob(brand=f"brand{i:02d}", kind='cover', size=size,
+                 prompt=f"Bold line art cover {i}, accent color {ACCENTS[i % len(ACCENTS)]}",
+                 output=output_dir / f"brand{i:02d}-cover.png")
+        for i in range(count)
+    ]
+
+
+def verify(results, style_ref):
+    """Number of written images that differ from what the server generates for their request."""
+    return sum(
+        1 for r in results
+        if r.status == DONE and r.job.output.read_bytes() != synthetic_image(r.job.prompt, r.job.size, style_ref)
+    )
+
+
+async def run_level(jobs, config, args, concurrency):
+    server = serve_in_background(config)
+    client = AsyncOpenAI(api_key='benchmark', base_url=server.base_url, timeout=args.timeout, max_retries=0)
+    bucket = TokenBucket(args.client_rpm / 60, burst=concurrency) if args.client_rpm else None
+    driver = Driver(client, concurrency, args.timeout, args.max_attempts, bucket,
+                    backoff_base=args.backoff_base, verbose=False)
+    try:
+        start = time.perf_counter()
+        results = await driver.run(jobs)
+        wall = time.perf_counter() - start
+    finally:
+        await client.close()
+        server.shutdown()
+        server.server_close()
+    return results, wall, dict(server.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the image generation driver against a local server')
+    parser.add_argument('--jobs', type=int, default=24, help='Images per run (default: 24)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16],
+                        help='Concurrency levels to compare (default: 1 2 4 8 16)')
+    parser.add_argument('--size', default='512x512',
+                        help='Image size; the server draws them on this CPU (default: 512x512)')
+    parser.add_argument('--latency', type=float, default=0.5, help='Server latency in seconds (default: 0.5)')
+    parser.add_argument('--jitter', type=float, default=0.1, help='Latency standard deviation (default: 0.1)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of 500 responses')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of 429 responses')
+    parser.add_argument('--rpm', type=int, default=0, help='Server-enforced requests per minute')
+    parser.add_argument('--client-rpm', type=float, default=0, help='Driver token bucket rate (default: off)')
+    parser.add_argument('--retry-after', type=float, default=0.2, help='Retry-After on 429s (default: 0.2)')
+    parser.add_argument('--backoff-base', type=float, default=0.2, help='Driver backoff base (default: 0.2)')
+    parser.add_argument('--max-attempts', type=int, default=5, help='Attempts per job (default: 5)')
+    parser.add_argument('--timeout', type=float, default=30, help='Seconds per attempt (default: 30)')
+    parser.add_argument('--response-format', choices=['b64_json', 'url'], default='b64_json')
+    args = parser.parse_args()
+
+    style_ref = STYLE_REF.read_bytes()
+    print(f"{args.jobs} jobs at {args.size}, server latency {args.latency:g}s ± {args.jitter:g}s, "
+          f"{args.error_rate:.0%} errors, {args.rate_limit_rate:.0%} 429s, {args.response_format}\n")
+    print(f"{'Concurrency':>11} | {'Wall (s)':>8} | {'Images/s':>8} | {'Speedup':>7} | {'Retries':>7} | "
+          f"{'Failed':>6} | {'p50 (s)':>7} | {'p95 (s)':>7} | {'429s':>4} | {'500s':>4} | Output")
+    print(f"{'-' * 11}-+-{'-' * 8}-+-{'-' * 8}-+-{'-' * 7}-+-{'-' * 7}-+-{'-' * 6}-+-{'-' * 7}-+-"
+          f"{'-' * 7}-+-{'-' * 4}-+-{'-' * 4}-+-{'-' * 9}")
+
+    baseline = None
+    for concurrency in args.concurrency:
+        config = ServerConfig(args.latency, args.jitter, args.error_rate, args.rate_limit_rate, args.rpm,
+                              args.retry_after, args.response_format)
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs = build_jobs(args.jobs, args.size, Path(tmp))
+            results, wall, stats = asyncio.run(run_level(jobs, config, args, concurrency))
+            mismatched = verify(results, style_ref)
+
+        rate = args.jobs / wall
+        baseline = baseline or rate
+        seconds = sorted(r.seconds for r in results)
+        p95 = seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))]
+        retries = sum(max(r.attempts - 1, 0) for r in results)
+        failed = sum(1 for r in results if r.status != DONE)
+        print(f"{concurrency:>11} | {wall:>8.2f} | {rate:>8.2f} | {rate / baseline:>6.1f}x | {retries:>7} | "
+              f"{failed:>6} | {statistics.median(seconds):>7.2f} | {p95:>7.2f} | {stats.get(429, 0):>4} | "
+              f"{stats.get(500, 0):>4} | {'identical' if not mismatched else f'{mismatched} differ'}")
+
+
+if __name__ == "__main__":
+    main()
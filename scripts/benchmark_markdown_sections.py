@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass MarkdownSections index vs. the v2.0 per-field regexes.
+
+Builds synthetic component markdown files of 1 MB+ (long Deep Dive bullet
+lists, competitive context and rationale), checks that both parsers extract
+identical content, and reports the time per component for each.
+
+Usage:
+    python scripts/benchmark_markdown_sections.py
+    python scripts/benchmark_markdown_sections.py --size-mb 4 --repeat 10
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gdt_converter_v2 import (  # noqa: E402
+    MarkdownSections,
+    WSNContent,
+    parse_markdown_deep_dive,
+    parse_markdown_header,
+    parse_markdown_wsn,
+    slugify,
+)
+
+
+# ============================================================================
+# BASELINE: v2.0 REGEX PARSERS (one full-document search per field)
+# ============================================================================
+
+def legacy_parse_header(md_content: str) -> dict:
+    header = {'component_id': '', 'component_name': '', 'score': 0.0, 'tier': '',
+              'section': '', 'brand': '', 'market': ''}
+    title_match = re.search(r'^#\s*([A-C][1-3]):\s*(.+)$', md_content, re.MULTILINE)
+    if title_match:
+        header['component_id'] = title_match.group(1).lower()
+        header['component_name'] = title_match.group(2).strip()
+    score_match = re.search(r'\*\*Score:\*\*\s*([\d.]+)/10', md_content)
+    if score_match:
+        header['score'] = float(score_match.group(1))
+    tier_match = re.search(r'\*\*Tier:\*\*\s*([^\n|*]+)', md_content)
+    if tier_match:
+        header['tier'] = tier_match.group(1).strip()
+    section_match = re.search(r'\*\*Section:\*\*\s*([^|*]+)', md_content)
+    if section_match:
+        header['section'] = section_match.group(1).strip()
+    return header
+
+
+def legacy_parse_wsn(md_content: str) -> WSNContent:
+    wsn = WSNContent()
+    summary_match = re.search(r'## Summary\s*\n(.*?)(?=\n---|\n## )', md_content, re.DOTALL)
+    if not summary_match:
+        return wsn
+    summary = summary_match.group(1)
+    headline_match = re.search(r'^\*\*([^*]+)\*\*\s*$', summary, re.MULTILINE)
+    if headline_match:
+        wsn.headline = headline_match.group(1).strip()
+    for match in re.finditer(r'^\*([^*]+)\*\s*$', summary, re.MULTILINE):
+        if 'Evidence' not in match.group(0) and 'evidence' not in match.group(0):
+            wsn.subline = match.group(1).strip()
+            break
+    what_match = re.search(
+        r'\*\*What:\*\*\s*(.+?)(?=\n\*Evidence:|\n\n\*\*So What|\n\*\*So What|\n\n---)',
+        summary, re.DOTALL)
+    if what_match:
+        wsn.what = what_match.group(1).strip()
+    evidence_match = re.search(r'\*Evidence:\s*([^*]+)\*', summary)
+    if evidence_match:
+        wsn.evidence = evidence_match.group(1).strip()
+    so_what_match = re.search(
+        r'\*\*So What:\*\*\s*(.+?)(?=\n\n\*\*Now What|\n\*\*Now What|\n\n---|\n---)',
+        summary, re.DOTALL)
+    if so_what_match:
+        wsn.soWhat = so_what_match.group(1).strip()
+    now_what_match = re.search(
+        r'\*\*Now What:\*\*\s*(.+?)(?=\n\n---|\n---|\n\n\n|\Z)', summary, re.DOTALL)
+    if now_what_match:
+        wsn.nowWhat = now_what_match.group(1).strip()
+    return wsn
+
+
+def legacy_parse_deep_dive(md_content: str) -> dict:
+    deep_dive = {'strengths': [], 'weaknesses': [], 'competitiveContext': '',
+                 'rationale': '', 'recommendations': '', 'scoreBreakdown': {}}
+    deep_dive_match = re.search(r'## Deep Dive\s*\n(.*?)(?=\n## Score Breakdown|\Z)',
+                                md_content, re.DOTALL)
+    if deep_dive_match:
+        content = deep_dive_match.group(1)
+        strengths_match = re.search(r'### Strengths\s*\n(.*?)(?=\n### |\Z)', content, re.DOTALL)
+        if strengths_match:
+            bullets = re.findall(r'^- (.+)$', strengths_match.group(1), re.MULTILINE)
+            deep_dive['strengths'] = [b.strip() for b in bullets]
+        weaknesses_match = re.search(r'### Weaknesses\s*\n(.*?)(?=\n### |\Z)', content, re.DOTALL)
+        if weaknesses_match:
+            bullets = re.findall(r'^- (.+)$', weaknesses_match.group(1), re.MULTILINE)
+            deep_dive['weaknesses'] = [b.strip() for b in bullets]
+        context_match = re.search(r'### Competitive Context\s*\n(.*?)(?=\n### |\Z)', content, re.DOTALL)
+        if context_match:
+            deep_dive['competitiveContext'] = context_match.group(1).strip()
+        rationale_match = re.search(r'### Rating Rationale\s*\n(.*?)(?=\n### |\n---|\Z)',
+                                    content, re.DOTALL)
+        if rationale_match:
+            deep_dive['rationale'] = rationale_match.group(1).strip()
+        rec_match = re.search(r'### Recommendations\s*\n(.*?)(?=\n### |\n---|\Z)', content, re.DOTALL)
+        if rec_match:
+            deep_dive['recommendations'] = rec_match.group(1).strip()
+    breakdown_match = re.search(r'## Score Breakdown\s*\n(.*?)(?=\n\*Generated|\Z)', md_content, re.DOTALL)
+    if breakdown_match:
+        rows = re.findall(r'\|\s*([^|]+)\s*\|\s*([\d.]+)\s*\|', breakdown_match.group(1))
+        for name, score in rows:
+            if name.strip() and name.strip() not in ['---', 'Dimension', 'Score']:
+                key = slugify(name.strip()).replace('-', '_')
+                try:
+                    deep_dive['scoreBreakdown'][key] = float(score)
+                except ValueError:
+                    pass
+    return deep_dive
+
+
+# ============================================================================
+# SYNTHETIC CORPUS
+# ============================================================================
+
+SENTENCE = ("Consumers in the category associate the brand with everyday reliability, "
+            "while competitors lean on price promotions to close a 12% awareness gap. ")
+
+
+def build_component_markdown(target_bytes: int) -> str:
+    """Build a well-formed component file padded to roughly target_bytes."""
+    # Split the padding between bullets, context and rationale
+    share = max(target_bytes // 4, 1)
+    bullet = '- ' + SENTENCE * 3 + '\n'
+    bullets = bullet * max(share // len(bullet), 3)
+    paragraph = (SENTENCE * 8 + '\n\n') * max(share // (len(SENTENCE) * 8), 1)
+
+    return f"""# A1: Brand Positioning
+**Section:** Brand & Business Alignment | **Score:** 6.4/10 | **Tier:** Established
+
+**Brand:** Synthetic Brand | **Market:** USA
+
+---
+
+## Summary
+
+**The brand owns reliability but has not yet made it distinctive**
+
+*Reliability is table stakes in a category that rewards cultural heat*
+
+**What:** Most buyers name the brand first when asked about dependable options.
+
+*Evidence: 64% unaided awareness among category buyers*
+
+**So What:** Reliability alone leaves the brand exposed to challengers with sharper stories.
+
+**Now What:** Build a signature story that turns reliability into a reason to choose.
+
+---
+
+## Deep Dive
+
+### Strengths
+
+{bullets}
+### Weaknesses
+
+{bullets}
+### Competitive Context
+
+{paragraph}
+### Rating Rationale
+
+{paragraph}
+---
+
+## Score Breakdown
+
+| Dimension | Score |
+|-----------|-------|
+| Clarity | 7.1 |
+| Differentiation | 5.2 |
+| Relevance | 6.8 |
+
+*Generated: 2025-12-30T12:00:00*
+"""
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def parse_legacy(md_content: str):
+    return (legacy_parse_header(md_content), legacy_parse_wsn(md_content),
+            legacy_parse_deep_dive(md_content))
+
+
+def parse_indexed(md_content: str):
+    sections = MarkdownSections(md_content)
+    return (parse_markdown_header(md_content, sections), parse_markdown_wsn(md_content, sections),
+            parse_markdown_deep_dive(md_content, sections))
+
+
+def time_parser(parser, md_content: str, repeat: int) -> float:
+    """Median wall time in seconds over `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser(md_content)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark markdown section parsing')
+    parser.add_argument('--size-mb', type=float, nargs='+', default=[1.0, 2.0, 4.0],
+                        help='Component file sizes to test (MB)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement')
+    args = parser.parse_args()
+
+    print(f"{'Size':>8} | {'Regex (ms)':>11} | {'Indexed (ms)':>12} | {'Speedup':>7}")
+    print(f"{'-' * 8}-+-{'-' * 11}-+-{'-' * 12}-+-{'-' * 7}")
+
+    for size_mb in args.size_mb:
+        md_content = build_component_markdown(int(size_mb * 1024 * 1024))
+
+        if parse_legacy(md_content) != parse_indexed(md_content):
+            print(f"❌ Parsers disagree on the {size_mb} MB file")
+            return 1
+
+        legacy = time_parser(parse_legacy, md_content, args.repeat)
+        indexed = time_parser(parse_indexed, md_content, args.repeat)
+        actual_mb = len(md_content.encode('utf-8')) / (1024 * 1024)
+        print(f"{actual_mb:>6.2f}MB | {legacy * 1000:>11.1f} | {indexed * 1000:>12.1f} | "
+              f"{legacy / indexed:>6.1f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
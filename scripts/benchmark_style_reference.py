@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: style reference upload size and images.edit round trip.
+
+Compares the style reference file as saved with the compact references
+style_reference.py builds at several sizes: request body size, one-off build
+time, fidelity to the original (mean error and PSNR after scaling back to
+full size) and the round-trip latency of images.edit requests against the
+local stand-in server (mock_images_server.py) over a simulated uplink.
+
+Requests go through generate_images.generate() and the OpenAI SDK exactly as
+in a real run; the server's own latency is kept fixed and its responses are
+reused, so differences in round trip come from the upload alone.
+
+Usage:
+    python scripts/benchmark_style_reference.py
+    python scripts/benchmark_style_reference.py --uplink-mbps 10 --sizes 1024 768 512 --requests 10
+"""
+
+import argparse
+import asyncio
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from openai import AsyncOpenAI
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_images import SIZE, STYLE_REF, ImageJob, generate  # noqa: E402
+from mock_images_server import ServerConfig, serve_in_background  # noqa: E402
+from style_reference import shrink_style_ref  # noqa: E402
+
+PROMPT = "Bold line art cover, accent color #E54B7B"
+
+
+def fidelity(original: bytes, reference: bytes):
+    """(mean absolute error, PSNR in dB) of a reference scaled back to the original's size."""
+    with Image.open(io.BytesIO(original)) as img:
+        before = np.asarray(img.convert('RGB'), dtype=np.float64)
+        size = img.size
+    with Image.open(io.BytesIO(reference)) as img:
+        after = np.asarray(img.convert('RGB').resize(size, Image.LANCZOS), dtype=np.float64)
+    diff = after - before
+    mse = float(np.mean(diff ** 2))
+    psnr = 10 * np.log10(255 ** 2 / mse) if mse else float('inf')
+    return float(np.mean(np.abs(diff))), psnr
+
+
+async def round_trips(server, reference: bytes, args):
+    """Seconds per request, and request body bytes, for `args.requests` sequential images.edit calls."""
+    client = AsyncOpenAI(api_key='benchmark', base_url=server.base_url, timeout=120, max_retries=0)
+    job = ImageJob(brand='benchmark', kind='cover', prompt=PROMPT, output=Path('unused.png'), size=args.size)
+    try:
+        await generate(client, job, reference)  # warm-up: connection and the server's rendering of the image
+        received = server.received_bytes
+        seconds = []
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            await generate(client, job, reference)
+            seconds.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+    return seconds, (server.received_bytes - received) / args.requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compact style references against a local server')
+    parser.add_argument('reference', nargs='?', type=Path, default=STYLE_REF,
+                        help=f'Style reference image (default: {STYLE_REF.name})')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1024, 768, 512],
+                        help='Longest sides of the compact references (default: 1024 768 512)')
+    parser.add_argument('--uplink-mbps', type=float, default=20.0,
+                        help='Simulated upload bandwidth in Mbit/s (default: 20)')
+    parser.add_argument('--latency', type=float, default=0.2, help='Server latency in seconds (default: 0.2)')
+    parser.add_argument('--requests', type=int, default=5, help='Requests per reference (default: 5)')
+    parser.add_argument('--size', default=SIZE, help=f'Requested image size (default: {SIZE})')
+    args = parser.parse_args()
+
+    original = args.reference.read_bytes()
+    references = [('original', original, 0.0)]
+    for side in args.sizes:
+        start = time.perf_counter()
+        references.append((f"compact {side}", shrink_style_ref(original, side), time.perf_counter() - start))
+
+    server = serve_in_background(ServerConfig(latency=args.latency, jitter=0.0, uplink_mbps=args.uplink_mbps))
+    print(f"{args.reference.name}, {args.requests} requests each at {args.size}, "
+          f"{args.uplink_mbps:g} Mbit/s uplink, {args.latency:g}s server latency\n")
+    print(f"{'Reference':<12} | {'Image':>9} | {'File (KB)':>9} | {'Request (KB)':>12} | {'Build (s)':>9} | "
+          f"{'p50 (s)':>7} | {'Saved (s)':>9} | {'Mean err':>8} | {'PSNR (dB)':>9}")
+    print(f"{'-' * 12}-+-{'-' * 9}-+-{'-' * 9}-+-{'-' * 12}-+-{'-' * 9}-+-{'-' * 7}-+-{'-' * 9}-+-"
+          f"{'-' * 8}-+-{'-' * 9}")
+
+    baseline = None
+    try:
+        for name, reference, build in references:
+            seconds, request_bytes = asyncio.run(round_trips(server, reference, args))
+            p50 = statistics.median(seconds)
+            baseline = baseline if baseline is not None else p50
+            error, psnr = fidelity(original, reference)
+            with Image.open(io.BytesIO(reference)) as img:
+                dimensions = f"{img.width}x{img.height}"
+            print(f"{name:<12} | {dimensions:>9} | {len(reference) / 1024:>9.0f} | {request_bytes / 1024:>12.0f} | "
+                  f"{build:>9.2f} | {p50:>7.3f} | {baseline - p50:>9.3f} | {error:>8.2f} | {psnr:>9.1f}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("\nBuild time is paid once: style_reference.py caches the result in .image-cache/style-refs/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming ts_emitter vs. the recursive format_value emitter.
+
+Builds a synthetic brand (nine components with long multi-paragraph text and
+large strength/weakness lists, plus a deep growth system), then writes the
+module with both emitters and reports wall time and peak traced memory.
+
+Usage:
+    python scripts/benchmark_ts_emitter.py
+    python scripts/benchmark_ts_emitter.py --scale 200 --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ts_emitter import emit_module  # noqa: E402
+
+
+# ============================================================================
+# BASELINE: recursive format_value (converters before the streaming emitter)
+# ============================================================================
+
+def legacy_to_typescript(data: dict, var_name: str) -> str:
+    def format_value(v, indent=2):
+        spaces = '  ' * indent
+        if v is None:
+            return 'null'
+        elif isinstance(v, bool):
+            return 'true' if v else 'false'
+        elif isinstance(v, (int, float)):
+            return str(v)
+        elif isinstance(v, str):
+            escaped = v.replace('\\', '\\\\').replace("'", "\\'")
+            return f"'{escaped}'"
+        elif isinstance(v, list):
+            if not v:
+                return '[]'
+            items = [format_value(item, indent + 1) for item in v]
+            if all(isinstance(item, str) for item in v) and len(v) <= 3:
+                return '[' + ', '.join(items) + ']'
+            return '[\n' + ',\n'.join(f'{spaces}  {item}' for item in items) + f'\n{spaces}]'
+        elif isinstance(v, dict):
+            if not v:
+                return '{}'
+            lines = []
+            for k, val in v.items():
+                formatted = format_value(val, indent + 1)
+                lines.append(f"{spaces}  {k}: {formatted}")
+            return '{\n' + ',\n'.join(lines) + f'\n{spaces}}}'
+        else:
+            return str(v)
+
+    return f"""import {{ GDTAnalysis }} from '@/lib/types';
+
+/**
+ * {data['brand']['name']} GDT Analysis Data
+ */
+export const {var_name}Analysis: GDTAnalysis = {format_value(data, 0)};
+"""
+
+
+def legacy_emit(path: Path, data: dict) -> int:
+    ts_code = legacy_to_typescript(data, 'bench')
+    with open(path, 'w') as f:
+        f.write(ts_code)
+    return len(ts_code.encode('utf-8'))
+
+
+def streaming_emit(path: Path, data: dict, compact: bool) -> int:
+    return emit_module(path, data, 'bench', ['Bench GDT Analysis Data'], compact).size
+
+
+# ============================================================================
+# SYNTHETIC BRAND
+# ============================================================================
+
+PARAGRAPH = ("The brand's \"it just works\" reputation is real, but it isn't a reason to "
+             "choose: rivals match it on shelf and undercut it on price by 12-18%. ")
+
+
+def build_brand(scale: int) -> dict:
+    """Brand data whose text volume grows linearly with `scale`."""
+    long_text = '\n\n'.join([PARAGRAPH * 4] * scale)
+    bullets = [f"{PARAGRAPH} ({i})" for i in range(scale * 4)]
+
+    components = []
+    for section in 'abc':
+        for n in range(1, 4):
+            components.append({
+                'id': f'{section}{n}',
+                'name': 'Synthetic Component',
+                'section': section.upper(),
+                'score': 6.4,
+                'tier': 'Established',
+                'wsn': {
+                    'headline': PARAGRAPH,
+                    'subline': PARAGRAPH,
+                    'what': long_text,
+                    'evidence': '64% unaided awareness',
+                    'soWhat': long_text,
+                    'nowWhat': long_text
+                },
+                'strengths': bullets,
+                'weaknesses': bullets,
+                'competitiveContext': long_text,
+                'scoreBreakdown': {f'dimension_{i}': 5.5 for i in range(6)}
+            })
+
+    phases = [{
+        'phase': f'Phase {i}',
+        'description': long_text,
+        'outputs': [{
+            'name': f'Output {j}',
+            'score': 8,
+            'purpose': PARAGRAPH,
+            'componentsAddressed': ['A1', 'B2'],
+            'deliverables': bullets[:10]
+        } for j in range(scale)]
+    } for i in range(3)]
+
+    return {
+        'brand': {'id': 'bench', 'name': 'Bench', 'market': 'USA', 'category': 'Synthetic',
+                  'date': '2025-12-30', 'accentColor': '#E54B7B'},
+        'totalScore': 61.2,
+        'components': components,
+        'growthSystem': {'headline': PARAGRAPH, 'description': long_text, 'phases': phases,
+                         'criticalPath': 'Position → Unlock → Connect',
+                         'implementationNotes': long_text}
+    }
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def measure(fn, repeat: int):
+    """(median seconds, peak traced bytes, output bytes)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = fn()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark TypeScript module emitters')
+    parser.add_argument('--scale', type=int, default=100, help='Text volume multiplier')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    args = parser.parse_args()
+
+    data = build_brand(args.scale)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        cases = [
+            ('format_value (legacy)', lambda: legacy_emit(out / 'legacy.ts', data)),
+            ('streaming (pretty)', lambda: streaming_emit(out / 'pretty.ts', data, False)),
+            ('streaming (compact)', lambda: streaming_emit(out / 'compact.ts', data, True)),
+        ]
+
+        print(f"{'Emitter':<22} | {'Time (ms)':>9} | {'Peak mem (MB)':>13} | {'Module (MB)':>11}")
+        print(f"{'-' * 22}-+-{'-' * 9}-+-{'-' * 13}-+-{'-' * 11}")
+        for name, fn in cases:
+            seconds, peak, size = measure(fn, args.repeat)
+            print(f"{name:<22} | {seconds * 1000:>9.1f} | {peak / 1e6:>13.1f} | {size / 1e6:>11.2f}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Build responsive WebP/AVIF renditions of the site's cover and growth-systems images.
+
+Every source PNG gets content-hashed renditions at several widths in
+public/optimized/ and an entry in src/data/image-manifest.json with its
+dimensions and dominant background color. src/lib/images.ts reads the
+manifest on the server, and FallbackImage.tsx renders the result as a
+<picture> with srcset (the browser picks the smallest suitable file) and
+paints the background color before the image arrives.
+
+Sources whose bytes and encoder settings are unchanged since the last run are
+skipped; renditions replaced by a rebuild are deleted. Superseded copies
+(e.g. cultural-entry-old-copy.png) are left out of the default run, and their
+manifest entries and renditions are removed.
+
+Usage:
+  python scripts/build_image_variants.py
+  python scripts/build_image_variants.py public/zyn-cover.png
+  python scripts/build_image_variants.py --widths 384 768 --force --workers 4
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from fix_image_background import atomic_output, expand_inputs, run_files
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PUBLIC_DIR = PROJECT_ROOT / 'public'
+OUTPUT_DIR = PUBLIC_DIR / 'optimized'
+MANIFEST_PATH = PROJECT_ROOT / 'src' / 'data' / 'image-manifest.json'
+
+DEFAULT_SOURCES = [str(PUBLIC_DIR / '*-cover.png'), str(PUBLIC_DIR / 'growth-systems' / '*.png')]
+
+# Superseded copies kept beside the live images; the default run skips them
+EXCLUDED_NAMES = ['*-old-*.png', '*-old.png']
+
+# 320px growth images and 512px covers at 1x and 2x, plus full-width mobile
+DEFAULT_WIDTHS = [384, 640, 1024]
+
+# Pillow save options per format, in <source> preference order
+FORMATS = {
+    'avif': {'quality': 55, 'speed': 6},
+    'webp': {'quality': 80, 'method': 6},
+}
+
+
+# ============================================================================
+# RENDITIONS
+# ============================================================================
+
+def dominant_color(pixels):
+    """Most frequent RGB value of an (h, w, 3+) uint8 array as '#RRGGBB'."""
+    packed = ((pixels[..., 0].astype(np.uint32) << 16)
+              | (pixels[..., 1].astype(np.uint32) << 8)
+              | pixels[..., 2])
+    values, counts = np.unique(packed, return_counts=True)
+    return f"#{int(values[counts.argmax()]):06X}"
+
+
+def is_excluded(path):
+    """True for superseded copies (EXCLUDED_NAMES) the default run leaves out."""
+    return any(fnmatch.fnmatch(Path(path).name, pattern) for pattern in EXCLUDED_NAMES)
+
+
+def public_url(path):
+    """/growth-systems/zyn-growth-summary.png for public/growth-systems/zyn-growth-summary.png"""
+    return '/' + Path(path).resolve().relative_to(PUBLIC_DIR).as_posix()
+
+
+def rendition_widths(source_width, widths):
+    """Requested widths no larger than the source; the source width if none fit."""
+    fitting = sorted({w for w in widths if w <= source_width})
+    return fitting or [source_width]
+
+
+def rendition_files(entry):
+    return [PUBLIC_DIR / r['src'].lstrip('/') for renditions in entry['sources'].values() for r in renditions]
+
+
+def settings_key(widths):
+    """Short fingerprint of the widths and encoder options; a change rebuilds everything."""
+    settings = json.dumps({'widths': sorted(widths), 'formats': FORMATS}, sort_keys=True)
+    return hashlib.sha256(settings.encode('utf-8')).hexdigest()[:8]
+
+
+def build_renditions(source_path, widths, previous=None):
+    """
+    Encode one source at every width and format. Returns (manifest entry,
+    built) where built is False if the previous entry was still current.
+    """
+    data = Path(source_path).read_bytes()
+    source_hash = hashlib.sha256(data).hexdigest()[:16]
+    settings = settings_key(widths)
+    if (previous and previous.get('sourceHash') == source_hash and previous.get('settings') == settings
+            and all(f.exists() for f in rendition_files(previous))):
+        return previous, False
+
+    with Image.open(io.BytesIO(data)) as img:
+        pixels = np.asarray(img.convert('RGBA'))
+    return renditions_from_pixels(pixels, data, public_url(source_path), widths), True
+
+
+def renditions_from_pixels(pixels, data, url, widths):
+    """
+    Encode an already decoded (h, w, 4) source at every width and format and
+    return its manifest entry; `data` is the encoded source (for its hash and size).
+    """
+    height, width = pixels.shape[:2]
+    # Opaque images encode smaller without an alpha plane
+    mode = 'RGB' if pixels[..., 3].min() == 255 else 'RGBA'
+    image = Image.fromarray(pixels, 'RGBA').convert(mode)
+
+    entry = {
+        'width': width,
+        'height': height,
+        'background': dominant_color(pixels),
+        'sourceHash': hashlib.sha256(data).hexdigest()[:16],
+        'sourceBytes': len(data),
+        'settings': settings_key(widths),
+        'sources': {fmt: [] for fmt in FORMATS}
+    }
+
+    out_dir = OUTPUT_DIR / Path(url).parent.relative_to('/')
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(url).stem
+    for target_width in rendition_widths(width, widths):
+        target_height = round(height * target_width / width)
+        resized = image if target_width == width else image.resize((target_width, target_height),
+                                                                   Image.Resampling.LANCZOS)
+        for fmt, options in FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, fmt.upper(), **options)
+            encoded = buffer.getvalue()
+            digest = hashlib.sha256(encoded).hexdigest()[:10]
+            path = out_dir / f"{stem}-{target_width}.{digest}.{fmt}"
+            if not path.exists():
+                with atomic_output(path) as f:
+                    f.write(encoded)
+            entry['sources'][fmt].append({
+                'src': public_url(path),
+                'width': target_width,
+                'height': target_height,
+                'bytes': len(encoded)
+            })
+    return entry
+
+
+def build_one(source_path, widths, previous):
+    """Worker: returns the result fields of one source."""
+    entry, built = build_renditions(source_path, widths, previous)
+    return {'url': public_url(source_path), 'entry': entry, 'built': built}
+
+
+# ============================================================================
+# MANIFEST
+# ============================================================================
+
+def load_manifest(path=MANIFEST_PATH):
+    if not path.exists():
+        return {'images': {}}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    with atomic_output(path) as f:
+        f.write((json.dumps(manifest, indent=2, sort_keys=True) + '\n').encode('utf-8'))
+
+
+def previous_entry(images, path):
+    """Manifest entry for a source path, if it has one (paths outside public/ never do)."""
+    try:
+        return images.get(public_url(path))
+    except ValueError:
+        return None
+
+
+def remove_stale_files(old_entry, new_entry):
+    """Delete renditions of old_entry that new_entry (None: the source is gone) no longer lists."""
+    keep = set(rendition_files(new_entry)) if new_entry else set()
+    removed = 0
+    for path in rendition_files(old_entry):
+        if path not in keep and path.exists():
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def update_manifest(manifest, entries):
+    """Store {url: entry} in the manifest, deleting renditions the new entries replace; returns files removed."""
+    images = manifest.setdefault('images', {})
+    removed = 0
+    for url, entry in entries.items():
+        old = images.get(url)
+        if old:
+            removed += remove_stale_files(old, entry)
+        images[url] = entry
+    return removed
+
+
+def print_results_table(results):
+    width = max([len(r['url'] or r['path']) for r in results] + [4])
+    print(f"\n{'Image':<{width}} | {'PNG (KB)':>9} | {'WebP (KB)':>9} | {'AVIF (KB)':>9} | {'Saved':>6} | Background")
+    print(f"{'-' * width}-+-{'-' * 9}-+-{'-' * 9}-+-{'-' * 9}-+-{'-' * 6}-+-{'-' * 10}")
+    for r in results:
+        if r['error']:
+            print(f"{r['path']:<{width}} | failed: {r['error']}")
+            continue
+        entry = r['entry']
+        # Compare at the largest width, i.e. what a retina screen downloads
+        webp = entry['sources']['webp'][-1]['bytes']
+        avif = entry['sources']['avif'][-1]['bytes']
+        saved = 1 - min(webp, avif) / entry['sourceBytes']
+        print(f"{r['url']:<{width}} | {entry['sourceBytes'] / 1024:>9.0f} | {webp / 1024:>9.0f} | "
+              f"{avif / 1024:>9.0f} | {saved * 100:>5.0f}% | {entry['background']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build WebP/AVIF renditions and the image manifest')
+    parser.add_argument('inputs', nargs='*', metavar='PATH',
+                        help='Images, directories or quoted globs under public/ '
+                             '(default: public/*-cover.png and public/growth-systems/*.png, '
+                             'except superseded *-old-* copies)')
+    parser.add_argument('--widths', type=int, nargs='+', default=DEFAULT_WIDTHS,
+                        help=f'Rendition widths in pixels (default: {" ".join(map(str, DEFAULT_WIDTHS))})')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if a source is unchanged')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    paths = expand_inputs(args.inputs or DEFAULT_SOURCES)
+    if not args.inputs:
+        paths = [path for path in paths if not is_excluded(path)]
+    if not paths:
+        print("Error: no images matched")
+        sys.exit(1)
+
+    manifest = load_manifest()
+    images = manifest.setdefault('images', {})
+
+    print(f"Building renditions for {len(paths)} images ({', '.join(FORMATS)} at "
+          f"{', '.join(map(str, sorted(args.widths)))}px)")
+    start = time.perf_counter()
+    tasks = [(path, (args.widths, None if args.force else previous_entry(images, path))) for path in paths]
+    results = run_files(build_one, tasks, {'url': None, 'entry': None, 'built': False}, args.workers,
+                        lambda r: ("❌" if r['error'] else ("✅" if r['built'] else "⏭️ "), r['url'] or r['path']))
+
+    removed = update_manifest(manifest, {r['url']: r['entry'] for r in results if r['entry'] and r['built']})
+
+    # Default run covers every source, so entries for deleted or excluded sources can go
+    if not args.inputs:
+        for url in [u for u in images if not (PUBLIC_DIR / u.lstrip('/')).exists() or is_excluded(u)]:
+            removed += remove_stale_files(images.pop(url), None)
+
+    save_manifest(manifest)
+    print_results_table(results)
+
+    failed = sum(1 for r in results if r['error'])
+    built = sum(1 for r in results if r['built'])
+    print(f"\n📝 Manifest: {MANIFEST_PATH.relative_to(PROJECT_ROOT)} "
+          f"({built} rebuilt, {len(results) - built - failed} unchanged, {removed} stale files removed)")
+    print(f"Done in {time.perf_counter() - start:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Incremental conversion cache shared by the GDT converters.
+
+Each brand folder gets a small manifest recording content hashes of its
+inputs (summary JSON, component JSON/markdown files), the converter name and
+version, the CLI options that shape the output, and the hashes of the files
+that run wrote. A later run with identical inputs can skip the brand
+entirely, and outputs are only rewritten when their bytes actually change,
+so unchanged brands never trigger a Next.js rebuild or a Vercel deploy.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+MANIFEST_NAME = '.gdt-conversion-manifest.json'
+
+# File types in a brand folder that feed the converters
+INPUT_SUFFIXES = ('.json', '.md')
+
+
+def hash_bytes(data: bytes) -> str:
+    """SHA-256 hex digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def input_fingerprint(gdt_folder: Path, converter: str, version: str, options: dict) -> dict:
+    """Describe everything a conversion of gdt_folder depends on."""
+    with os.scandir(gdt_folder) as entries:
+        inputs = {
+            entry.name: hash_file(Path(entry.path))
+            for entry in entries
+            if entry.name.endswith(INPUT_SUFFIXES) and entry.name != MANIFEST_NAME and entry.is_file()
+        }
+    inputs = dict(sorted(inputs.items()))
+    return {
+        'converter': converter,
+        'version': version,
+        'options': options,
+        'inputs': inputs
+    }
+
+
+def load_manifest(gdt_folder: Path) -> Optional[dict]:
+    """Load the brand folder's manifest, or None if missing or unreadable."""
+    try:
+        with open(gdt_folder / MANIFEST_NAME, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def is_up_to_date(gdt_folder: Path, fingerprint: dict) -> bool:
+    """True if the last run saw the same inputs and its outputs are still intact."""
+    manifest = load_manifest(gdt_folder)
+    if not manifest or manifest.get('fingerprint') != fingerprint:
+        return False
+
+    for output, digest in manifest.get('outputs', {}).items():
+        path = Path(output)
+        if not path.exists() or hash_file(path) != digest:
+            return False
+    return True
+
+
+def save_manifest(gdt_folder: Path, fingerprint: dict, outputs: Dict[str, str],
+                  details: Optional[dict] = None) -> None:
+    """Record the fingerprint, output hashes and optional run details for the next run."""
+    manifest = {
+        'fingerprint': fingerprint,
+        'outputs': outputs,
+        'details': details or {}
+    }
+    write_if_changed(gdt_folder / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path only if the bytes differ. Returns True if written."""
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing and memory instrumentation for the GDT converters (--profile).
+
+The converters mark their stages with profile_stage(); the calls cost nothing
+unless a ConversionProfiler is active:
+
+    profiler = ConversionProfiler()
+    with profiler.active():
+        with profile_stage('load', 'a1'):
+            ...
+    profiler.summary()          # plain dict, safe to return from a worker process
+    profiler.dump_cprofile(path)
+
+Stages nest: time spent in an inner stage is charged to the inner stage only
+(exclusive time), and an inner stage with no component inherits the outer
+stage's component. Peak memory is the tracemalloc peak above the memory in
+use when the stage started.
+"""
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Stage names, in report order
+STAGES = ['discover', 'load', 'parse', 'derive WSN', 'transform growth', 'emit', 'write']
+
+_active: Optional['ConversionProfiler'] = None
+_disabled = nullcontext()
+
+
+def profiling_enabled() -> bool:
+    """True while a ConversionProfiler is active (callers may trade speed for attribution)."""
+    return _active is not None
+
+
+def profile_stage(stage: str, component: Optional[str] = None):
+    """Context manager that records `stage` on the active profiler, if any."""
+    if _active is None:
+        return _disabled
+    return _active.stage(stage, component)
+
+
+class _Frame:
+    __slots__ = ('stage', 'component', 'resumed', 'seconds', 'base', 'peak')
+
+    def __init__(self, stage: str, component: Optional[str], now: float, base: int):
+        self.stage = stage
+        self.component = component
+        self.resumed = now
+        self.seconds = 0.0
+        self.base = base
+        self.peak = base
+
+
+class ConversionProfiler:
+    """Collects wall time and tracemalloc peaks per stage and per component."""
+
+    def __init__(self):
+        self.stages: Dict[str, dict] = {}
+        self.components: Dict[str, dict] = {}
+        self.total_seconds = 0.0
+        self.total_peak = 0
+        self._started: Optional[float] = None
+        self._base = 0
+        self._peak_seen = 0  # absolute traced peak, kept across reset_peak() calls
+        self._stack: List[_Frame] = []
+        self._cprofile = cProfile.Profile()
+
+    @contextmanager
+    def active(self):
+        """Profile everything run inside the block (tracemalloc and cProfile on)."""
+        global _active
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._base = self._peak_seen = tracemalloc.get_traced_memory()[0]
+        previous, _active = _active, self
+        self._started = time.perf_counter()
+        self._cprofile.enable()
+        try:
+            yield self
+        finally:
+            self._cprofile.disable()
+            self.total_seconds, self.total_peak = self._totals()
+            self._started = None
+            _active = previous
+            if started_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, stage: str, component: Optional[str] = None):
+        now = time.perf_counter()
+        current, peak = tracemalloc.get_traced_memory()
+        self._peak_seen = max(self._peak_seen, peak)
+        if self._stack:
+            outer = self._stack[-1]
+            outer.seconds += now - outer.resumed
+            outer.peak = max(outer.peak, peak)
+            component = component or outer.component
+        tracemalloc.reset_peak()
+        frame = _Frame(stage, component, now, current)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            frame.seconds += now - frame.resumed
+            frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+            self._peak_seen = max(self._peak_seen, frame.peak)
+            self._stack.pop()
+            if self._stack:
+                outer = self._stack[-1]
+                outer.resumed = now
+                outer.peak = max(outer.peak, frame.peak)
+            self._record(frame)
+
+    def _totals(self):
+        """(seconds, peak bytes) including the block still running, if any."""
+        if self._started is None:
+            return self.total_seconds, self.total_peak
+        seconds = self.total_seconds + time.perf_counter() - self._started
+        peak = max(self._peak_seen, tracemalloc.get_traced_memory()[1])
+        return seconds, max(self.total_peak, peak - self._base)
+
+    def _record(self, frame: _Frame) -> None:
+        peak = max(frame.peak - frame.base, 0)
+        stage = self.stages.setdefault(frame.stage, {'calls': 0, 'seconds': 0.0, 'peak_bytes': 0})
+        stage['calls'] += 1
+        stage['seconds'] += frame.seconds
+        stage['peak_bytes'] = max(stage['peak_bytes'], peak)
+
+        if frame.component:
+            comp = self.components.setdefault(frame.component, {'seconds': 0.0, 'peak_bytes': 0,
+                                                                'stages': {}})
+            comp['seconds'] += frame.seconds
+            comp['peak_bytes'] = max(comp['peak_bytes'], peak)
+            comp['stages'][frame.stage] = comp['stages'].get(frame.stage, 0.0) + frame.seconds
+
+    def summary(self) -> dict:
+        """Plain-dict snapshot of everything recorded so far."""
+        order = {name: i for i, name in enumerate(STAGES)}
+        total_seconds, total_peak = self._totals()
+        return {
+            'total_seconds': total_seconds,
+            'total_peak_bytes': total_peak,
+            'stages': dict(sorted(self.stages.items(), key=lambda kv: order.get(kv[0], len(order)))),
+            'components': dict(sorted(self.components.items()))
+        }
+
+    def dump_cprofile(self, path: Path) -> None:
+        """Write the cProfile stats (open with `python -m pstats` or snakeviz)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._cprofile.dump_stats(str(path))
+
+
+def profile_path_for(report_path: Path) -> Path:
+    """cProfile dump beside a conversion report: zyn-conversion-report.md → zyn-conversion-profile.prof"""
+    return report_path.with_name(report_path.stem.replace('-conversion-report', '') + '-conversion-profile.prof')
+
+
+def generate_profile_markdown(profile: dict) -> List[str]:
+    """'## Profile' report section from a ConversionProfiler.summary()."""
+    lines = [
+        "",
+        "## Profile",
+        "",
+        f"**Total:** {profile['total_seconds'] * 1000:.1f} ms, "
+        f"peak {profile['total_peak_bytes'] / 1e6:.2f} MB traced",
+        "",
+        "Timings are taken with tracemalloc and cProfile running, so they are "
+        "inflated; compare them with each other, not with unprofiled runs. "
+        "The write stage does not include writing this report.",
+        "",
+        "| Stage | Calls | Wall (ms) | Peak (MB) |",
+        "|-------|-------|-----------|-----------|"
+    ]
+    for name, stage in profile['stages'].items():
+        lines.append(f"| {name} | {stage['calls']} | {stage['seconds'] * 1000:.2f} | "
+                     f"{stage['peak_bytes'] / 1e6:.2f} |")
+
+    if profile['components']:
+        stage_names = [name for name in profile['stages']
+                       if any(name in c['stages'] for c in profile['components'].values())]
+        lines.extend([
+            "",
+            "### Per Component",
+            "",
+            "| ID | Wall (ms) | Peak (MB) | " + " | ".join(stage_names) + " |",
+            "|----|-----------|-----------|" + "|".join('-' * (len(n) + 2) for n in stage_names) + "|"
+        ])
+        for comp_id, comp in profile['components'].items():
+            per_stage = " | ".join(f"{comp['stages'].get(name, 0.0) * 1000:.2f}" for name in stage_names)
+            lines.append(f"| {comp_id.upper()} | {comp['seconds'] * 1000:.2f} | "
+                         f"{comp['peak_bytes'] / 1e6:.2f} | {per_stage} |")
+
+    lines.append("")
+    return lines
+
+
+def print_profile_summary(profile: dict) -> None:
+    """Console summary: time per stage and the slowest components."""
+    print(f"\n⏱️  Profile ({profile['total_seconds'] * 1000:.1f} ms, "
+          f"peak {profile['total_peak_bytes'] / 1e6:.2f} MB traced):")
+    for name, stage in profile['stages'].items():
+        print(f"   {name:<17} {stage['seconds'] * 1000:>9.2f} ms  {stage['peak_bytes'] / 1e6:>7.2f} MB")
+
+    slowest = sorted(profile['components'].items(), key=lambda kv: kv[1]['seconds'], reverse=True)[:3]
+    if slowest:
+        print("   Slowest components: " + ", ".join(
+            f"{comp_id.upper()} {comp['seconds'] * 1000:.2f} ms" for comp_id, comp in slowest))
@@ -6,7 +6,7 @@ Converts GDT analysis outputs (JSON + Markdown) into the TypeScript data structu
 expected by the gdt-website Next.js application.
 
 Usage:
-    python convert-gdt-output.py <gdt-output-folder> [--accent-color "#HEXCOLOR"]
+    python convert-gdt-output.py <gdt-output-folder> [--accent-color "#HEXCOLOR"] [--compact]
 
 Example:
     python convert-gdt-output.py ../outputs/espolon-tequila-usa-2025-12-22 --accent-color "#E54B7B"
@@ -19,6 +19,8 @@ import os
 from pathlib import Path
 from typing import Optional
 
+from ts_emitter import DEFAULT_BUDGET_KB, emit_module, render_typescript
+
 
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
@@ -334,48 +336,17 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> d
     }
 
 
-def to_typescript(data: dict, var_name: str) -> str:
-    """Convert Python dict to TypeScript source code."""
-
-    def format_value(v, indent=2):
-        spaces = '  ' * indent
-        if v is None:
-            return 'null'
-        elif isinstance(v, bool):
-            return 'true' if v else 'false'
-        elif isinstance(v, (int, float)):
-            return str(v)
-        elif isinstance(v, str):
-            # Escape quotes and backslashes
-            escaped = v.replace('\\', '\\\\').replace("'", "\\'")
-            return f"'{escaped}'"
-        elif isinstance(v, list):
-            if not v:
-                return '[]'
-            items = [format_value(item, indent + 1) for item in v]
-            if all(isinstance(item, str) for item in v) and len(v) <= 3:
-                return '[' + ', '.join(items) + ']'
-            return '[\n' + ',\n'.join(f'{spaces}  {item}' for item in items) + f'\n{spaces}]'
-        elif isinstance(v, dict):
-            if not v:
-                return '{}'
-            lines = []
-            for k, val in v.items():
-                formatted = format_value(val, indent + 1)
-                lines.append(f"{spaces}  {k}: {formatted}")
-            return '{\n' + ',\n'.join(lines) + f'\n{spaces}}}'
-        else:
-            return str(v)
+def typescript_header(data: dict) -> list:
+    """Doc-comment lines for the generated module."""
+    return [
+        f"{data['brand']['name']} GDT Analysis Data",
+        f"Source: GDT output converted on {data['brand']['date']}"
+    ]
 
-    ts_content = f"""import {{ GDTAnalysis }} from '@/lib/types';
 
-/**
- * {data['brand']['name']} GDT Analysis Data
- * Source: GDT output converted on {data['brand']['date']}
- */
-export const {var_name}Analysis: GDTAnalysis = {format_value(data, 0)};
-"""
-    return ts_content
+def to_typescript(data: dict, var_name: str, compact: bool = False) -> str:
+    """Convert Python dict to TypeScript source code."""
+    return render_typescript(data, var_name, typescript_header(data), compact)
 
 
 def main():
@@ -385,6 +356,9 @@ def main():
                         help='Brand accent color (hex). Edit in output file after conversion.')
     parser.add_argument('--output', type=str, help='Output TypeScript file path')
     parser.add_argument('--var-name', type=str, help='Variable name for export (default: derived from brand)')
+    parser.add_argument('--compact', action='store_true', help='Emit the module without whitespace')
+    parser.add_argument('--size-budget-kb', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f'Warn when the module exceeds this size (default: {DEFAULT_BUDGET_KB})')
 
     args = parser.parse_args()
 
@@ -397,19 +371,19 @@ def main():
         data = convert_gdt_to_website(gdt_folder, args.accent_color)
 
         var_name = args.var_name or slugify(data['brand']['name']).replace('-', '')
-        ts_code = to_typescript(data, var_name)
 
         if args.output:
             output_path = Path(args.output)
         else:
             output_path = Path(f"src/data/{slugify(data['brand']['name'])}.ts")
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            f.write(ts_code)
+        emitted = emit_module(output_path, data, var_name, typescript_header(data),
+                              args.compact, args.size_budget_kb)
 
         print(f"Converted: {gdt_folder}")
-        print(f"Output: {output_path}")
+        print(f"Output: {output_path} ({emitted.size / 1024:.0f} KB){'' if emitted.changed else ' (unchanged)'}")
+        if emitted.over_budget:
+            print(f"Warning: {emitted.budget_warning(args.size_budget_kb)}")
         print(f"Brand: {data['brand']['name']}")
         print(f"Total Score: {data['totalScore']}")
         print(f"Components: {len(data['components'])}")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Directory watchers for the converters' --watch mode.
+
+Watches an outputs root and every brand folder directly under it, and reports
+the paths of files that changed. Uses Linux inotify (through ctypes, no extra
+packages) and falls back to polling directory snapshots where inotify is not
+available or does not see remote writes (e.g. network shares).
+
+    watcher = create_watcher(Path('../outputs'))
+    for changed in watch_changes(watcher, debounce=0.2):
+        ...  # set of changed file paths, grouped after a quiet period
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+# inotify event masks (<sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+class InotifyWatcher:
+    """Watch a root and its immediate subfolders with Linux inotify."""
+
+    def __init__(self, root: Path):
+        libc_name = ctypes.util.find_library('c')
+        if not sys.platform.startswith('linux') or not libc_name:
+            raise OSError("inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.root = root
+        self._paths: Dict[int, Path] = {}
+        self._add_watch(root)
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith('.'):
+                    self._add_watch(Path(entry.path))
+
+    def _add_watch(self, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {path}")
+        self._paths[wd] = path
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """Block up to `timeout` seconds (None = forever); return changed paths."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            parent = self._paths.get(wd)
+            if parent is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._paths[wd]
+                continue
+            if mask & IN_DELETE_SELF:
+                changed.add(parent)
+                continue
+
+            path = parent / os.fsdecode(name)
+            # A new brand folder under the root: start watching it too
+            if mask & IN_ISDIR and parent == self.root and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_watch(path)
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Watch a root and its immediate subfolders by comparing scandir snapshots."""
+
+    def __init__(self, root: Path, interval: float = 0.25):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        with os.scandir(self.root) as folders:
+            for folder in folders:
+                if not folder.is_dir() or folder.name.startswith('.'):
+                    continue
+                snapshot[Path(folder.path)] = (0, 0)
+                with os.scandir(folder.path) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """Poll until something changes or `timeout` seconds pass (None = forever)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                path for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(remaining, 0))
+
+    def close(self) -> None:
+        pass
+
+
+def create_watcher(root: Path, poll: bool = False, interval: float = 0.25):
+    """inotify watcher when possible, otherwise a polling watcher."""
+    if not poll:
+        try:
+            return InotifyWatcher(root)
+        except OSError:
+            pass
+    return PollingWatcher(root, interval)
+
+
+def watch_changes(watcher, debounce: float = 0.2) -> Iterator[Set[Path]]:
+    """
+    Yield sets of changed paths. After the first change, keep collecting until
+    `debounce` seconds pass without another one, so a multi-file save is one batch.
+    """
+    while True:
+        changed = watcher.wait(None)
+        while True:
+            more = watcher.wait(debounce)
+            if not more:
+                break
+            changed |= more
+        yield changed
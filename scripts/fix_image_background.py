@@ -3,14 +3,38 @@
 Fix image background color to match GDT website exactly.
 Replaces dark pixels with the exact hex color for seamless blending.
 
+The threshold test and replacement run as whole-array numpy masks, and one
+decode can produce several background variants (e.g. page and secondary).
+Results are written to a temp file and renamed into place, so a crash never
+leaves a half-written asset. Large PNGs (print and retina masters) are read,
+fixed and written in bands of rows, so memory stays flat however big the image
+is. Bands are only chosen automatically while png_strips.matches_pillow()
+confirms the output is byte-identical to processing the image whole. The
+source's ICC profile, gamma/chromaticity and text chunks are written to every
+output, so color-managed renders keep their colors.
+
 Usage:
   python scripts/fix_image_background.py path/to/image.png
   python scripts/fix_image_background.py path/to/image.png --target-color "#0C0C0E"
+  python scripts/fix_image_background.py path/to/image.png --variants page secondary
+  python scripts/fix_image_background.py public "public/growth-systems/*.png" --workers 4
+  python scripts/fix_image_background.py master-8k.png --strip-rows 32
 """
 
+import argparse
+import glob
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+import numpy as np
 from PIL import Image
 
+from png_strips import PngStripReader, PngStripWriter, can_stream, matches_pillow, metadata_chunks, save_options
+
 # Default target colors
 COLORS = {
     "page": "#0C0C0E",      # gdt-bg-primary - main page background
@@ -18,12 +42,137 @@ COLORS = {
     "card": "#18181C",       # gdt-bg-card - card backgrounds
 }
 
+DEFAULT_THRESHOLD = 35
+
+# PNGs larger than this are processed in bands of about STRIP_PIXELS pixels
+LARGE_IMAGE_PIXELS = 2048 * 2048
+STRIP_PIXELS = 256 * 1024
+
+
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB tuple."""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-def fix_background(image_path, target_color="#141418", threshold=35):
+
+def load_rgba(image_path):
+    """Decode an image into an (height, width, 4) uint8 RGBA array."""
+    with Image.open(image_path) as img:
+        return np.asarray(img.convert('RGBA'))
+
+
+def dark_mask(pixels, threshold=DEFAULT_THRESHOLD):
+    """True where every RGB channel is below threshold (alpha is ignored)."""
+    return (pixels[..., 0] < threshold) & (pixels[..., 1] < threshold) & (pixels[..., 2] < threshold)
+
+
+def _packed(rgba_bytes):
+    """Four RGBA bytes as one native-endian uint32, matching a uint32 view of the pixels."""
+    return np.frombuffer(bytes(rgba_bytes), dtype=np.uint32)[0]
+
+
+ALPHA_BITS = _packed((0, 0, 0, 255))
+
+
+def apply_background(pixels, mask, target_rgb):
+    """Copy of pixels with masked RGB set to target_rgb; alpha is kept."""
+    # Treat each RGBA pixel as one uint32 so the replacement is a single select
+    words = np.ascontiguousarray(pixels).view(np.uint32)[..., 0]
+    target = _packed((*target_rgb, 0))
+    replaced = np.where(mask, (words & ALPHA_BITS) | target, words)
+    return replaced.view(np.uint8).reshape(pixels.shape)
+
+
+@contextmanager
+def atomic_output(output_path):
+    """Binary file for output_path, written beside it as a temp file and renamed into place on success."""
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def save_png_atomic(pixels, output_path, metadata=()):
+    """
+    Write an RGBA array as PNG to a temp file beside output_path, then rename it
+    into place. metadata: the source's png_strips.metadata_chunks(), to keep its
+    ICC profile and text.
+    """
+    with atomic_output(output_path) as f:
+        Image.fromarray(pixels, 'RGBA').save(f, 'PNG', **save_options(metadata))
+
+
+def strip_rows_for(image_path, strip_rows=None):
+    """
+    Rows per band for image_path, or 0 to process it whole. strip_rows=None
+    bands large PNGs only, STRIP_PIXELS at a time, and only if the strip writer
+    still matches the installed Pillow; 0 forces the whole-image path.
+    """
+    if strip_rows == 0 or not can_stream(image_path):
+        return 0
+    if strip_rows:
+        return strip_rows
+    if not matches_pillow():
+        return 0
+    with Image.open(image_path) as img:
+        width, height = img.size
+    return max(1, STRIP_PIXELS // width) if width * height > LARGE_IMAGE_PIXELS else 0
+
+
+def fix_image_strips(image_path, outputs, threshold=DEFAULT_THRESHOLD, rows=64, metadata=()):
+    """fix_image() one band of rows at a time; peak memory depends on the band size only."""
+    changed_count = total_pixels = 0
+    with ExitStack() as stack:
+        files = [stack.enter_context(atomic_output(path)) for path, _ in outputs]
+        # Entered last so the source is closed before any output replaces it
+        reader = stack.enter_context(PngStripReader(image_path))
+        writers = [(PngStripWriter(f, reader.width, reader.height, metadata), hex_to_rgb(target_color))
+                   for f, (_, target_color) in zip(files, outputs)]
+        for band in reader.iter_rgba(rows):
+            mask = dark_mask(band, threshold)
+            changed_count += int(mask.sum())
+            total_pixels += mask.size
+            for writer, target_rgb in writers:
+                writer.write(apply_background(band, mask, target_rgb))
+        for writer, _ in writers:
+            writer.close()
+    return changed_count, total_pixels
+
+
+def fix_image(image_path, outputs, threshold=DEFAULT_THRESHOLD, strip_rows=None):
+    """
+    Decode once, mask once, and write one fixed copy per (output_path, target_color).
+    Returns (changed pixels, total pixels).
+    """
+    metadata = metadata_chunks(image_path)
+    rows = strip_rows_for(image_path, strip_rows)
+    if rows:
+        return fix_image_strips(image_path, outputs, threshold, rows, metadata)
+
+    pixels = load_rgba(image_path)
+    mask = dark_mask(pixels, threshold)
+    for output_path, target_color in outputs:
+        save_png_atomic(apply_background(pixels, mask, hex_to_rgb(target_color)), output_path, metadata)
+    return int(mask.sum()), mask.size
+
+
+def default_target(image_path):
+    """Cover images blend into the page background, everything else into the secondary one."""
+    return COLORS["page"] if "cover" in str(image_path).lower() else COLORS["secondary"]
+
+
+def variant_path(image_path, name):
+    """Output path for a named variant: zyn-cover.png → zyn-cover-page.png"""
+    path = Path(image_path)
+    return path.with_name(f"{path.stem}-{name}.png")
+
+
+def fix_background(image_path, target_color="#141418", threshold=DEFAULT_THRESHOLD, strip_rows=None):
     """
     Replace dark pixels with exact target color for seamless blending.
 
@@ -31,6 +180,7 @@ def fix_background(image_path, target_color="#141418", threshold=35):
         image_path: Path to the image file
         target_color: Hex color to replace dark pixels with
         threshold: Maximum RGB value to consider as "dark" (default 35)
+        strip_rows: Rows per band (None: bands for large PNGs only, 0: whole image)
     """
     print(f"Processing: {image_path}")
     print(f"Target color: {target_color}")
@@ -39,58 +189,184 @@ def fix_background(image_path, target_color="#141418", threshold=35):
     target_rgb = hex_to_rgb(target_color)
     print(f"Target RGB: {target_rgb}")
 
-    img = Image.open(image_path)
-    img = img.convert('RGBA')
-    pixels = img.load()
-
-    width, height = img.size
-    changed_count = 0
-
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-
-            # If pixel is dark (all channels below threshold), replace with target
-            if r < threshold and g < threshold and b < threshold:
-                pixels[x, y] = (target_rgb[0], target_rgb[1], target_rgb[2], a)
-                changed_count += 1
-
     # Save back to original path
-    img.save(image_path, 'PNG')
+    changed_count, total_pixels = fix_image(image_path, [(image_path, target_color)], threshold, strip_rows)
 
-    total_pixels = width * height
     percent_changed = (changed_count / total_pixels) * 100
 
     print(f"Changed {changed_count:,} pixels ({percent_changed:.1f}%)")
     print(f"Saved: {image_path}")
     return True
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python fix_image_background.py <image_path> [--target-color <hex>]")
-        print("\nColors:")
-        for name, color in COLORS.items():
-            print(f"  {name}: {color}")
-        print(f"\nDefault target: {COLORS['secondary']} (for growth summary images)")
-        sys.exit(1)
 
-    image_path = sys.argv[1]
+def fix_background_variants(image_path, names=("page", "secondary"), threshold=DEFAULT_THRESHOLD,
+                            strip_rows=None):
+    """
+    Decode once, compute the dark mask once, and write one image per named
+    COLORS entry beside the original (the original is left untouched).
+
+    Returns {name: output path}.
+    """
+    print(f"Processing: {image_path}")
+    print(f"Variants: {', '.join(f'{name} ({COLORS[name]})' for name in names)}")
+    print(f"Threshold: RGB < {threshold}")
+
+    outputs = {name: variant_path(image_path, name) for name in names}
+    changed_count, total_pixels = fix_image(
+        image_path, [(path, COLORS[name]) for name, path in outputs.items()], threshold, strip_rows)
+    print(f"Changed {changed_count:,} pixels ({changed_count / total_pixels * 100:.1f}%) per variant")
+
+    for path in outputs.values():
+        print(f"Saved: {path}")
+    return outputs
+
+
+# ============================================================================
+# BATCH MODE
+# ============================================================================
+
+IMAGE_SUFFIXES = ('.png',)
+
+
+def expand_inputs(patterns):
+    """Files, directories (their *.png) and glob patterns → sorted unique image paths."""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            with os.scandir(pattern) as entries:
+                paths.update(Path(e.path) for e in entries
+                             if e.is_file() and e.name.lower().endswith(IMAGE_SUFFIXES))
+        elif glob.has_magic(pattern):
+            paths.update(Path(p) for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+        else:
+            paths.add(Path(pattern))
+    return sorted(paths)
+
+
+def _batch_row(worker, path, args, defaults):
+    """Pool task: one result row for worker(path, *args). Never raises."""
+    start = time.perf_counter()
+    row = {'path': str(path), **defaults, 'error': None}
+    try:
+        row.update(worker(path, *args))
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    row['seconds'] = time.perf_counter() - start
+    return row
+
+
+def _default_progress(row):
+    return "❌" if row['error'] else "✅", row['path']
+
+
+def run_files(worker, tasks, defaults=None, workers=None, progress=_default_progress):
+    """
+    Run worker(path, *args) for every (path, args) in tasks on a process pool.
+
+    The worker returns a dict of result fields (it may set 'error' itself for
+    failures that are not exceptions); each becomes a row of `defaults`, the
+    path, 'error' (the exception, if one was raised) and 'seconds'. A line is
+    printed as each file finishes (progress(row) gives its status and name).
+    Returns the rows sorted by path.
+    """
+    defaults = defaults or {}
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_batch_row, worker, path, tuple(args), defaults) for path, args in tasks]
+        for future in as_completed(futures):
+            row = future.result()
+            status, name = progress(row)
+            print(f"   {status} {name} ({row['seconds']:.2f}s)")
+            results.append(row)
+    return sorted(results, key=lambda r: r['path'])
+
+
+def fix_file(image_path, target_color=None, threshold=DEFAULT_THRESHOLD, variants=None, strip_rows=None):
+    """Fix one image in a batch worker; returns its result fields."""
+    target_color = target_color or default_target(image_path)
+    if variants:
+        outputs = [(variant_path(image_path, name), COLORS[name]) for name in variants]
+    else:
+        outputs = [(image_path, target_color)]
+    changed, total = fix_image(image_path, outputs, threshold, strip_rows)
+    return {'target': ', '.join(variants) if variants else target_color, 'changed': changed, 'total': total}
 
-    # Parse optional target color
-    target_color = COLORS["secondary"]  # Default for growth summary images
 
-    if "--target-color" in sys.argv:
-        idx = sys.argv.index("--target-color")
-        if idx + 1 < len(sys.argv):
-            target_color = sys.argv[idx + 1]
+def run_batch(paths, target_color=None, threshold=DEFAULT_THRESHOLD, variants=None, workers=None,
+              strip_rows=None):
+    """Fix every image on a process pool. Returns result rows sorted by path."""
+    return run_files(fix_file, [(path, (target_color, threshold, variants, strip_rows)) for path in paths],
+                     {'target': '', 'changed': 0, 'total': 0}, workers)
 
-    # Detect if this is likely a page bg vs secondary bg image
-    if "cover" in image_path.lower():
-        target_color = COLORS["page"]  # Cover images use page background
-        print("Detected cover image - using page background color")
+
+def print_results_table(results):
+    width = max([len(r['path']) for r in results] + [4])
+    print(f"\n{'File':<{width}} | {'Target':<17} | {'Changed px':>11} | {'Changed':>7}")
+    print(f"{'-' * width}-+-{'-' * 17}-+-{'-' * 11}-+-{'-' * 7}")
+    for r in results:
+        if r['error']:
+            print(f"{r['path']:<{width}} | {'-':<17} | {'-':>11} | {'failed':>7}  {r['error']}")
+        else:
+            percent = r['changed'] / r['total'] * 100 if r['total'] else 0.0
+            print(f"{r['path']:<{width}} | {r['target']:<17} | {r['changed']:>11,} | {percent:>6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Replace dark background pixels with the exact GDT website color',
+        epilog="Colors: " + ", ".join(f"{name} {color}" for name, color in COLORS.items())
+               + f". Default target: {COLORS['secondary']} (growth summary images); "
+                 f"files with 'cover' in the name default to {COLORS['page']}."
+    )
+    parser.add_argument('inputs', nargs='+', metavar='PATH',
+                        help='Image file(s) to fix in place, directories of PNGs, or quoted globs')
+    parser.add_argument('--target-color', help='Hex color to replace dark pixels with')
+    parser.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD,
+                        help=f'Channels below this value count as dark (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--variants', nargs='+', choices=list(COLORS), metavar='NAME',
+                        help='Write one [name]-<variant>.png per color from a single decode '
+                             '(e.g. --variants page secondary) instead of fixing in place')
+    parser.add_argument('--workers', type=int, help='Worker processes for batch mode (default: CPU count)')
+    parser.add_argument('--strip-rows', type=int, metavar='N',
+                        help=f'Process PNGs in bands of N rows to bound memory (default: bands of '
+                             f'~{STRIP_PIXELS:,} pixels for images over {LARGE_IMAGE_PIXELS:,} pixels; '
+                             f'0 = always whole image)')
+    args = parser.parse_args()
+
+    single = len(args.inputs) == 1 and os.path.isfile(args.inputs[0])
 
     try:
-        fix_background(image_path, target_color)
+        if not single:
+            paths = expand_inputs(args.inputs)
+            if not paths:
+                print(f"Error: no images matched {' '.join(args.inputs)}")
+                sys.exit(1)
+
+            print(f"Fixing {len(paths)} images (threshold RGB < {args.threshold})")
+            start = time.perf_counter()
+            results = run_batch(paths, args.target_color, args.threshold, args.variants, args.workers,
+                                args.strip_rows)
+            print_results_table(results)
+
+            failed = sum(1 for r in results if r['error'])
+            print(f"\nDone! {len(results) - failed}/{len(results)} images fixed "
+                  f"in {time.perf_counter() - start:.2f}s")
+            if failed:
+                sys.exit(1)
+            return
+
+        image_path = args.inputs[0]
+        if args.variants:
+            fix_background_variants(image_path, args.variants, args.threshold, args.strip_rows)
+        else:
+            target_color = args.target_color or COLORS["secondary"]  # Default for growth summary images
+
+            # Detect if this is likely a page bg vs secondary bg image
+            if not args.target_color and "cover" in image_path.lower():
+                target_color = COLORS["page"]  # Cover images use page background
+                print("Detected cover image - using page background color")
+
+            fix_background(image_path, target_color, args.threshold, args.strip_rows)
         print("\nDone! Image background now matches GDT website exactly.")
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,12 @@
+"""
+Converter benchmark suite.
+
+Generates synthetic GDT output folders (1 to 10,000 brands, configurable text
+length) and times the v1/v2/v3 converters, markdown parsers, TypeScript
+emitters and report generators, appending results to a JSON Lines history.
+
+    python scripts/gdt_bench --brands 1 100 --words 60
+"""
+
+from gdt_bench.corpus import generate_corpus
+from gdt_bench.suite import CASES, run_suite
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Run the converter benchmark suite.
+
+Usage:
+    python scripts/gdt_bench
+    python scripts/gdt_bench --brands 1 100 1000 --words 120 --repeat 5
+    python scripts/gdt_bench --brands 10000 --corpus-dir /tmp/gdt-corpus   # reuse between runs
+    python scripts/gdt_bench --fail-on-regression                          # exit 1 on a slowdown
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gdt_bench.corpus import generate_corpus  # noqa: E402
+from gdt_bench.suite import (  # noqa: E402
+    DEFAULT_HISTORY,
+    DEFAULT_REGRESSION_THRESHOLD,
+    append_history,
+    build_record,
+    compare,
+    load_history,
+    previous_run,
+    run_suite,
+)
+
+MAX_BRANDS = 10_000
+
+
+def print_results(corpus: dict, rows: list) -> None:
+    print(f"\n📊 {corpus['brands']} brand(s), {corpus['words']} words per text field")
+    print(f"{'Case':<30} | {'Total (s)':>9} | {'Per brand (ms)':>14} | {'vs last':>8}")
+    print(f"{'-' * 30}-+-{'-' * 9}-+-{'-' * 14}-+-{'-' * 8}")
+    for row in rows:
+        change = '—' if row['change'] is None else f"{row['change'] * 100:+.1f}%"
+        flag = '  ⚠️ regression' if row['regression'] else ''
+        print(f"{row['case']:<30} | {row['seconds']:>9.3f} | {row['per_brand_ms']:>14.3f} | "
+              f"{change:>8}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the GDT converters on a synthetic corpus')
+    parser.add_argument('--brands', type=int, nargs='+', default=[1, 10, 100],
+                        help=f'Brand counts to benchmark (1-{MAX_BRANDS})')
+    parser.add_argument('--words', type=int, default=60, help='Words per long text field')
+    parser.add_argument('--seed', type=int, default=7, help='Corpus random seed')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus per run')
+    parser.add_argument('--corpus-dir', type=str,
+                        help='Keep the generated corpus here and reuse it (default: temp dir)')
+    parser.add_argument('--history', type=str, default=str(DEFAULT_HISTORY),
+                        help='JSON Lines history file')
+    parser.add_argument('--no-history', action='store_true', help='Do not append to the history')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help='Slowdown fraction that counts as a regression (default: 0.10)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Exit 1 if any case regressed against the previous run')
+    args = parser.parse_args()
+
+    for brands in args.brands:
+        if not 1 <= brands <= MAX_BRANDS:
+            print(f"❌ Error: --brands must be between 1 and {MAX_BRANDS}, got {brands}")
+            return 1
+
+    history_path = Path(args.history)
+    history = load_history(history_path)
+    regressed = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(args.corpus_dir) if args.corpus_dir else Path(tmp)
+
+        for brands in args.brands:
+            corpus = {'brands': brands, 'words': args.words, 'seed': args.seed}
+            root = base / f"brands-{brands}-words-{args.words}-seed-{args.seed}"
+
+            print(f"🔄 Preparing corpus: {root}")
+            folders = generate_corpus(root, brands, args.words, args.seed)
+
+            results = run_suite(folders, args.repeat)
+            rows = compare(results, previous_run(history, corpus), args.threshold)
+            print_results(corpus, rows)
+            regressed = regressed or any(row['regression'] for row in rows)
+
+            if not args.no_history:
+                record = build_record(corpus, args.repeat, results)
+                append_history(history_path, record)
+                history.append(record)
+
+    if not args.no_history:
+        print(f"\n📝 History: {history_path}")
+
+    if regressed and args.fail_on_regression:
+        print("❌ Regression against the previous run")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
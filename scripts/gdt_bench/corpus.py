@@ -0,0 +1,299 @@
+"""
+Synthetic GDT output folders for benchmarking the converters.
+
+Each brand folder is shaped like outputs/zyn-usa-2025-12-30: a
+gdt-summary-output.json plus, for all nine components, a JSON output file
+(finding / rating / metadata, using the fields COMPONENT_MAPPINGS reads) and
+a markdown file in the layout the v1/v2 parsers expect.
+
+    folders = generate_corpus(Path('/tmp/gdt-corpus'), brands=100, words=60)
+"""
+
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List
+
+from gdt_converter_v2 import COMPONENT_MARKDOWN_FILES
+from gdt_converter_v3 import COMPONENT_MAPPINGS, COMPONENT_NAMES, SUMMARY_FILENAME
+
+# Marker written at the corpus root so a --corpus-dir can be reused
+CORPUS_MARKER = '.gdt-bench-corpus.json'
+
+# JSON output names as the GDT agents write them (zyn-usa-2025-12-30)
+COMPONENT_JSON_FILES = {
+    'a1': 'a1-brand-positioning.json',
+    'a2': 'a2-pricing-power.json',
+    'a3': 'a3-business-growth.json',
+    'b1': 'b1-emotional-connection.json',
+    'b2': 'b2-cultural-relevance.json',
+    'b3': 'b3-experience-excellence.json',
+    'c1': 'c1-brand-distinctiveness.json',
+    'c2': 'c2-brand-innovation.json',
+    'c3': 'c3-market-disruption.json'
+}
+
+SECTION_NAMES = {
+    'A': 'Brand & Business Alignment',
+    'B': 'Consumer Connection',
+    'C': 'Market Momentum'
+}
+
+TIERS = ['Emerging', 'Developing', 'Established', 'Strong', 'Leading']
+
+WORDS = (
+    'brand category consumers growth premium share awareness loyalty pricing '
+    'distribution retail digital social cultural relevance heritage innovation '
+    'competitors challenger momentum trial repeat conversion margin portfolio '
+    'flavor format occasion audience creators community reliability discretion '
+    'positioning distinctive signature experience channel velocity penetration '
+    'households adults regional national launch campaign equity trust quality'
+).split()
+
+
+@dataclass
+class CorpusSpec:
+    brands: int
+    words: int
+    seed: int = 7
+
+
+class TextSource:
+    """Deterministic filler text built from a small category vocabulary."""
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def sentence(self, words: int = 14) -> str:
+        picked = self.rng.choices(WORDS, k=max(words, 3))
+        metric = f"{self.rng.randint(5, 95)}%"
+        return f"{' '.join(picked).capitalize()} at {metric}."
+
+    def text(self, words: int) -> str:
+        sentences = []
+        remaining = max(words, 1)
+        while remaining > 0:
+            length = min(remaining, self.rng.randint(10, 18))
+            sentences.append(self.sentence(length))
+            remaining -= length
+        return ' '.join(sentences)
+
+    def title(self, words: int = 4) -> str:
+        return ' '.join(self.rng.choices(WORDS, k=words)).title()
+
+    def score(self) -> float:
+        return round(self.rng.uniform(3.0, 9.5), 1)
+
+
+# ============================================================================
+# SUMMARY JSON
+# ============================================================================
+
+def build_summary(brand_name: str, text: TextSource, words: int) -> dict:
+    sections = {}
+    for section_id, section_name in SECTION_NAMES.items():
+        components = []
+        for comp_id, comp_name in COMPONENT_NAMES.items():
+            if comp_id[0].upper() == section_id:
+                components.append({
+                    'code': comp_id.upper(),
+                    'name': comp_name,
+                    'rating': text.score(),
+                    'descriptor': text.rng.choice(TIERS)
+                })
+        sections[f'section_{section_id.lower()}'] = {
+            'name': section_name,
+            'total_rating': round(sum(c['rating'] for c in components), 1),
+            'descriptor': text.rng.choice(TIERS),
+            'components': components
+        }
+
+    critical_path = [f"{text.title(2)} (Phase {i})" for i in range(1, 4)]
+    return {
+        'brand_name': brand_name,
+        'market': 'USA',
+        'category': text.title(2),
+        'analysis_date': '2025-12-30',
+        'total_score': round(sum(s['total_rating'] for s in sections.values()), 1),
+        'growth_profile': {
+            'name': text.title(2),
+            'definition': text.text(words),
+            'implications': text.text(words)
+        },
+        **sections,
+        'growth_barrier': {
+            'headline': text.sentence(),
+            'problem_statement': text.text(words),
+            **{f'constraint_{i}': {
+                'constraint': text.sentence(),
+                'component_code': text.rng.choice(list(COMPONENT_NAMES)).upper(),
+                'score': text.score(),
+                'evidence': text.text(words // 2)
+            } for i in range(1, 4)}
+        },
+        'growth_solution': {
+            'headline': text.sentence(),
+            'solution_statement': text.text(words),
+            **{f'unlock_{i}': {
+                'unlock_name': text.title(3),
+                'description': text.text(words // 2)
+            } for i in range(1, 5)}
+        },
+        'growth_system': {
+            'headline': text.sentence(),
+            'system_description': text.text(words),
+            'critical_path': critical_path,
+            'products': [{
+                'product_name': text.title(2),
+                'strategic_focus': text.text(words // 2),
+                'outputs': [{
+                    'output_name': text.title(3),
+                    'relevance_score': text.rng.randint(5, 10),
+                    'purpose': text.sentence(),
+                    'critical_components': ['A1', 'B2'],
+                    'key_deliverables': [text.sentence(8) for _ in range(4)]
+                } for _ in range(3)]
+            } for _ in range(3)],
+            'implementation_considerations': text.text(words)
+        }
+    }
+
+
+# ============================================================================
+# COMPONENT FILES
+# ============================================================================
+
+def build_component_json(comp_id: str, text: TextSource, words: int) -> dict:
+    """Component output with every field its COMPONENT_MAPPINGS entry reads."""
+    data = {'finding': {}, 'rating': {}}
+    for key, path in COMPONENT_MAPPINGS[comp_id].items():
+        if key in ('strengths_field', 'weaknesses_field'):
+            label = 'strength' if key == 'strengths_field' else 'weakness'
+            value = [{label: text.title(3), 'description': text.text(words // 2),
+                      'impact_rating': text.rng.randint(4, 9)} for _ in range(4)]
+        elif key == 'scores_field':
+            value = {f'{word}_score': text.score() for word in text.rng.sample(WORDS, 5)}
+        elif key == 'tier_field':
+            value = text.rng.choice(TIERS)
+        elif key == 'rating_field':
+            value = text.score()
+        else:
+            value = text.text(words)
+
+        section, name = path.split('.', 1)
+        data[section][name] = value
+
+    data['metadata'] = {
+        'agent': f'{comp_id}-agent',
+        'timestamp': '2025-12-30T12:00:00',
+        'methodology': text.text(words),
+        'research_sources': [text.sentence(8) for _ in range(12)],
+        'competitors_analyzed': [text.title(2) for _ in range(6)],
+        'key_market_metrics': {word: text.score() for word in text.rng.sample(WORDS, 8)}
+    }
+    return data
+
+
+def build_component_markdown(comp_id: str, brand_name: str, text: TextSource, words: int) -> str:
+    section = comp_id[0].upper()
+    strengths = '\n'.join(f"- {text.text(words // 3)}" for _ in range(4))
+    weaknesses = '\n'.join(f"- {text.text(words // 3)}" for _ in range(4))
+    rows = '\n'.join(f"| {text.title(1)} | {text.score()} |" for _ in range(4))
+
+    return f"""# {comp_id.upper()}: {COMPONENT_NAMES[comp_id]}
+**Section:** {SECTION_NAMES[section]} | **Score:** {text.score()}/10 | **Tier:** {text.rng.choice(TIERS)}
+
+**Brand:** {brand_name} | **Market:** USA
+
+---
+
+## Summary
+
+**{text.sentence()}**
+
+*{text.sentence()}*
+
+**What:** {text.text(words)}
+
+*Evidence: {text.sentence(8)}*
+
+**So What:** {text.text(words)}
+
+**Now What:** {text.text(words)}
+
+---
+
+## Deep Dive
+
+### Strengths
+
+{strengths}
+
+### Weaknesses
+
+{weaknesses}
+
+### Competitive Context
+
+{text.text(words)}
+
+### Rating Rationale
+
+{text.text(words)}
+
+---
+
+## Score Breakdown
+
+| Dimension | Score |
+|-----------|-------|
+{rows}
+
+*Generated: 2025-12-30T12:00:00*
+"""
+
+
+# ============================================================================
+# CORPUS
+# ============================================================================
+
+def write_brand_folder(folder: Path, brand_index: int, words: int, seed: int) -> None:
+    """Write one synthetic brand's summary, component JSON and markdown files."""
+    text = TextSource(seed * 100003 + brand_index)
+    brand_name = f"Bench Brand {brand_index:05d}"
+    folder.mkdir(parents=True, exist_ok=True)
+
+    with open(folder / SUMMARY_FILENAME, 'w') as f:
+        json.dump(build_summary(brand_name, text, words), f, indent=2)
+
+    for comp_id in COMPONENT_NAMES:
+        with open(folder / COMPONENT_JSON_FILES[comp_id], 'w') as f:
+            json.dump(build_component_json(comp_id, text, words), f, indent=2)
+        with open(folder / COMPONENT_MARKDOWN_FILES[comp_id], 'w') as f:
+            f.write(build_component_markdown(comp_id, brand_name, text, words))
+
+
+def generate_corpus(root: Path, brands: int, words: int, seed: int = 7) -> List[Path]:
+    """
+    Write `brands` synthetic brand folders under root (or reuse them if root
+    already holds a corpus generated with the same parameters).
+    """
+    spec = CorpusSpec(brands=brands, words=words, seed=seed)
+    folders = [root / f"bench-brand-{i:05d}" for i in range(1, brands + 1)]
+
+    marker = root / CORPUS_MARKER
+    if marker.exists():
+        with open(marker, 'r') as f:
+            if json.load(f) == asdict(spec):
+                return folders
+
+        marker.unlink()
+
+    root.mkdir(parents=True, exist_ok=True)
+    for i, folder in enumerate(folders, 1):
+        write_brand_folder(folder, i, words, seed)
+
+    with open(marker, 'w') as f:
+        json.dump(asdict(spec), f)
+    return folders
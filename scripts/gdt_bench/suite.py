@@ -0,0 +1,198 @@
+"""
+Timed converter cases and the benchmark history file.
+
+Every case runs once per brand folder and its time is summed over the
+corpus; a run repeats the whole pass and keeps the median total. Brands are
+processed one at a time so memory stays flat at 10,000 brands.
+
+History is one JSON object per line (JSON Lines), appended per run with the
+git commit, converter versions and corpus parameters, so runs of the same
+corpus can be compared across versions.
+"""
+
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import gdt_converter_v2 as v2
+import gdt_converter_v3 as v3
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+# Local to each checkout (machines differ), so kept in an ignored directory
+DEFAULT_HISTORY = SCRIPTS_DIR.parent / '.gdt-bench' / 'history.jsonl'
+
+# Slowdown (fraction) at which a case is flagged as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+def load_v1():
+    """Import scripts/convert-gdt-output.py (its file name is not importable)."""
+    spec = importlib.util.spec_from_file_location('convert_gdt_output',
+                                                  SCRIPTS_DIR / 'convert-gdt-output.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+v1 = load_v1()
+
+
+# ============================================================================
+# CASES
+# ============================================================================
+
+def parse_markdown_v1(md_content: str):
+    return (v1.parse_markdown_tier(md_content), v1.parse_markdown_wsn(md_content),
+            v1.parse_markdown_deep_dive(md_content))
+
+
+def parse_markdown_v2(md_content: str):
+    sections = v2.MarkdownSections(md_content)
+    return (v2.parse_markdown_header(md_content, sections),
+            v2.parse_markdown_wsn(md_content, sections),
+            v2.parse_markdown_deep_dive(md_content, sections))
+
+
+def read_markdown(folder: Path) -> List[str]:
+    contents = []
+    for filename in v2.COMPONENT_MARKDOWN_FILES.values():
+        with open(folder / filename, 'r') as f:
+            contents.append(f.read())
+    return contents
+
+
+CASES = [
+    'v1 convert_gdt_to_website',
+    'v2 convert_gdt_to_website',
+    'v3 convert_gdt_to_website',
+    'v1 markdown parsers',
+    'v2 markdown parsers',
+    'v1 to_typescript',
+    'v2 to_typescript',
+    'v3 to_typescript',
+    'v2 generate_report_markdown',
+    'v3 generate_report_markdown',
+]
+
+
+def time_brand(folder: Path, totals: Dict[str, float]) -> None:
+    """Run every case on one brand folder, adding each case's time to totals."""
+
+    def timed(case: str, fn: Callable, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        totals[case] += time.perf_counter() - start
+        return result
+
+    data_v1 = timed('v1 convert_gdt_to_website', v1.convert_gdt_to_website, folder)
+    data_v2, report_v2 = timed('v2 convert_gdt_to_website', v2.convert_gdt_to_website, folder)
+    # Each CLI run starts with an empty folder index, so benchmark it cold too
+    v3._folder_indexes.pop(os.path.abspath(folder), None)
+    data_v3, report_v3 = timed('v3 convert_gdt_to_website', v3.convert_gdt_to_website, folder)
+
+    for md_content in read_markdown(folder):
+        timed('v1 markdown parsers', parse_markdown_v1, md_content)
+        timed('v2 markdown parsers', parse_markdown_v2, md_content)
+
+    timed('v1 to_typescript', v1.to_typescript, data_v1, 'bench')
+    timed('v2 to_typescript', v2.to_typescript, data_v2, 'bench')
+    timed('v3 to_typescript', v3.to_typescript, data_v3, 'bench')
+
+    timed('v2 generate_report_markdown', v2.generate_report_markdown, report_v2)
+    timed('v3 generate_report_markdown', v3.generate_report_markdown, report_v3)
+
+
+def run_suite(folders: List[Path], repeat: int = 3) -> List[dict]:
+    """Median total seconds per case over `repeat` passes of the corpus."""
+    passes: Dict[str, List[float]] = {case: [] for case in CASES}
+    for _ in range(repeat):
+        totals = {case: 0.0 for case in CASES}
+        for folder in folders:
+            time_brand(folder, totals)
+        for case, seconds in totals.items():
+            passes[case].append(seconds)
+
+    results = []
+    for case in CASES:
+        seconds = statistics.median(passes[case])
+        results.append({
+            'case': case,
+            'seconds': round(seconds, 6),
+            'per_brand_ms': round(seconds * 1000 / len(folders), 4),
+            'min_seconds': round(min(passes[case]), 6),
+            'max_seconds': round(max(passes[case]), 6)
+        })
+    return results
+
+
+# ============================================================================
+# HISTORY
+# ============================================================================
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPTS_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_record(corpus: dict, repeat: int, results: List[dict]) -> dict:
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'versions': {'v2': v2.CONVERTER_VERSION, 'v3': v3.CONVERTER_VERSION},
+        'corpus': corpus,
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def load_history(path: Path) -> List[dict]:
+    if not path.exists():
+        return []
+    records = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+def append_history(path: Path, record: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record, sort_keys=True) + '\n')
+
+
+def previous_run(history: List[dict], corpus: dict) -> Optional[dict]:
+    """Most recent run on an identical corpus."""
+    for record in reversed(history):
+        if record.get('corpus') == corpus:
+            return record
+    return None
+
+
+def compare(results: List[dict], previous: Optional[dict],
+            threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[dict]:
+    """Attach the change against the previous run; flag slowdowns over threshold."""
+    before = {r['case']: r['seconds'] for r in previous['results']} if previous else {}
+    rows = []
+    for result in results:
+        row = dict(result, change=None, regression=False)
+        old = before.get(result['case'])
+        if old:
+            row['change'] = (result['seconds'] - old) / old
+            row['regression'] = row['change'] > threshold
+        rows.append(row)
+    return rows
@@ -17,6 +17,10 @@ Options:
     --var-name <name>            Export variable name
     --report                     Generate validation report
     --strict                     Fail on incomplete content
+    --force                      Reconvert even if inputs are unchanged
+    --compact                    Emit the TypeScript module without whitespace
+    --size-budget-kb <n>         Warn when the module exceeds this size (default 512)
+    --profile                    Time each stage and component (report + cProfile dump)
 """
 
 import argparse
@@ -24,10 +28,45 @@ import json
 import re
 import os
 from pathlib import Path
+from contextlib import nullcontext
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from conversion_cache import (
+    hash_bytes,
+    input_fingerprint,
+    is_up_to_date,
+    save_manifest,
+    write_if_changed,
+)
+from ts_emitter import DEFAULT_BUDGET_KB, emit_module, render_typescript
+from conversion_profile import (
+    ConversionProfiler,
+    generate_profile_markdown,
+    print_profile_summary,
+    profile_path_for,
+    profile_stage,
+)
+
+CONVERTER_NAME = 'gdt_converter_v2'
+# Bump whenever a change alters the generated output, so cached brands reconvert
+CONVERTER_VERSION = '2.2'
+
+
+# Component markdown files, in report order
+COMPONENT_MARKDOWN_FILES = {
+    'a1': 'a1-brand-positioning.md',
+    'a2': 'a2-pricing-power.md',
+    'a3': 'a3-business-growth.md',
+    'b1': 'b1-emotional-connection.md',
+    'b2': 'b2-cultural-relevance.md',
+    'b3': 'b3-brand-experience.md',
+    'c1': 'c1-brand-distinctiveness.md',
+    'c2': 'c2-brand-innovation.md',
+    'c3': 'c3-disruption-urgency.md'
+}
+
 
 # ============================================================================
 # DATA CLASSES FOR VALIDATION
@@ -113,11 +152,11 @@ class ComponentValidation:
 @dataclass
 class ConversionReport:
     brand_name: str
-    timestamp: str
     total_score: float
     components: List[ComponentValidation] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    profile: Optional[dict] = None  # ConversionProfiler.summary() when run with --profile
 
     def summary(self) -> dict:
         complete = sum(1 for c in self.components if c.overall_status() == "COMPLETE")
@@ -140,8 +179,84 @@ def slugify(text: str) -> str:
     return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
 
 
-def parse_markdown_header(md_content: str) -> dict:
+# Headings (any level) and horizontal rules, matched in a single pass
+HEADING_PATTERN = re.compile(r'^(#{1,6})[ \t]+(.*?)[ \t]*$|^---', re.MULTILINE)
+
+
+class MarkdownSections:
+    """
+    Heading index for a component markdown file.
+
+    The document is scanned once; extractors then work on slices bounded by
+    the recorded heading and rule offsets instead of re-searching the whole
+    file for every field.
+    """
+
+    def __init__(self, md_content: str):
+        self.text = md_content
+        self.headings: List[Tuple[int, str, int, int]] = []  # (level, title, start, body_start)
+        self.rules: List[int] = []
+
+        for match in HEADING_PATTERN.finditer(md_content):
+            if match.group(1) is None:
+                self.rules.append(match.start())
+                continue
+            body_start = match.end() + 1 if match.end() < len(md_content) else match.end()
+            self.headings.append((len(match.group(1)), match.group(2), match.start(), body_start))
+
+    def _end_of(self, index: int, level: int, limit: int, stop_at_rule: bool) -> int:
+        """Offset where the section at headings[index] ends."""
+        end = limit
+        for lvl, _, start, _ in self.headings[index + 1:]:
+            if start >= end:
+                break
+            if lvl <= level:
+                end = start
+                break
+        if stop_at_rule:
+            body_start = self.headings[index][3]
+            for rule in self.rules:
+                if body_start <= rule < end:
+                    end = rule
+                    break
+        return end
+
+    def span(self, title: str, level: int = 2, within: Optional[Tuple[int, int]] = None,
+             stop_at_rule: bool = False) -> Optional[Tuple[int, int]]:
+        """Return (start, end) of the body under the first matching heading."""
+        lo, hi = within if within else (0, len(self.text))
+        for i, (lvl, heading, start, body_start) in enumerate(self.headings):
+            if start < lo:
+                continue
+            if start >= hi:
+                break
+            if lvl == level and heading == title:
+                return body_start, self._end_of(i, level, hi, stop_at_rule)
+        return None
+
+    def section(self, title: str, level: int = 2, within: Optional[Tuple[int, int]] = None,
+                stop_at_rule: bool = False) -> Optional[str]:
+        """Return the body text under a heading, or None if it is absent."""
+        bounds = self.span(title, level, within, stop_at_rule)
+        if bounds is None:
+            return None
+        return self.text[bounds[0]:bounds[1]]
+
+    def preamble(self) -> str:
+        """Text before the first level-2 heading (title and metadata lines)."""
+        for lvl, _, start, _ in self.headings:
+            if lvl == 2:
+                return self.text[:start]
+        return self.text
+
+    def titles(self, level: int = 1) -> List[str]:
+        """Heading texts at the given level, in document order."""
+        return [heading for lvl, heading, _, _ in self.headings if lvl == level]
+
+
+def parse_markdown_header(md_content: str, sections: Optional[MarkdownSections] = None) -> dict:
     """Extract header metadata from component markdown."""
+    sections = sections or MarkdownSections(md_content)
     header = {
         'component_id': '',
         'component_name': '',
@@ -153,40 +268,44 @@ def parse_markdown_header(md_content: str) -> dict:
     }
 
     # Title line: # A1: Brand Positioning
-    title_match = re.search(r'^#\s*([A-C][1-3]):\s*(.+)$', md_content, re.MULTILINE)
-    if title_match:
-        header['component_id'] = title_match.group(1).lower()
-        header['component_name'] = title_match.group(2).strip()
+    for title in sections.titles(level=1):
+        title_match = re.match(r'([A-C][1-3]):\s*(.+)$', title)
+        if title_match:
+            header['component_id'] = title_match.group(1).lower()
+            header['component_name'] = title_match.group(2).strip()
+            break
+
+    # Metadata lines sit between the title and the first ## heading
+    preamble = sections.preamble()
 
     # Score: **Score:** 5.4/10
-    score_match = re.search(r'\*\*Score:\*\*\s*([\d.]+)/10', md_content)
+    score_match = re.search(r'\*\*Score:\*\*\s*([\d.]+)/10', preamble)
     if score_match:
         header['score'] = float(score_match.group(1))
 
     # Tier: **Tier:** Established
-    tier_match = re.search(r'\*\*Tier:\*\*\s*([^\n|*]+)', md_content)
+    tier_match = re.search(r'\*\*Tier:\*\*\s*([^\n|*]+)', preamble)
     if tier_match:
         header['tier'] = tier_match.group(1).strip()
 
     # Section: **Section:** Brand & Business Alignment
-    section_match = re.search(r'\*\*Section:\*\*\s*([^|*]+)', md_content)
+    section_match = re.search(r'\*\*Section:\*\*\s*([^|*]+)', preamble)
     if section_match:
         header['section'] = section_match.group(1).strip()
 
     return header
 
 
-def parse_markdown_wsn(md_content: str) -> WSNContent:
+def parse_markdown_wsn(md_content: str, sections: Optional[MarkdownSections] = None) -> WSNContent:
     """Extract WSN content from Summary section."""
+    sections = sections or MarkdownSections(md_content)
     wsn = WSNContent()
 
-    # Find Summary section
-    summary_match = re.search(r'## Summary\s*\n(.*?)(?=\n---|\n## )', md_content, re.DOTALL)
-    if not summary_match:
+    # Summary runs to the next --- rule or ## heading
+    summary = sections.section('Summary', level=2, stop_at_rule=True)
+    if summary is None:
         return wsn
 
-    summary = summary_match.group(1)
-
     # Headline: First bold text on its own line
     headline_match = re.search(r'^\*\*([^*]+)\*\*\s*$', summary, re.MULTILINE)
     if headline_match:
@@ -230,8 +349,9 @@ def parse_markdown_wsn(md_content: str) -> WSNContent:
     return wsn
 
 
-def parse_markdown_deep_dive(md_content: str) -> dict:
+def parse_markdown_deep_dive(md_content: str, sections: Optional[MarkdownSections] = None) -> dict:
     """Extract deep dive content from markdown."""
+    sections = sections or MarkdownSections(md_content)
     deep_dive = {
         'strengths': [],
         'weaknesses': [],
@@ -241,49 +361,43 @@ def parse_markdown_deep_dive(md_content: str) -> dict:
         'scoreBreakdown': {}
     }
 
-    # Find Deep Dive section
-    deep_dive_match = re.search(
-        r'## Deep Dive\s*\n(.*?)(?=\n## Score Breakdown|\Z)',
-        md_content, re.DOTALL
-    )
-
-    if deep_dive_match:
-        content = deep_dive_match.group(1)
+    # Find Deep Dive section; subsections are looked up inside its bounds
+    deep_dive_span = sections.span('Deep Dive', level=2)
 
+    if deep_dive_span:
         # Strengths
-        strengths_match = re.search(r'### Strengths\s*\n(.*?)(?=\n### |\Z)', content, re.DOTALL)
-        if strengths_match:
-            bullets = re.findall(r'^- (.+)$', strengths_match.group(1), re.MULTILINE)
+        strengths = sections.section('Strengths', level=3, within=deep_dive_span)
+        if strengths is not None:
+            bullets = re.findall(r'^- (.+)$', strengths, re.MULTILINE)
             deep_dive['strengths'] = [b.strip() for b in bullets]
 
         # Weaknesses
-        weaknesses_match = re.search(r'### Weaknesses\s*\n(.*?)(?=\n### |\Z)', content, re.DOTALL)
-        if weaknesses_match:
-            bullets = re.findall(r'^- (.+)$', weaknesses_match.group(1), re.MULTILINE)
+        weaknesses = sections.section('Weaknesses', level=3, within=deep_dive_span)
+        if weaknesses is not None:
+            bullets = re.findall(r'^- (.+)$', weaknesses, re.MULTILINE)
             deep_dive['weaknesses'] = [b.strip() for b in bullets]
 
         # Competitive Context
-        context_match = re.search(r'### Competitive Context\s*\n(.*?)(?=\n### |\Z)', content, re.DOTALL)
-        if context_match:
-            deep_dive['competitiveContext'] = context_match.group(1).strip()
+        context = sections.section('Competitive Context', level=3, within=deep_dive_span)
+        if context is not None:
+            deep_dive['competitiveContext'] = context.strip()
 
         # Rating Rationale
-        rationale_match = re.search(
-            r'### Rating Rationale\s*\n(.*?)(?=\n### |\n---|\Z)',
-            content, re.DOTALL
-        )
-        if rationale_match:
-            deep_dive['rationale'] = rationale_match.group(1).strip()
+        rationale = sections.section('Rating Rationale', level=3, within=deep_dive_span,
+                                     stop_at_rule=True)
+        if rationale is not None:
+            deep_dive['rationale'] = rationale.strip()
 
         # Recommendations
-        rec_match = re.search(r'### Recommendations\s*\n(.*?)(?=\n### |\n---|\Z)', content, re.DOTALL)
-        if rec_match:
-            deep_dive['recommendations'] = rec_match.group(1).strip()
+        recommendations = sections.section('Recommendations', level=3, within=deep_dive_span,
+                                           stop_at_rule=True)
+        if recommendations is not None:
+            deep_dive['recommendations'] = recommendations.strip()
 
     # Score Breakdown table
-    breakdown_match = re.search(r'## Score Breakdown\s*\n(.*?)(?=\n\*Generated|\Z)', md_content, re.DOTALL)
-    if breakdown_match:
-        rows = re.findall(r'\|\s*([^|]+)\s*\|\s*([\d.]+)\s*\|', breakdown_match.group(1))
+    breakdown = sections.section('Score Breakdown', level=2)
+    if breakdown is not None:
+        rows = re.findall(r'\|\s*([^|]+)\s*\|\s*([\d.]+)\s*\|', breakdown)
         for name, score in rows:
             if name.strip() and name.strip() not in ['---', 'Dimension', 'Score']:
                 key = slugify(name.strip()).replace('-', '_')
@@ -399,12 +513,14 @@ def merge_wsn(original: WSNContent, derived: WSNContent) -> Tuple[WSNContent, Li
 def convert_component(md_path: Path) -> Tuple[dict, ComponentValidation]:
     """Convert a single component markdown file to website data."""
 
-    with open(md_path, 'r') as f:
-        md_content = f.read()
+    with profile_stage('load'):
+        with open(md_path, 'r') as f:
+            md_content = f.read()
 
-    header = parse_markdown_header(md_content)
-    wsn_original = parse_markdown_wsn(md_content)
-    deep_dive = parse_markdown_deep_dive(md_content)
+    sections = MarkdownSections(md_content)
+    header = parse_markdown_header(md_content, sections)
+    wsn_original = parse_markdown_wsn(md_content, sections)
+    deep_dive = parse_markdown_deep_dive(md_content, sections)
 
     # Create validation record
     validation = ComponentValidation(
@@ -426,13 +542,14 @@ def convert_component(md_path: Path) -> Tuple[dict, ComponentValidation]:
     # Derive WSN from rationale if needed
     wsn_final = wsn_original
     if not validation.wsn_complete and validation.has_rationale:
-        wsn_derived = derive_wsn_from_rationale(
-            deep_dive['rationale'],
-            deep_dive['competitiveContext'],
-            header['component_name'],
-            header['tier']
-        )
-        wsn_final, derived_fields = merge_wsn(wsn_original, wsn_derived)
+        with profile_stage('derive WSN'):
+            wsn_derived = derive_wsn_from_rationale(
+                deep_dive['rationale'],
+                deep_dive['competitiveContext'],
+                header['component_name'],
+                header['tier']
+            )
+            wsn_final, derived_fields = merge_wsn(wsn_original, wsn_derived)
 
         if derived_fields:
             validation.wsn_derived_from_rationale = True
@@ -476,7 +593,6 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
     # Initialize report
     report = ConversionReport(
         brand_name='',
-        timestamp=datetime.now().isoformat(),
         total_score=0.0
     )
 
@@ -486,8 +602,9 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
         report.errors.append(f"GDT summary JSON not found: {json_path}")
         raise FileNotFoundError(f"GDT summary JSON not found: {json_path}")
 
-    with open(json_path, 'r') as f:
-        gdt = json.load(f)
+    with profile_stage('load'):
+        with open(json_path, 'r') as f:
+            gdt = json.load(f)
 
     report.brand_name = gdt.get('brand_name', 'Unknown Brand')
     report.total_score = gdt.get('total_score', 0)
@@ -541,24 +658,17 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
         })
 
     # Process component markdown files
-    component_files = {
-        'a1': 'a1-brand-positioning.md',
-        'a2': 'a2-pricing-power.md',
-        'a3': 'a3-business-growth.md',
-        'b1': 'b1-emotional-connection.md',
-        'b2': 'b2-cultural-relevance.md',
-        'b3': 'b3-brand-experience.md',
-        'c1': 'c1-brand-distinctiveness.md',
-        'c2': 'c2-brand-innovation.md',
-        'c3': 'c3-disruption-urgency.md'
-    }
+    component_files = COMPONENT_MARKDOWN_FILES
 
     components = []
 
     for comp_id, filename in component_files.items():
         md_path = gdt_folder / filename
 
-        if not md_path.exists():
+        with profile_stage('discover', comp_id):
+            md_exists = md_path.exists()
+
+        if not md_exists:
             report.errors.append(f"Missing component file: {filename}")
             report.warnings.append(f"Component {comp_id} will have empty content")
             # Create minimal component from JSON
@@ -584,7 +694,8 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
             continue
 
         try:
-            component, validation = convert_component(md_path)
+            with profile_stage('parse', comp_id):
+                component, validation = convert_component(md_path)
             components.append(component)
             report.components.append(validation)
 
@@ -657,6 +768,11 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
             'implementationNotes': gdt_system.get('implementation_considerations', '')
         }
 
+    with profile_stage('transform growth'):
+        growth_barrier = transform_growth_barrier(gdt.get('growth_barrier', {}))
+        growth_solution = transform_growth_solution(gdt.get('growth_solution', {}))
+        growth_system = transform_growth_system(gdt.get('growth_system', {}))
+
     # Assemble final data
     data = {
         'brand': brand,
@@ -664,9 +780,9 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
         'growthProfile': growth_profile,
         'sections': sections,
         'components': components,
-        'growthBarrier': transform_growth_barrier(gdt.get('growth_barrier', {})),
-        'growthSolution': transform_growth_solution(gdt.get('growth_solution', {})),
-        'growthSystem': transform_growth_system(gdt.get('growth_system', {}))
+        'growthBarrier': growth_barrier,
+        'growthSolution': growth_solution,
+        'growthSystem': growth_system
     }
 
     return data, report
@@ -676,47 +792,18 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
 # OUTPUT GENERATION
 # ============================================================================
 
-def to_typescript(data: dict, var_name: str) -> str:
-    """Convert Python dict to TypeScript source code."""
-
-    def format_value(v, indent=2):
-        spaces = '  ' * indent
-        if v is None:
-            return 'null'
-        elif isinstance(v, bool):
-            return 'true' if v else 'false'
-        elif isinstance(v, (int, float)):
-            return str(v)
-        elif isinstance(v, str):
-            escaped = v.replace('\\', '\\\\').replace("'", "\\'")
-            return f"'{escaped}'"
-        elif isinstance(v, list):
-            if not v:
-                return '[]'
-            items = [format_value(item, indent + 1) for item in v]
-            if all(isinstance(item, str) for item in v) and len(v) <= 3:
-                return '[' + ', '.join(items) + ']'
-            return '[\n' + ',\n'.join(f'{spaces}  {item}' for item in items) + f'\n{spaces}]'
-        elif isinstance(v, dict):
-            if not v:
-                return '{}'
-            lines = []
-            for k, val in v.items():
-                formatted = format_value(val, indent + 1)
-                lines.append(f"{spaces}  {k}: {formatted}")
-            return '{\n' + ',\n'.join(lines) + f'\n{spaces}}}'
-        else:
-            return str(v)
+def typescript_header(data: dict) -> List[str]:
+    """Doc-comment lines for the generated module."""
+    return [
+        f"{data['brand']['name']} GDT Analysis Data",
+        f"Analysis date: {data['brand']['date']}",
+        "Source: GDT output folder"
+    ]
 
-    return f"""import {{ GDTAnalysis }} from '@/lib/types';
 
-/**
- * {data['brand']['name']} GDT Analysis Data
- * Generated: {datetime.now().isoformat()}
- * Source: GDT output folder
- */
-export const {var_name}Analysis: GDTAnalysis = {format_value(data, 0)};
-"""
+def to_typescript(data: dict, var_name: str, compact: bool = False) -> str:
+    """Convert Python dict to TypeScript source code."""
+    return render_typescript(data, var_name, typescript_header(data), compact)
 
 
 def generate_report_markdown(report: ConversionReport) -> str:
@@ -727,7 +814,6 @@ def generate_report_markdown(report: ConversionReport) -> str:
     lines = [
         f"# GDT Conversion Report: {report.brand_name}",
         f"",
-        f"**Generated:** {report.timestamp}",
         f"**Total Score:** {report.total_score}",
         f"",
         f"## Summary",
@@ -792,6 +878,9 @@ def generate_report_markdown(report: ConversionReport) -> str:
             lines.append(f"- ❌ {error}")
         lines.append("")
 
+    if report.profile:
+        lines.extend(generate_profile_markdown(report.profile))
+
     return '\n'.join(lines)
 
 
@@ -819,6 +908,14 @@ Examples:
     parser.add_argument('--report', action='store_true', help='Generate validation report')
     parser.add_argument('--strict', action='store_true',
                         help='Fail if any component is incomplete')
+    parser.add_argument('--force', action='store_true',
+                        help='Reconvert even if inputs and converter version are unchanged')
+    parser.add_argument('--compact', action='store_true',
+                        help='Emit the TypeScript module without whitespace')
+    parser.add_argument('--size-budget-kb', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f'Warn when the module exceeds this size (default: {DEFAULT_BUDGET_KB})')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record time and peak memory per stage and component (implies --force)')
 
     args = parser.parse_args()
 
@@ -829,41 +926,72 @@ Examples:
 
     try:
         print(f"Converting: {gdt_folder}")
-        data, report = convert_gdt_to_website(gdt_folder, args.accent_color)
-
-        # Check for strict mode failures
-        summary = report.summary()
-        if args.strict and summary['incomplete'] > 0:
-            print(f"\n❌ STRICT MODE: {summary['incomplete']} incomplete components")
-            print("Run with --report for details")
-            return 1
-
-        # Generate TypeScript output
-        var_name = args.var_name or slugify(data['brand']['name']).replace('-', '')
-        ts_code = to_typescript(data, var_name)
-
-        if args.output:
-            output_path = Path(args.output)
-        else:
-            output_path = Path(f"src/data/{slugify(data['brand']['name'])}.ts")
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            f.write(ts_code)
-
-        print(f"\n✅ Converted successfully!")
-        print(f"   Output: {output_path}")
-        print(f"   Brand: {data['brand']['name']}")
-        print(f"   Score: {data['totalScore']}")
-        print(f"   Components: {summary['complete']} complete, {summary['derived']} derived, {summary['incomplete']} incomplete")
-
-        # Generate report if requested
-        if args.report:
-            report_md = generate_report_markdown(report)
+        options = {
+            'accent_color': args.accent_color,
+            'output': args.output,
+            'var_name': args.var_name,
+            'report': args.report,
+            'strict': args.strict,
+            'compact': args.compact,
+            'profile': args.profile
+        }
+        fingerprint = input_fingerprint(gdt_folder, CONVERTER_NAME, CONVERTER_VERSION, options)
+        if not (args.force or args.profile) and is_up_to_date(gdt_folder, fingerprint):
+            print(f"\n✅ Inputs unchanged since last conversion - nothing to do (use --force to reconvert)")
+            return 0
+
+        profiler = ConversionProfiler() if args.profile else None
+        with profiler.active() if profiler else nullcontext():
+            data, report = convert_gdt_to_website(gdt_folder, args.accent_color)
+
+            # Check for strict mode failures
+            summary = report.summary()
+            if args.strict and summary['incomplete'] > 0:
+                print(f"\n❌ STRICT MODE: {summary['incomplete']} incomplete components")
+                print("Run with --report for details")
+                return 1
+
+            # Generate TypeScript output
+            var_name = args.var_name or slugify(data['brand']['name']).replace('-', '')
+
+            if args.output:
+                output_path = Path(args.output)
+            else:
+                output_path = Path(f"src/data/{slugify(data['brand']['name'])}.ts")
             report_path = output_path.parent / f"{slugify(data['brand']['name'])}-conversion-report.md"
-            with open(report_path, 'w') as f:
-                f.write(report_md)
-            print(f"   Report: {report_path}")
+
+            with profile_stage('emit'):
+                emitted = emit_module(output_path, data, var_name, typescript_header(data),
+                                      args.compact, args.size_budget_kb)
+            outputs = {str(output_path): emitted.sha256}
+            if emitted.over_budget:
+                report.warnings.append(emitted.budget_warning(args.size_budget_kb))
+
+            print(f"\n✅ Converted successfully!")
+            print(f"   Output: {output_path} ({emitted.size / 1024:.0f} KB){'' if emitted.changed else ' (unchanged)'}")
+            print(f"   Brand: {data['brand']['name']}")
+            print(f"   Score: {data['totalScore']}")
+            print(f"   Components: {summary['complete']} complete, {summary['derived']} derived, {summary['incomplete']} incomplete")
+
+            # Generate report if requested
+            if args.report:
+                if profiler:
+                    report.profile = profiler.summary()
+                with profile_stage('write'):
+                    report_md = generate_report_markdown(report)
+                    outputs[str(report_path)] = hash_bytes(report_md.encode('utf-8'))
+                    write_if_changed(report_path, report_md)
+                print(f"   Report: {report_path}")
+
+            with profile_stage('write'):
+                save_manifest(gdt_folder, fingerprint, outputs)
+
+        if profiler:
+            profile_path = profile_path_for(report_path)
+            profiler.dump_cprofile(profile_path)
+            print_profile_summary(profiler.summary())
+            print(f"   cProfile: {profile_path}")
 
         # Print warnings
         if report.warnings:
@@ -6,25 +6,78 @@ CRITICAL: Uses JSON output files as PRIMARY source (not markdown).
 Markdown files may have incomplete Summary sections due to generation bugs.
 JSON contains the complete, accurate data.
 
+When a component's JSON is missing or leaves WSN fields empty, that component
+alone falls back to the v2 markdown parser. The .md file is only opened in
+that case.
+
+Component files are found with one directory scan per brand folder and may use
+either naming scheme: a1-output.json or a descriptive a1-brand-positioning.json
+(plus a1-*.md for the markdown fallback).
+
 Usage:
     python3 gdt_converter_v3.py <gdt-output-folder> [options]
 
+    python3 gdt_converter_v3.py --batch <outputs-root> [options]
+    python3 gdt_converter_v3.py --watch <outputs-root> [options]
+
 Options:
-    --accent-color "#HEXCOLOR"   Brand accent color
+    --accent-color "#HEXCOLOR"   Brand accent color (default: the brand's existing
+                                 accent; in batch/watch mode, new brands only)
     --output <path>              Output TypeScript file
     --var-name <name>            Export variable name
     --report                     Generate validation report
+    --batch <outputs-root>       Convert every brand folder under a root
+    --output-dir <path>          Directory for batch outputs (default: src/data)
+    --workers <n>                Batch worker processes (default: CPU count)
+    --force                      Reconvert even if inputs are unchanged
+    --watch <outputs-root>       Reconvert brands as their files change
+    --poll                       Watch by polling instead of inotify
+    --compact                    Emit the TypeScript module without whitespace
+    --size-budget-kb <n>         Warn when a module exceeds this size (default 512)
+    --profile                    Time each stage and component (report + cProfile dump)
 """
 
 import argparse
 import json
 import re
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from conversion_cache import (
+    hash_bytes,
+    input_fingerprint,
+    is_up_to_date,
+    load_manifest,
+    save_manifest,
+    write_if_changed,
+)
+from ts_emitter import (DEFAULT_BUDGET_KB, RawTS, emit_module, module_accent, module_entries, object_entries,
+                        render_typescript)
+from file_watcher import InotifyWatcher, create_watcher, watch_changes
+from json_subset import FieldTree, fields_from_paths, load_json_subset
+from conversion_profile import (
+    ConversionProfiler,
+    generate_profile_markdown,
+    print_profile_summary,
+    profile_path_for,
+    profile_stage,
+    profiling_enabled,
+)
+from gdt_converter_v2 import COMPONENT_MARKDOWN_FILES, convert_component as convert_component_markdown
+
+CONVERTER_NAME = 'gdt_converter_v3'
+# Bump whenever a change alters the generated output, so cached brands reconvert
+CONVERTER_VERSION = '3.6'
+
+# Accent for brands that have no module yet (and none given with --accent-color)
+DEFAULT_ACCENT = '#E54B7B'
+
 
 # ============================================================================
 # COMPONENT JSON FIELD MAPPINGS
@@ -148,6 +201,32 @@ def slugify(text: str) -> str:
     return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
 
 
+def export_name(slug: str) -> str:
+    """Export variable name for a brand slug, as src/data/index.ts imports it (hogwarts-legacy → hogwartsLegacy)."""
+    first, *rest = slug.split('-')
+    return first + ''.join(part.capitalize() for part in rest)
+
+
+def merge_existing_module(data: dict, output_path: Path, fallback_accent: str) -> None:
+    """
+    Carry over what the brand's existing module has and the converter does not
+    produce: fields added by hand (brand.password, growthSummary, ...) are kept
+    verbatim, and the brand keeps its accent (`fallback_accent` is only for new
+    brands). Raises ValueError rather than overwrite a module it cannot read back.
+    """
+    entries = module_entries(output_path)
+    if entries is None:
+        data['brand']['accentColor'] = fallback_accent
+        return
+
+    brand_entries = object_entries(entries['brand']) if 'brand' in entries else {}
+    for key, source in brand_entries.items():
+        data['brand'].setdefault(key, RawTS(source))
+    data['brand']['accentColor'] = module_accent(output_path) or fallback_accent
+    for key, source in entries.items():
+        data.setdefault(key, RawTS(source))
+
+
 def get_nested(data: dict, path: str, default=None):
     """Get nested dict value using dot notation path."""
     keys = path.split('.')
@@ -273,6 +352,83 @@ def format_score_breakdown(scores_data: dict) -> dict:
     return result
 
 
+# ============================================================================
+# COMPONENT FILE DISCOVERY
+# ============================================================================
+
+SUMMARY_FILENAME = 'gdt-summary-output.json'
+
+# a1-output.json, a1-brand-positioning.json, b3-experience-excellence.json, c3-*.md ...
+COMPONENT_FILE_PATTERN = re.compile(r'^([a-c][1-3])-(.+)\.(json|md)$', re.IGNORECASE)
+
+
+@dataclass
+class ComponentFiles:
+    json_path: Optional[Path] = None
+    md_path: Optional[Path] = None
+
+
+@dataclass
+class BrandFolderIndex:
+    folder: Path
+    summary_path: Optional[Path]
+    components: Dict[str, ComponentFiles]
+
+    def files_for(self, comp_id: str) -> ComponentFiles:
+        return self.components.get(comp_id, ComponentFiles())
+
+
+# Brand folder indexes built during this run, keyed by absolute folder path
+_folder_indexes: Dict[str, BrandFolderIndex] = {}
+
+
+def _preferred(current: Optional[Path], candidate: Path, canonical: str) -> Path:
+    """Pick between two files for the same component: canonical name, then alphabetical."""
+    if current is None:
+        return candidate
+    if current.name == canonical:
+        return current
+    if candidate.name == canonical:
+        return candidate
+    return min(current, candidate, key=lambda p: p.name)
+
+
+def index_brand_folder(gdt_folder: Path, refresh: bool = False) -> BrandFolderIndex:
+    """
+    Map component codes to their JSON and markdown files with a single
+    os.scandir of the brand folder. The index is cached for the rest of the
+    run; pass refresh=True after the folder's contents change.
+    """
+    key = os.path.abspath(gdt_folder)
+    if not refresh and key in _folder_indexes:
+        return _folder_indexes[key]
+
+    summary_path = None
+    components: Dict[str, ComponentFiles] = {}
+
+    with os.scandir(gdt_folder) as entries:
+        for entry in entries:
+            if entry.name == SUMMARY_FILENAME:
+                summary_path = Path(entry.path)
+                continue
+            match = COMPONENT_FILE_PATTERN.match(entry.name)
+            if not match or not entry.is_file():
+                continue
+
+            comp_id = match.group(1).lower()
+            files = components.setdefault(comp_id, ComponentFiles())
+            path = Path(entry.path)
+            if match.group(3).lower() == 'json':
+                files.json_path = _preferred(files.json_path, path, f"{comp_id}-output.json")
+            else:
+                files.md_path = _preferred(files.md_path, path,
+                                           COMPONENT_MARKDOWN_FILES.get(comp_id, ''))
+
+    index = BrandFolderIndex(folder=gdt_folder, summary_path=summary_path, components=components)
+    _folder_indexes[key] = index
+    return index
+
+
 # ============================================================================
 # COMPONENT CONVERSION
 # ============================================================================
@@ -289,18 +445,95 @@ class ComponentResult:
     weaknesses: List[str]
     competitive_context: str
     score_breakdown: dict
-    source: str  # 'json' or 'markdown'
+    source: str  # 'json', 'markdown' or 'json+markdown'
     warnings: List[str] = field(default_factory=list)
 
+    def missing_wsn_fields(self) -> List[str]:
+        """Required WSN fields that are empty."""
+        return [f for f in REQUIRED_WSN_FIELDS if not self.wsn.get(f)]
+
+
+# WSN fields a component needs before the JSON source counts as complete
+REQUIRED_WSN_FIELDS = ('headline', 'what', 'soWhat', 'nowWhat')
 
-def convert_component_from_json(comp_id: str, json_path: Path) -> Optional[ComponentResult]:
-    """Convert a component from its JSON output file."""
 
-    if not json_path.exists():
+# Headline fields tried when a component's own headline field is empty
+HEADLINE_FALLBACK_FIELDS = ('finding.summary', 'finding.overall_summary')
+
+
+def component_json_fields(comp_id: str) -> FieldTree:
+    """Field tree of everything convert_component_from_json reads for a component."""
+    mapping = COMPONENT_MAPPINGS.get(comp_id, {})
+    paths = ['rating.overall_rating', 'rating.rating_tier', *HEADLINE_FALLBACK_FIELDS]
+    paths.extend(path for path in mapping.values() if path)
+    return fields_from_paths(paths)
+
+
+def load_component_json(json_path: Optional[Path], comp_id: Optional[str] = None) -> Optional[dict]:
+    """
+    Load a component JSON output file, or None if it does not exist. With a
+    comp_id, only the `finding`/`rating` fields the converter reads are decoded;
+    `metadata` and other unused fields are skipped without building objects.
+    """
+    if json_path is None:
+        return None
+    try:
+        if comp_id is None:
+            with open(json_path, 'r') as f:
+                return json.load(f)
+        return load_json_subset(json_path, component_json_fields(comp_id))
+    except FileNotFoundError:
         return None
 
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+
+def load_component_jsons(json_paths: Dict[str, Optional[Path]],
+                         cache: Optional[Dict[str, object]] = None) -> Dict[str, Optional[dict]]:
+    """
+    Load all component JSON files for a brand concurrently. Files already in
+    `cache` (keyed by path) are not re-read; newly loaded ones are added to it.
+    """
+    results: Dict[str, Optional[dict]] = {comp_id: None for comp_id in json_paths}
+    present = {}
+    for comp_id, path in json_paths.items():
+        if path is None:
+            continue
+        if cache is not None and str(path) in cache:
+            results[comp_id] = cache[str(path)]
+        else:
+            present[comp_id] = path
+    if not present:
+        return results
+
+    if profiling_enabled():
+        # One at a time, so each file's load is attributed to its component
+        for comp_id, path in present.items():
+            with profile_stage('load', comp_id):
+                results[comp_id] = load_component_json(path, comp_id)
+            if cache is not None and results[comp_id] is not None:
+                cache[str(path)] = results[comp_id]
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(present)) as pool:
+        futures = {
+            comp_id: pool.submit(load_component_json, path, comp_id)
+            for comp_id, path in present.items()
+        }
+        for comp_id, future in futures.items():
+            results[comp_id] = future.result()
+            if cache is not None and results[comp_id] is not None:
+                cache[str(present[comp_id])] = results[comp_id]
+    return results
+
+
+def convert_component_from_json(comp_id: str, json_path: Optional[Path],
+                                data: Optional[dict] = None) -> Optional[ComponentResult]:
+    """Convert a component from its JSON output file (or its already-loaded data)."""
+
+    if data is None:
+        with profile_stage('load', comp_id):
+            data = load_component_json(json_path, comp_id)
+    if data is None:
+        return None
 
     mapping = COMPONENT_MAPPINGS.get(comp_id, {})
     warnings = []
@@ -311,9 +544,7 @@ def convert_component_from_json(comp_id: str, json_path: Path) -> Optional[Compo
 
     # Get headline text
     headline_text = ''
-    for possible_field in [mapping.get('headline_field'),
-                           'finding.summary',
-                           'finding.overall_summary']:
+    for possible_field in [mapping.get('headline_field'), *HEADLINE_FALLBACK_FIELDS]:
         if possible_field:
             headline_text = get_nested(data, possible_field, '')
             if headline_text:
@@ -327,23 +558,24 @@ def convert_component_from_json(comp_id: str, json_path: Path) -> Optional[Compo
     rationale = get_nested(data, mapping.get('rationale_field', ''), '')
     recommendations = get_nested(data, mapping.get('recommendations_field', ''), '')
 
-    # Build WSN from headline text
-    wsn = extract_wsn_from_text(headline_text, context, recommendations)
-
-    # If no nowWhat from recommendations, derive from rationale
-    if not wsn['nowWhat'] and rationale:
-        # Look for action-oriented sentences in rationale
-        sentences = re.split(r'(?<=[.!?])\s+', rationale)
-        for sentence in sentences:
-            if any(kw in sentence.lower() for kw in ['need', 'should', 'must', 'requires']):
-                wsn['nowWhat'] = sentence
-                break
-
-    # If no evidence, use first metric from rationale
-    if not wsn['evidence'] and rationale:
-        metric_match = re.search(r'([\d.]+%|[\d.]+/10|score[sd]?\s+[\d.]+)', rationale, re.IGNORECASE)
-        if metric_match:
-            wsn['evidence'] = f"Score: {metric_match.group(0)}"
+    with profile_stage('derive WSN', comp_id):
+        # Build WSN from headline text
+        wsn = extract_wsn_from_text(headline_text, context, recommendations)
+
+        # If no nowWhat from recommendations, derive from rationale
+        if not wsn['nowWhat'] and rationale:
+            # Look for action-oriented sentences in rationale
+            sentences = re.split(r'(?<=[.!?])\s+', rationale)
+            for sentence in sentences:
+                if any(kw in sentence.lower() for kw in ['need', 'should', 'must', 'requires']):
+                    wsn['nowWhat'] = sentence
+                    break
+
+        # If no evidence, use first metric from rationale
+        if not wsn['evidence'] and rationale:
+            metric_match = re.search(r'([\d.]+%|[\d.]+/10|score[sd]?\s+[\d.]+)', rationale, re.IGNORECASE)
+            if metric_match:
+                wsn['evidence'] = f"Score: {metric_match.group(0)}"
 
     # Get strengths/weaknesses
     strengths_raw = get_nested(data, mapping.get('strengths_field', ''), [])
@@ -372,27 +604,131 @@ def convert_component_from_json(comp_id: str, json_path: Path) -> Optional[Compo
     )
 
 
+def convert_component_from_markdown(comp_id: str, md_path: Optional[Path]) -> Optional[ComponentResult]:
+    """Convert a component from its markdown file using the v2 parser."""
+
+    if md_path is None:
+        return None
+
+    component, validation = convert_component_markdown(md_path)
+
+    return ComponentResult(
+        component_id=comp_id,
+        name=component['name'] or COMPONENT_NAMES.get(comp_id, comp_id.upper()),
+        section=comp_id[0].upper(),
+        score=component['score'],
+        tier=component['tier'],
+        wsn=component['wsn'],
+        strengths=component.get('strengths', []),
+        weaknesses=component.get('weaknesses', []),
+        competitive_context=component.get('competitiveContext', ''),
+        score_breakdown=component.get('scoreBreakdown', {}),
+        source='markdown',
+        warnings=list(validation.warnings)
+    )
+
+
+def merge_component_results(primary: ComponentResult, fallback: ComponentResult) -> ComponentResult:
+    """Fill the empty fields of a JSON result from its markdown counterpart."""
+    filled = []
+
+    wsn = dict(primary.wsn)
+    for key, value in fallback.wsn.items():
+        if not wsn.get(key) and value:
+            wsn[key] = value
+            filled.append(key)
+
+    def pick(name: str, ours, theirs):
+        if not ours and theirs:
+            filled.append(name)
+            return theirs
+        return ours
+
+    result = ComponentResult(
+        component_id=primary.component_id,
+        name=primary.name,
+        section=primary.section,
+        score=pick('score', primary.score, fallback.score),
+        tier=pick('tier', primary.tier, fallback.tier),
+        wsn=wsn,
+        strengths=pick('strengths', primary.strengths, fallback.strengths),
+        weaknesses=pick('weaknesses', primary.weaknesses, fallback.weaknesses),
+        competitive_context=pick('competitiveContext', primary.competitive_context,
+                                 fallback.competitive_context),
+        score_breakdown=pick('scoreBreakdown', primary.score_breakdown, fallback.score_breakdown),
+        source='json+markdown' if filled else primary.source,
+        warnings=list(primary.warnings)
+    )
+    if filled:
+        result.warnings.append(f"Filled from markdown: {', '.join(filled)}")
+    return result
+
+
+def convert_component(comp_id: str, files: ComponentFiles, data: Optional[dict] = None,
+                      cache: Optional[Dict[str, object]] = None) -> Optional[ComponentResult]:
+    """
+    Convert a component from JSON, falling back to markdown for this
+    component only when the JSON is missing or its WSN is incomplete.
+    Markdown results are kept in `cache` (keyed by path) when one is given.
+    """
+    with profile_stage('parse', comp_id):
+        result = convert_component_from_json(comp_id, files.json_path, data)
+    if result is not None and not result.missing_wsn_fields():
+        return result
+
+    try:
+        md_key = str(files.md_path)
+        if cache is not None and md_key in cache:
+            fallback = cache[md_key]
+        else:
+            with profile_stage('parse', comp_id):
+                fallback = convert_component_from_markdown(comp_id, files.md_path)
+            if cache is not None and fallback is not None:
+                cache[md_key] = fallback
+    except Exception as e:
+        if result is not None:
+            result.warnings.append(f"Markdown fallback failed: {e}")
+        return result
+
+    if fallback is None:
+        return result
+    if result is None:
+        return fallback
+    with profile_stage('derive WSN', comp_id):
+        return merge_component_results(result, fallback)
+
+
 # ============================================================================
 # MAIN CONVERSION
 # ============================================================================
 
-def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> Tuple[dict, dict]:
-    """Main conversion function - uses JSON as primary source."""
+def convert_gdt_to_website(gdt_folder: Path, accent_color: str = DEFAULT_ACCENT,
+                           component_cache: Optional[Dict[str, object]] = None) -> Tuple[dict, dict]:
+    """
+    Main conversion function - uses JSON as primary source.
+
+    component_cache, if given, holds parsed component files between calls
+    (used by --watch so only changed components are re-read).
+    """
 
     report = {
-        'timestamp': datetime.now().isoformat(),
         'components': [],
         'warnings': [],
         'errors': []
     }
 
+    # One directory scan finds the summary and every component file
+    with profile_stage('discover'):
+        index = index_brand_folder(gdt_folder)
+
     # Load main summary JSON
-    summary_path = gdt_folder / 'gdt-summary-output.json'
-    if not summary_path.exists():
-        raise FileNotFoundError(f"GDT summary JSON not found: {summary_path}")
+    summary_path = index.summary_path
+    if summary_path is None:
+        raise FileNotFoundError(f"GDT summary JSON not found: {gdt_folder / SUMMARY_FILENAME}")
 
-    with open(summary_path, 'r') as f:
-        gdt = json.load(f)
+    with profile_stage('load'):
+        with open(summary_path, 'r') as f:
+            gdt = json.load(f)
 
     brand_name = gdt.get('brand_name', 'Unknown Brand')
     report['brand_name'] = brand_name
@@ -446,25 +782,17 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
             'components': section_components
         })
 
-    # Convert each component from JSON output files
-    component_files = {
-        'a1': 'a1-output.json',
-        'a2': 'a2-output.json',
-        'a3': 'a3-output.json',
-        'b1': 'b1-output.json',
-        'b2': 'b2-output.json',
-        'b3': 'b3-output.json',
-        'c1': 'c1-output.json',
-        'c2': 'c2-output.json',
-        'c3': 'c3-output.json'
-    }
+    # Convert each component from its JSON output file (markdown fallback)
+    component_files = {comp_id: index.files_for(comp_id) for comp_id in COMPONENT_NAMES}
 
     components = []
+    component_data = load_component_jsons(
+        {comp_id: files.json_path for comp_id, files in component_files.items()},
+        component_cache
+    )
 
-    for comp_id, filename in component_files.items():
-        json_path = gdt_folder / filename
-
-        result = convert_component_from_json(comp_id, json_path)
+    for comp_id, files in component_files.items():
+        result = convert_component(comp_id, files, component_data[comp_id], component_cache)
 
         if result:
             component = {
@@ -507,7 +835,7 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
                 for w in result.warnings:
                     report['warnings'].append(f"[{comp_id.upper()}] {w}")
         else:
-            report['errors'].append(f"Failed to convert {comp_id} - JSON file not found")
+            report['errors'].append(f"Failed to convert {comp_id} - JSON and markdown files not found")
             # Create minimal component from sections data
             for section in sections:
                 for sec_comp in section['components']:
@@ -591,6 +919,11 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
             'implementationNotes': gdt_system.get('implementation_considerations', '')
         }
 
+    with profile_stage('transform growth'):
+        growth_barrier = transform_growth_barrier(gdt.get('growth_barrier', {}))
+        growth_solution = transform_growth_solution(gdt.get('growth_solution', {}))
+        growth_system = transform_growth_system(gdt.get('growth_system', {}))
+
     # Assemble final data
     data = {
         'brand': brand,
@@ -598,9 +931,9 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
         'growthProfile': growth_profile,
         'sections': sections,
         'components': components,
-        'growthBarrier': transform_growth_barrier(gdt.get('growth_barrier', {})),
-        'growthSolution': transform_growth_solution(gdt.get('growth_solution', {})),
-        'growthSystem': transform_growth_system(gdt.get('growth_system', {}))
+        'growthBarrier': growth_barrier,
+        'growthSolution': growth_solution,
+        'growthSystem': growth_system
     }
 
     return data, report
@@ -610,48 +943,19 @@ def convert_gdt_to_website(gdt_folder: Path, accent_color: str = '#E54B7B') -> T
 # OUTPUT GENERATION
 # ============================================================================
 
-def to_typescript(data: dict, var_name: str) -> str:
-    """Convert Python dict to TypeScript source code."""
-
-    def format_value(v, indent=2):
-        spaces = '  ' * indent
-        if v is None:
-            return 'null'
-        elif isinstance(v, bool):
-            return 'true' if v else 'false'
-        elif isinstance(v, (int, float)):
-            return str(v)
-        elif isinstance(v, str):
-            escaped = v.replace('\\', '\\\\').replace("'", "\\'")
-            return f"'{escaped}'"
-        elif isinstance(v, list):
-            if not v:
-                return '[]'
-            items = [format_value(item, indent + 1) for item in v]
-            if all(isinstance(item, str) for item in v) and len(v) <= 3:
-                return '[' + ', '.join(items) + ']'
-            return '[\n' + ',\n'.join(f'{spaces}  {item}' for item in items) + f'\n{spaces}]'
-        elif isinstance(v, dict):
-            if not v:
-                return '{}'
-            lines = []
-            for k, val in v.items():
-                formatted = format_value(val, indent + 1)
-                lines.append(f"{spaces}  {k}: {formatted}")
-            return '{\n' + ',\n'.join(lines) + f'\n{spaces}}}'
-        else:
-            return str(v)
+def typescript_header(data: dict) -> List[str]:
+    """Doc-comment lines for the generated module."""
+    return [
+        f"{data['brand']['name']} GDT Analysis Data",
+        f"Analysis date: {data['brand']['date']}",
+        "Source: JSON output files (primary), markdown (fallback)",
+        "Converter: gdt_converter_v3.py"
+    ]
 
-    return f"""import {{ GDTAnalysis }} from '@/lib/types';
 
-/**
- * {data['brand']['name']} GDT Analysis Data
- * Generated: {datetime.now().isoformat()}
- * Source: JSON output files (primary), markdown (fallback)
- * Converter: gdt_converter_v3.py
- */
-export const {var_name}Analysis: GDTAnalysis = {format_value(data, 0)};
-"""
+def to_typescript(data: dict, var_name: str, compact: bool = False) -> str:
+    """Convert Python dict to TypeScript source code."""
+    return render_typescript(data, var_name, typescript_header(data), compact)
 
 
 def generate_report_markdown(report: dict) -> str:
@@ -663,9 +967,8 @@ def generate_report_markdown(report: dict) -> str:
     lines = [
         f"# GDT Conversion Report: {report['brand_name']}",
         f"",
-        f"**Generated:** {report['timestamp']}",
         f"**Total Score:** {report['total_score']}",
-        f"**Source:** JSON output files (v3 converter)",
+        f"**Source:** JSON output files, markdown fallback (v3 converter)",
         f"",
         f"## Summary",
         f"",
@@ -709,9 +1012,381 @@ def generate_report_markdown(report: dict) -> str:
         for e in report['errors']:
             lines.append(f"- ❌ {e}")
 
+    if report.get('profile'):
+        lines.extend(generate_profile_markdown(report['profile']))
+
+    return '\n'.join(lines)
+
+
+# ============================================================================
+# BATCH CONVERSION
+# ============================================================================
+
+def report_path_for(output_path: Path, brand_name: str) -> Path:
+    """Conversion report path that sits next to the TypeScript module."""
+    return output_path.parent / f"{slugify(brand_name)}-conversion-report.md"
+
+
+def write_brand_outputs(data: dict, report: dict, output_path: Path, var_name: str,
+                        write_report: bool, compact: bool = False,
+                        budget_kb: int = DEFAULT_BUDGET_KB,
+                        profiler: Optional[ConversionProfiler] = None) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Stream the TypeScript module (and write the optional report), skipping files
+    whose bytes are unchanged. Returns ({path: sha256} for every output, [paths written]).
+    With a profiler, the report includes its figures up to this point.
+    """
+    with profile_stage('emit'):
+        emitted = emit_module(output_path, data, var_name, typescript_header(data), compact, budget_kb)
+    if emitted.over_budget:
+        report['warnings'].append(emitted.budget_warning(budget_kb))
+
+    outputs = {str(output_path): emitted.sha256}
+    written = [str(output_path)] if emitted.changed else []
+
+    if write_report:
+        report_path = report_path_for(output_path, data['brand']['name'])
+        if profiler is not None:
+            report['profile'] = profiler.summary()
+        with profile_stage('write'):
+            report_md = generate_report_markdown(report)
+            outputs[str(report_path)] = hash_bytes(report_md.encode('utf-8'))
+            if write_if_changed(report_path, report_md):
+                written.append(str(report_path))
+
+    return outputs, written
+
+
+def find_brand_folders(outputs_root: Path) -> List[Path]:
+    """Return every folder directly under outputs_root, sorted by name."""
+    with os.scandir(outputs_root) as entries:
+        return sorted(Path(e.path) for e in entries if e.is_dir() and not e.name.startswith('.'))
+
+
+def convert_brand_folder(gdt_folder: Path, output_dir: Path, accent_color: str,
+                         write_report: bool, force: bool = False, compact: bool = False,
+                         budget_kb: int = DEFAULT_BUDGET_KB, profile: bool = False) -> dict:
+    """
+    Convert one brand folder in a batch worker. Never raises. With profile,
+    the brand is always reconverted, a cProfile dump is written beside its
+    report and result['profile'] holds the per-stage/per-component figures.
+    """
+    start = time.perf_counter()
+    result = {
+        'folder': gdt_folder.name,
+        'brand_name': '',
+        'output': '',
+        'complete': 0,
+        'total': 0,
+        'warnings': 0,
+        'errors': [],
+        'skipped': False,
+        'written': 0,
+        'seconds': 0.0,
+        'profile': None
+    }
+
+    try:
+        options = {
+            'accent_color': accent_color,
+            'output_dir': str(output_dir),
+            'report': write_report,
+            'compact': compact,
+            'profile': profile
+        }
+        fingerprint = input_fingerprint(gdt_folder, CONVERTER_NAME, CONVERTER_VERSION, options)
+
+        if not (force or profile) and is_up_to_date(gdt_folder, fingerprint):
+            result.update(load_manifest(gdt_folder).get('details', {}))
+            result['skipped'] = True
+        else:
+            profiler = ConversionProfiler() if profile else None
+            with profiler.active() if profiler else nullcontext():
+                data, report = convert_gdt_to_website(gdt_folder, accent_color)
+                slug = slugify(data['brand']['name'])
+                output_path = output_dir / f"{slug}.ts"
+                merge_existing_module(data, output_path, accent_color)
+                outputs, written = write_brand_outputs(data, report, output_path, export_name(slug),
+                                                       write_report, compact, budget_kb, profiler)
+
+                result['brand_name'] = data['brand']['name']
+                result['output'] = str(output_path)
+                result['complete'] = sum(1 for c in report['components'] if c.get('wsn_complete'))
+                result['total'] = len(report['components'])
+                result['warnings'] = len(report['warnings'])
+                result['errors'] = report['errors']
+                result['written'] = len(written)
+
+                details = {k: result[k] for k in ('brand_name', 'output', 'complete', 'total',
+                                                  'warnings', 'errors')}
+                with profile_stage('write'):
+                    save_manifest(gdt_folder, fingerprint, outputs, details)
+
+            if profiler:
+                profiler.dump_cprofile(profile_path_for(report_path_for(output_path, result['brand_name'])))
+                result['profile'] = profiler.summary()
+    except Exception as e:
+        result['errors'] = [f"{type(e).__name__}: {e}"]
+
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def run_batch(outputs_root: Path, output_dir: Path, accent_color: str,
+              write_report: bool, workers: Optional[int] = None,
+              force: bool = False, compact: bool = False,
+              budget_kb: int = DEFAULT_BUDGET_KB, profile: bool = False) -> List[dict]:
+    """
+    Convert every brand folder under outputs_root on a process pool. Brands
+    keep their module's accent and hand-added fields (merge_existing_module);
+    accent_color is for new ones.
+    """
+    folders = find_brand_folders(outputs_root)
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(convert_brand_folder, folder, output_dir, accent_color, write_report,
+                        force, compact, budget_kb, profile)
+            for folder in folders
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "❌" if not result['output'] else ("⚠️" if result['errors'] else "✅")
+            note = " unchanged, skipped" if result['skipped'] else ""
+            print(f"   {status} {result['folder']} ({result['seconds']:.2f}s){note}")
+            results.append(result)
+
+    return sorted(results, key=lambda r: r['folder'])
+
+
+def generate_batch_report_markdown(results: List[dict], outputs_root: Path,
+                                   wall_seconds: float) -> str:
+    """Generate the combined markdown report for a batch run."""
+    converted = [r for r in results if r['output'] and not r['skipped']]
+    skipped = [r for r in results if r['skipped']]
+    failed = [r for r in results if not r['output']]
+
+    lines = [
+        f"# GDT Batch Conversion Report",
+        f"",
+        f"**Generated:** {datetime.now().isoformat()}",
+        f"**Outputs Root:** {outputs_root}",
+        f"**Source:** JSON output files (v3 converter)",
+        f"",
+        f"## Summary",
+        f"",
+        f"| Metric | Value |",
+        f"|--------|-------|",
+        f"| Brand folders | {len(results)} |",
+        f"| Converted | {len(converted)} |",
+        f"| Skipped (unchanged) | {len(skipped)} |",
+        f"| Failed | {len(failed)} |",
+        f"| Total wall time | {wall_seconds:.2f}s |",
+        f"| Summed brand time | {sum(r['seconds'] for r in results):.2f}s |",
+        f"",
+        f"## Brands",
+        f"",
+        f"| Folder | Brand | Status | WSN | Warnings | Errors | Wall Time |",
+        f"|--------|-------|--------|-----|----------|--------|-----------|"
+    ]
+
+    for r in sorted(results, key=lambda r: r['seconds'], reverse=True):
+        wsn = f"{r['complete']}/{r['total']}" if r['output'] else "-"
+        if not r['output']:
+            status = "failed"
+        elif r['skipped']:
+            status = "unchanged"
+        else:
+            status = "written" if r['written'] else "identical"
+        lines.append(
+            f"| {r['folder']} | {r['brand_name'] or '-'} | {status} | {wsn} | "
+            f"{r['warnings']} | {len(r['errors'])} | {r['seconds']:.2f}s |"
+        )
+
+    errored = [r for r in results if r['errors']]
+    if errored:
+        lines.extend([
+            "",
+            "## Errors",
+            ""
+        ])
+        for r in errored:
+            for e in r['errors']:
+                lines.append(f"- ❌ [{r['folder']}] {e}")
+
+    profiled = [r for r in results if r.get('profile')]
+    if profiled:
+        lines.extend(generate_batch_profile_markdown(profiled))
+
     return '\n'.join(lines)
 
 
+def generate_batch_profile_markdown(results: List[dict], top: int = 15) -> List[str]:
+    """Stage totals across the batch and the slowest components of any brand."""
+    stage_totals: Dict[str, float] = {}
+    for r in results:
+        for name, stage in r['profile']['stages'].items():
+            stage_totals[name] = stage_totals.get(name, 0.0) + stage['seconds']
+
+    lines = [
+        "",
+        "## Profile",
+        "",
+        "| Stage | Wall (ms, all brands) |",
+        "|-------|-----------------------|"
+    ]
+    for name, seconds in stage_totals.items():
+        lines.append(f"| {name} | {seconds * 1000:.1f} |")
+
+    components = [
+        (r['folder'], comp_id, comp)
+        for r in results
+        for comp_id, comp in r['profile']['components'].items()
+    ]
+    components.sort(key=lambda item: item[2]['seconds'], reverse=True)
+
+    lines.extend([
+        "",
+        f"### Slowest Components (top {min(top, len(components))})",
+        "",
+        "| Folder | ID | Wall (ms) | Peak (MB) | Slowest Stage |",
+        "|--------|----|-----------|-----------|---------------|"
+    ])
+    for folder, comp_id, comp in components[:top]:
+        slowest = max(comp['stages'].items(), key=lambda kv: kv[1])[0] if comp['stages'] else '-'
+        lines.append(f"| {folder} | {comp_id.upper()} | {comp['seconds'] * 1000:.2f} | "
+                     f"{comp['peak_bytes'] / 1e6:.2f} | {slowest} |")
+    lines.append("")
+    return lines
+
+
+def main_batch(args) -> int:
+    """Run --batch mode."""
+    outputs_root = Path(args.batch)
+    if not outputs_root.is_dir():
+        print(f"❌ Error: outputs root not found: {outputs_root}")
+        return 1
+
+    output_dir = Path(args.output_dir)
+    print(f"Batch converting: {outputs_root}")
+    print(f"Source: JSON output files (v3 converter)")
+
+    start = time.perf_counter()
+    results = run_batch(outputs_root, output_dir, args.accent_color or DEFAULT_ACCENT, args.report,
+                        args.workers, args.force, args.compact, args.size_budget_kb, args.profile)
+    wall_seconds = time.perf_counter() - start
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / 'batch-conversion-report.md'
+    with open(report_path, 'w') as f:
+        f.write(generate_batch_report_markdown(results, outputs_root, wall_seconds))
+
+    failed = sum(1 for r in results if not r['output'])
+    skipped = sum(1 for r in results if r['skipped'])
+    print(f"\n✅ Batch complete: {len(results) - failed}/{len(results)} brands converted "
+          f"({skipped} unchanged) in {wall_seconds:.2f}s")
+    print(f"   Report: {report_path}")
+
+    return 1 if failed else 0
+
+
+# ============================================================================
+# WATCH MODE
+# ============================================================================
+
+def brand_changes(outputs_root: Path, changed: set) -> Dict[Path, set]:
+    """Group changed paths by the brand folder they belong to."""
+    root = os.path.abspath(outputs_root)
+    brands: Dict[Path, set] = {}
+    for path in changed:
+        relative = os.path.relpath(os.path.abspath(path), root)
+        parts = Path(relative).parts
+        if not parts or parts[0].startswith('.') or parts[0] == '..':
+            continue
+        name = parts[-1]
+        # Ignore our own manifest and editor/emitter temp files
+        if len(parts) > 1 and (name.startswith('.') or not name.endswith(('.json', '.md'))):
+            continue
+        brands.setdefault(outputs_root / parts[0], set()).add(path)
+    return brands
+
+
+def reconvert_brand(gdt_folder: Path, changed: set, output_dir: Path, accent_color: str,
+                    compact: bool, budget_kb: int, component_cache: Dict[str, object]) -> dict:
+    """
+    Reconvert one brand after a change, re-reading only the changed files.
+    The brand keeps its module's accent and hand-added fields
+    (merge_existing_module); accent_color is for new brands.
+    """
+    start = time.perf_counter()
+
+    for path in changed:
+        component_cache.pop(str(path), None)
+    index_brand_folder(gdt_folder, refresh=True)
+
+    data, report = convert_gdt_to_website(gdt_folder, accent_color, component_cache)
+    slug = slugify(data['brand']['name'])
+    output_path = output_dir / f"{slug}.ts"
+    merge_existing_module(data, output_path, accent_color)
+    _, written = write_brand_outputs(data, report, output_path, export_name(slug),
+                                     True, compact, budget_kb)
+
+    return {
+        'output': output_path,
+        'written': written,
+        'errors': report['errors'],
+        'seconds': time.perf_counter() - start
+    }
+
+
+def main_watch(args) -> int:
+    """Run --watch mode until interrupted."""
+    outputs_root = Path(args.watch)
+    if not outputs_root.is_dir():
+        print(f"❌ Error: outputs root not found: {outputs_root}")
+        return 1
+
+    output_dir = Path(args.output_dir)
+    watcher = create_watcher(outputs_root, poll=args.poll)
+    method = 'inotify' if isinstance(watcher, InotifyWatcher) else 'polling'
+    # Parsed component files, shared across reconversions
+    component_cache: Dict[str, object] = {}
+
+    print(f"Watching: {outputs_root} ({method}, {args.debounce_ms}ms debounce)")
+    print(f"Output: {output_dir}")
+    print("Press Ctrl+C to stop")
+
+    try:
+        for changed in watch_changes(watcher, args.debounce_ms / 1000):
+            for gdt_folder, paths in sorted(brand_changes(outputs_root, changed).items()):
+                if not gdt_folder.is_dir():
+                    print(f"   🗑️  {gdt_folder.name} removed")
+                    continue
+                names = ', '.join(sorted(p.name for p in paths if p != gdt_folder)) or 'folder'
+                try:
+                    result = reconvert_brand(gdt_folder, paths, output_dir, args.accent_color or DEFAULT_ACCENT,
+                                             args.compact, args.size_budget_kb, component_cache)
+                except FileNotFoundError:
+                    # Summary JSON not there yet - the analyst is still copying files
+                    print(f"   ⏳ {gdt_folder.name}: waiting for {SUMMARY_FILENAME}")
+                    continue
+                except Exception as e:
+                    print(f"   ❌ {gdt_folder.name}: {e}")
+                    continue
+
+                status = "⚠️" if result['errors'] else "✅"
+                note = '' if result['written'] else ' (unchanged)'
+                print(f"   {status} {gdt_folder.name} [{names}] → {result['output']}{note} "
+                      f"in {result['seconds'] * 1000:.0f}ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        watcher.close()
+
+    return 0
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -722,15 +1397,45 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
-    parser.add_argument('gdt_folder', type=str, help='Path to GDT output folder')
-    parser.add_argument('--accent-color', type=str, default='#E54B7B',
-                        help='Brand accent color (hex)')
+    parser.add_argument('gdt_folder', type=str, nargs='?', help='Path to GDT output folder')
+    parser.add_argument('--accent-color', type=str,
+                        help=f'Brand accent color (hex). Default: the accent the brand module already has, '
+                             f'else {DEFAULT_ACCENT}; with --batch/--watch only used for new brands')
     parser.add_argument('--output', type=str, help='Output TypeScript file path')
     parser.add_argument('--var-name', type=str, help='Export variable name')
     parser.add_argument('--report', action='store_true', help='Generate validation report')
+    parser.add_argument('--batch', type=str, metavar='OUTPUTS_ROOT',
+                        help='Convert every brand folder under this directory')
+    parser.add_argument('--output-dir', type=str, default='src/data',
+                        help='Output directory for --batch and --watch (default: src/data)')
+    parser.add_argument('--workers', type=int,
+                        help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Reconvert even if inputs and converter version are unchanged')
+    parser.add_argument('--compact', action='store_true',
+                        help='Emit the TypeScript module without whitespace')
+    parser.add_argument('--size-budget-kb', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f'Warn when a module exceeds this size (default: {DEFAULT_BUDGET_KB})')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record time and peak memory per stage and component (implies --force)')
+
+    parser.add_argument('--watch', type=str, metavar='OUTPUTS_ROOT',
+                        help='Watch this directory and reconvert brands as their files change')
+    parser.add_argument('--poll', action='store_true',
+                        help='Watch by polling instead of inotify (e.g. on network shares)')
+    parser.add_argument('--debounce-ms', type=int, default=200,
+                        help='Quiet period before reconverting in --watch (default: 200)')
 
     args = parser.parse_args()
 
+    if args.batch:
+        return main_batch(args)
+    if args.watch:
+        return main_watch(args)
+
+    if not args.gdt_folder:
+        parser.error('gdt_folder is required unless --batch or --watch is given')
+
     gdt_folder = Path(args.gdt_folder)
     if not gdt_folder.exists():
         print(f"❌ Error: GDT folder not found: {gdt_folder}")
@@ -740,37 +1445,57 @@ def main():
         print(f"Converting: {gdt_folder}")
         print(f"Source: JSON output files (v3 converter)")
 
-        data, report = convert_gdt_to_website(gdt_folder, args.accent_color)
+        options = {
+            'accent_color': args.accent_color,
+            'output': args.output,
+            'var_name': args.var_name,
+            'report': args.report,
+            'compact': args.compact,
+            'profile': args.profile
+        }
+        fingerprint = input_fingerprint(gdt_folder, CONVERTER_NAME, CONVERTER_VERSION, options)
+        if not (args.force or args.profile) and is_up_to_date(gdt_folder, fingerprint):
+            print(f"\n✅ Inputs unchanged since last conversion - nothing to do (use --force to reconvert)")
+            return 0
 
-        # Generate TypeScript output
-        var_name = args.var_name or slugify(data['brand']['name']).replace('-', '')
-        ts_code = to_typescript(data, var_name)
+        profiler = ConversionProfiler() if args.profile else None
+        with profiler.active() if profiler else nullcontext():
+            data, report = convert_gdt_to_website(gdt_folder, args.accent_color or DEFAULT_ACCENT)
 
-        if args.output:
-            output_path = Path(args.output)
-        else:
-            output_path = Path(f"src/data/{slugify(data['brand']['name'])}.ts")
+            var_name = args.var_name or export_name(slugify(data['brand']['name']))
+
+            if args.output:
+                output_path = Path(args.output)
+            else:
+                output_path = Path(f"src/data/{slugify(data['brand']['name'])}.ts")
+            merge_existing_module(data, output_path, DEFAULT_ACCENT)
+            if args.accent_color:
+                data['brand']['accentColor'] = args.accent_color
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            f.write(ts_code)
+            outputs, written = write_brand_outputs(data, report, output_path, var_name, args.report,
+                                                   args.compact, args.size_budget_kb, profiler)
+            with profile_stage('write'):
+                save_manifest(gdt_folder, fingerprint, outputs)
 
         complete = sum(1 for c in report['components'] if c.get('wsn_complete'))
         total = len(report['components'])
+        report_path = report_path_for(output_path, data['brand']['name'])
 
         print(f"\n✅ Converted successfully!")
-        print(f"   Output: {output_path}")
+        print(f"   Output: {output_path}{'' if str(output_path) in written else ' (unchanged)'}")
         print(f"   Brand: {data['brand']['name']}")
         print(f"   Score: {data['totalScore']}")
         print(f"   WSN Complete: {complete}/{total}")
 
         if args.report:
-            report_md = generate_report_markdown(report)
-            report_path = output_path.parent / f"{slugify(data['brand']['name'])}-conversion-report.md"
-            with open(report_path, 'w') as f:
-                f.write(report_md)
             print(f"   Report: {report_path}")
 
+        if profiler:
+            profile_path = profile_path_for(report_path)
+            profiler.dump_cprofile(profile_path)
+            print_profile_summary(profiler.summary())
+            print(f"   cProfile: {profile_path}")
+
         if report['warnings']:
             print(f"\n⚠️  Warnings ({len(report['warnings'])}):")
             for w in report['warnings'][:3]:
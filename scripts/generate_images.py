@@ -0,0 +1,713 @@
+#!/usr/bin/env python3
+"""
+Generate GDT images with gpt-image-1.5 images.edit from declarative specs.
+
+Every brand's images are described as data in scripts/image_specs/<brand>.toml
+(accent color, and per image: kind, output path, style block and subject
+prompt). One process renders any subset of them: the Espolon style
+reference (IMAGE-STANDARDS.md) is read into memory once, a single pooled
+async OpenAI client carries every request, and up to --concurrency calls run
+at once.
+
+    brand = "geico"
+    accent = "#0066CC"
+
+    [[images]]
+    kind = "cover"
+    output = "public/geico-cover.png"
+    subject = '''
+    SUBJECT MATTER - Geico (US Auto Insurance Leader): ...
+    '''
+
+The prompt is the image's `style` (or the brand's, or IMAGE-STANDARDS.md's
+BASE_STYLE) followed by its `subject`; {accent} and {background} in either
+are filled in from the spec and the image kind. Plain JSON job lists
+([{"brand", "kind", "prompt", "output"}, ...]) are accepted as well.
+
+Relative output paths are resolved against the project root. Each run is
+recorded as a batch in the SQLite job queue (generation_queue.py): rate
+limits, connection drops and timeouts are retried with exponential backoff
+and jitter, requests are spaced by a token bucket (--rpm), and `resume`
+picks a crashed or interrupted batch up where it stopped. Ctrl-C cancels the
+jobs still pending or in flight and keeps the images already written. Images
+are written to a temp file and renamed into place, so a cancelled job never
+leaves a partial PNG.
+
+Each generated image goes straight through the post-processing pipeline
+(image_pipeline.py) in memory: the background fix for its section and,
+optionally, --normalize-strokes, --variants, --quantize and --renditions,
+so every output file is decoded once and written once instead of being
+re-read by normalize_strokes.py, fix_image_background.py,
+quantize_palette.py and build_image_variants.py.
+--raw writes the images exactly as generated.
+
+The style reference is uploaded in its compact form (style_reference.py):
+no larger than the image being generated, palette-quantized and
+recompressed, built once and cached. It is about 6% of the original file's
+size; --full-ref uploads the original file.
+
+With --candidates N each request asks for N images and only the one
+closest to the style reference is kept (style_score.py: stroke width
+histogram, edge density and accent coverage); the ranking of all N goes to
+<output>.scores.json beside it.
+
+Results are cached in .image-cache/ keyed on the style reference bytes,
+prompt, model and size (generation_cache.py), so re-running specs only pays
+for the images whose inputs changed. --force regenerates regardless.
+
+Usage:
+  python scripts/generate_images.py run --list
+  python scripts/generate_images.py run --only geico ripple
+  python scripts/generate_images.py run --kind cover --concurrency 6 --rpm 10
+  python scripts/generate_images.py run scripts/image_specs/geico.toml --force
+  python scripts/generate_images.py run --only zyn --variants card --quantize --renditions
+  python scripts/generate_images.py run --only hogwarts-legacy --kind cover --candidates 4
+  python scripts/generate_images.py run jobs.json
+  python scripts/generate_images.py status
+  python scripts/generate_images.py resume --retry-failed
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+import tomllib
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+
+from build_image_variants import MANIFEST_PATH, load_manifest, save_manifest, update_manifest
+from conversion_cache import hash_bytes
+from fix_image_background import COLORS, DEFAULT_THRESHOLD, atomic_output
+from generation_cache import DEFAULT_MAX_BYTES, GenerationCache, cache_key
+from generation_queue import BACKOFF_BASE, DEFAULT_MAX_ATTEMPTS, JobQueue, QueuedJob, TokenBucket, backoff_delay
+from image_pipeline import PipelineOptions, PipelineResult, process_image
+from normalize_strokes import reference_stroke
+from style_reference import size_side, style_ref_bytes
+from style_score import StyleProfile, profile_file, rank_candidates, write_scores
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PUBLIC_DIR = PROJECT_ROOT / 'public'
+SPEC_DIR = Path(__file__).resolve().parent / 'image_specs'
+
+# Style reference - ensures consistent bold line weight
+STYLE_REF = PUBLIC_DIR / 'espolon-cover.png'
+
+MODEL = "gpt-image-1.5"
+SIZE = "1024x1024"
+
+# BASE_STYLE from IMAGE-STANDARDS.md, for specs that don't carry their own style
+BASE_STYLE = """Create an illustration in EXACTLY the same artistic style as this reference image:
+- Same LINE WEIGHT - bold, confident strokes (not ultra-thin)
+- Same flat, graphic illustration approach
+- Same density of decorative elements filling the space
+- Same corner flourishes and border treatment
+- Same dark charcoal background
+- Same off-white cream linework
+
+COLOR PALETTE (match the reference):
+- Background: Dark charcoal ({background})
+- Primary lines: Off-white cream (#EDE8DF)
+- Accent color: {accent} for select highlights (10-15% of elements)
+
+CRITICAL - NO TEXT WHATSOEVER:
+- NO words, letters, numbers, percentages, or any typography
+- NO labels, captions, taglines, or text of any kind
+- Communicate ALL information through VISUAL SYMBOLS ONLY
+
+Keep the EXACT same line weight, density, and style as the reference. Square format."""
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 300  # seconds per attempt; generations usually take 30-60 s
+DEFAULT_RPM = 10       # images.edit requests per minute across all workers
+
+# Job statuses
+DONE = 'done'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+CANCELLED = 'cancelled'
+
+
+def get_api_key():
+    if os.environ.get('OPENAI_API_KEY'):
+        return os.environ['OPENAI_API_KEY']
+    key_file = Path.home() / '.openai_key'
+    if key_file.exists():
+        return key_file.read_text().strip()
+    raise ValueError("No OpenAI API key found")
+
+
+# ============================================================================
+# JOBS
+# ============================================================================
+
+@dataclass
+class ImageJob:
+    brand: str
+    kind: str  # cover, growth-summary, ...
+    prompt: str
+    output: Path
+    style_ref: Path = STYLE_REF
+    model: str = MODEL
+    size: str = SIZE
+    id: Optional[int] = None  # queue row
+    not_before: float = 0.0   # time.time() of the earliest next attempt
+
+    @property
+    def name(self) -> str:
+        return f"{self.brand} {self.kind}"
+
+
+@dataclass
+class JobResult:
+    job: ImageJob
+    status: str
+    seconds: float = 0.0
+    bytes: int = 0
+    error: Optional[str] = None
+    cached: bool = False
+    attempts: int = 0
+    pipeline: Optional[PipelineResult] = None
+    distance: Optional[float] = None  # style distance of the promoted candidate (best-of-N only)
+
+
+def load_jobs(path: Path) -> List[ImageJob]:
+    """Read a JSON list of jobs; relative paths are resolved against the project root."""
+    with open(path, 'r') as f:
+        entries = json.load(f)
+
+    jobs = []
+    for i, entry in enumerate(entries):
+        missing = [key for key in ('brand', 'kind', 'prompt', 'output') if not entry.get(key)]
+        if missing:
+            raise ValueError(f"{path}: job {i} is missing {', '.join(missing)}")
+        options = {key: entry[key] for key in ('model', 'size') if key in entry}
+        if 'style_ref' in entry:
+            options['style_ref'] = PROJECT_ROOT / entry['style_ref']
+        jobs.append(ImageJob(brand=entry['brand'], kind=entry['kind'], prompt=entry['prompt'],
+                             output=PROJECT_ROOT / entry['output'], **options))
+    return jobs
+
+
+def spec_background(kind: str) -> str:
+    """Covers sit on the page background, everything else in the growth systems section."""
+    return COLORS['page'] if kind == 'cover' else COLORS['secondary']
+
+
+def spec_prompt(style: str, subject: str, accent: str, background: str) -> str:
+    prompt = style.strip() + "\n\n" + subject.strip()
+    return prompt.replace('{accent}', accent).replace('{background}', background)
+
+
+def load_specs(path: Path) -> List[ImageJob]:
+    """Jobs for every image in a brand spec file (see the module docstring)."""
+    with open(path, 'rb') as f:
+        spec = tomllib.load(f)
+
+    missing = [key for key in ('brand', 'accent', 'images') if not spec.get(key)]
+    if missing:
+        raise ValueError(f"{path}: missing {', '.join(missing)}")
+    options = {key: spec[key] for key in ('model', 'size') if key in spec}
+    if 'style_ref' in spec:
+        options['style_ref'] = PROJECT_ROOT / spec['style_ref']
+
+    jobs = []
+    for i, image in enumerate(spec['images']):
+        missing = [key for key in ('kind', 'output', 'subject') if not image.get(key)]
+        if missing:
+            raise ValueError(f"{path}: image {i} is missing {', '.join(missing)}")
+        style = image.get('style', spec.get('style', BASE_STYLE))
+        prompt = spec_prompt(style, image['subject'], spec['accent'], spec_background(image['kind']))
+        jobs.append(ImageJob(brand=spec['brand'], kind=image['kind'], prompt=prompt,
+                             output=PROJECT_ROOT / image['output'], **options))
+    return jobs
+
+
+def load_sources(paths: List[Path]) -> List[ImageJob]:
+    """Jobs from spec files (.toml), JSON job lists (.json) and directories of spec files."""
+    jobs = []
+    for path in paths:
+        if path.is_dir():
+            for spec in sorted(path.glob('*.toml')):
+                jobs.extend(load_specs(spec))
+        elif path.suffix == '.toml':
+            jobs.extend(load_specs(path))
+        else:
+            jobs.extend(load_jobs(path))
+    return jobs
+
+
+def queue_fields(job: ImageJob) -> dict:
+    return {'brand': job.brand, 'kind': job.kind, 'prompt': job.prompt, 'output': str(job.output),
+            'style_ref': str(job.style_ref), 'model': job.model, 'size': job.size}
+
+
+def from_queue(row: QueuedJob) -> ImageJob:
+    return ImageJob(brand=row.brand, kind=row.kind, prompt=row.prompt, output=Path(row.output),
+                    style_ref=Path(row.style_ref), model=row.model, size=row.size, id=row.id,
+                    not_before=row.next_attempt_at)
+
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+# Worth another attempt: the same request may succeed later
+RETRYABLE = (RateLimitError, APIConnectionError, InternalServerError, asyncio.TimeoutError, urllib.error.URLError)
+
+
+def retry_after(error: Exception) -> float:
+    """Seconds the server asked us to wait (Retry-After on a 429/503), or 0."""
+    response = getattr(error, 'response', None)
+    try:
+        return float(response.headers.get('retry-after', 0))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+
+def describe(error: Exception, timeout: float) -> str:
+    if isinstance(error, asyncio.TimeoutError):
+        return f"no result after {timeout:.0f}s"
+    return f"{type(error).__name__}: {error}"
+
+
+async def image_bytes(item) -> bytes:
+    """PNG bytes of one images response item (b64_json, or a URL to download)."""
+    if item.b64_json:
+        return base64.b64decode(item.b64_json)
+
+    def download():
+        with urllib.request.urlopen(item.url) as response:
+            return response.read()
+    return await asyncio.to_thread(download)
+
+
+async def generate(client: AsyncOpenAI, job: ImageJob, style_ref: bytes, n: int = 1) -> List[bytes]:
+    """PNG bytes of the `n` images one images.edit call generates for a job."""
+    response = await client.images.edit(
+        model=job.model,
+        image=(job.style_ref.name, style_ref, 'image/png'),
+        prompt=job.prompt,
+        size=job.size,
+        n=n
+    )
+    return list(await asyncio.gather(*(image_bytes(item) for item in response.data)))
+
+
+def _write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_output(path) as f:
+        f.write(data)
+
+
+@dataclass
+class Driver:
+    """
+    Shared state of one run: the client, the concurrency and rate limits,
+    the optional cache and queue that job outcomes are recorded in, and the
+    post-processing applied before an image is written (None: write the
+    generated bytes as they are).
+    """
+    client: AsyncOpenAI
+    concurrency: int = DEFAULT_CONCURRENCY
+    timeout: float = DEFAULT_TIMEOUT
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    bucket: Optional[TokenBucket] = None
+    cache: Optional[GenerationCache] = None
+    queue: Optional[JobQueue] = None
+    force: bool = False
+    backoff_base: float = BACKOFF_BASE
+    verbose: bool = True
+    pipeline: Optional[PipelineOptions] = None
+    shrink_refs: bool = False         # upload compact style references (style_reference.py)
+    ref_size: Optional[int] = None    # cap on their longest side; the job size always is one
+    candidates: int = 1               # images per request; the one closest to the reference's style is kept
+
+    def __post_init__(self):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.profiles: Dict[Path, StyleProfile] = {}
+
+    def _mark(self, method: str, job: ImageJob, *args):
+        if self.queue and job.id is not None:
+            return getattr(self.queue, method)(job.id, *args)
+
+    def load_style_ref(self, path: Path, size: str) -> bytes:
+        if not self.shrink_refs:
+            return path.read_bytes()
+        return style_ref_bytes(path, min(filter(None, (size_side(size), self.ref_size)), default=None))
+
+    def pick(self, job: ImageJob, candidates: List[bytes]) -> Tuple[bytes, Optional[List[dict]]]:
+        """The candidate to keep and, for more than one, the ranking of all of them."""
+        if len(candidates) == 1:
+            return candidates[0], None
+        ranking = rank_candidates(candidates, self.profiles[job.style_ref])
+        return candidates[ranking[0]['index']], ranking
+
+    async def store(self, job: ImageJob, data: bytes) -> JobResult:
+        """Write generated bytes, through the pipeline if there is one; status and timing are the caller's."""
+        if self.pipeline is None:
+            await asyncio.to_thread(_write, job.output, data)
+            return JobResult(job, DONE, bytes=len(data))
+        processed = await asyncio.to_thread(process_image, data, job.output, spec_background(job.kind),
+                                            self.pipeline)
+        return JobResult(job, DONE, bytes=processed.bytes, pipeline=processed)
+
+    async def run_job(self, job: ImageJob, style_ref: bytes, key: str) -> JobResult:
+        start = time.perf_counter()
+        if self.cache and not self.force:
+            data = await asyncio.to_thread(self.cache.get, key)
+            if data is not None:
+                try:
+                    result = await self.store(job, data)
+                except Exception as e:
+                    self._mark('mark_failed', job, describe(e, self.timeout))
+                    return JobResult(job, FAILED, time.perf_counter() - start, error=describe(e, self.timeout))
+                self._mark('mark_done', job)
+                result.seconds, result.cached = time.perf_counter() - start, True
+                return result
+
+        attempt = 0
+        busy = 0.0  # time spent in attempts, not waiting for a slot or a retry
+        while True:
+            # Backoff happens outside the semaphore so other jobs keep the slots busy
+            wait = job.not_before - time.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            async with self.semaphore:
+                if self.bucket:
+                    await self.bucket.acquire()
+                attempt = self._mark('mark_running', job) or attempt + 1
+                start = time.perf_counter()
+                try:
+                    candidates = await asyncio.wait_for(generate(self.client, job, style_ref, self.candidates),
+                                                        self.timeout)
+                    data, ranking = await asyncio.to_thread(self.pick, job, candidates)
+                    if self.cache:
+                        await asyncio.to_thread(self.cache.put, key, data)
+                    result = await self.store(job, data)
+                    if ranking:
+                        await asyncio.to_thread(write_scores, job.output, job.style_ref,
+                                                self.profiles[job.style_ref], ranking)
+                        result.distance = ranking[0]['distance']['total']
+                except asyncio.CancelledError:
+                    self._mark('mark_pending', job)
+                    raise
+                except Exception as e:
+                    busy += time.perf_counter() - start
+                    error = describe(e, self.timeout)
+                    if isinstance(e, RETRYABLE) and attempt < self.max_attempts:
+                        delay = max(backoff_delay(attempt, self.backoff_base), retry_after(e))
+                        self._mark('mark_retry', job, error, delay)
+                        job.not_before = time.time() + delay
+                        if self.verbose:
+                            print(f"   ↻ {job.name}: {error}; retrying in {delay:.1f}s "
+                                  f"(attempt {attempt}/{self.max_attempts})")
+                        continue
+                    self._mark('mark_failed', job, error)
+                    status = TIMEOUT if isinstance(e, asyncio.TimeoutError) else FAILED
+                    return JobResult(job, status, busy, error=error, attempts=attempt)
+
+            self._mark('mark_done', job)
+            result.seconds, result.attempts = busy + time.perf_counter() - start, attempt
+            return result
+
+    async def run(self, jobs: List[ImageJob],
+                  on_result: Optional[Callable[[JobResult], None]] = None) -> List[JobResult]:
+        """
+        Run jobs with at most `concurrency` in flight. Returns one result per
+        job, in job order. Jobs found in the cache are served from it unless
+        `force`. If the caller is cancelled, unfinished jobs are cancelled
+        (and put back to pending in the queue) and reported as such before
+        the cancellation propagates.
+        """
+        # Each distinct style reference (per output size) is prepared and hashed once per run
+        style_refs: Dict[Tuple[Path, str], bytes] = {}
+        for job in jobs:
+            if (job.style_ref, job.size) not in style_refs:
+                style_refs[job.style_ref, job.size] = await asyncio.to_thread(self.load_style_ref, job.style_ref,
+                                                                              job.size)
+        style_hashes = {ref: hash_bytes(data) for ref, data in style_refs.items()}
+        # Candidates are ranked against the full reference, not the compact upload
+        if self.candidates > 1:
+            for path in {job.style_ref for job in jobs} - self.profiles.keys():
+                self.profiles[path] = await asyncio.to_thread(profile_file, path)
+
+        tasks = [
+            asyncio.create_task(self.run_job(
+                job, style_refs[job.style_ref, job.size],
+                cache_key(style_hashes[job.style_ref, job.size], job.prompt, job.model, job.size, self.candidates)
+            ))
+            for job in jobs
+        ]
+        finished = set()
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                finished.add(id(result.job))
+                if on_result:
+                    on_result(result)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if on_result:
+                for job in jobs:
+                    if id(job) not in finished:
+                        on_result(JobResult(job, CANCELLED))
+            raise
+        return [task.result() for task in tasks]
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+STATUS_ICONS = {DONE: "✅", FAILED: "❌", TIMEOUT: "⏱️ ", CANCELLED: "⚠️ "}
+
+
+@dataclass
+class Progress:
+    """Driver.run() on_result callback: prints a line per finished job and keeps the results."""
+    jobs: List[ImageJob]
+    results: List[JobResult] = field(default_factory=list)
+
+    def __call__(self, result: JobResult) -> None:
+        self.results.append(result)
+        detail = f"{result.bytes / 1e6:.1f} MB" if result.status == DONE else (result.error or result.status)
+        if result.pipeline and result.pipeline.strokes and result.pipeline.strokes['radius']:
+            strokes = result.pipeline.strokes
+            detail += f", strokes {strokes['before']:.0f} → {strokes['after']:.0f} px"
+        if result.distance is not None:
+            detail += f", style distance {result.distance:.2f}"
+        if result.cached:
+            detail += ", cached"
+        print(f"[{len(self.results)}/{len(self.jobs)}] {STATUS_ICONS[result.status]} {result.job.name} "
+              f"({result.seconds:.1f}s, {detail})")
+
+    def in_job_order(self) -> List[JobResult]:
+        order = {id(job): i for i, job in enumerate(self.jobs)}
+        return sorted(self.results, key=lambda r: order[id(r.job)])
+
+
+def display_path(path: Path) -> str:
+    return str(path.relative_to(PROJECT_ROOT)) if path.is_relative_to(PROJECT_ROOT) else str(path)
+
+
+def print_summary(results: List[JobResult], wall_seconds: float) -> None:
+    width = max([len(r.job.name) for r in results] + [3])
+    print(f"\n{'Job':<{width}} | {'Status':<9} | {'Tries':>5} | {'Time (s)':>8} | Output")
+    print(f"{'-' * width}-+-{'-' * 9}-+-{'-' * 5}-+-{'-' * 8}-+-{'-' * 30}")
+    for r in results:
+        detail = display_path(r.job.output) if r.status == DONE else (r.error or '-')
+        status = 'cached' if r.cached else r.status
+        print(f"{r.job.name:<{width}} | {status:<9} | {r.attempts:>5} | {r.seconds:>8.1f} | {detail}")
+
+    counts = {status: sum(1 for r in results if r.status == status) for status in STATUS_ICONS}
+    busy = sum(r.seconds for r in results if not r.cached)
+    retries = sum(max(r.attempts - 1, 0) for r in results)
+    print(f"\n📊 {counts[DONE]} done, {counts[FAILED]} failed, {counts[TIMEOUT]} timed out, "
+          f"{counts[CANCELLED]} cancelled, {retries} retries")
+    if busy:
+        print(f"⏱️  Wall time {wall_seconds:.1f}s for {busy:.1f}s of generation "
+              f"({busy / wall_seconds:.1f}x concurrency)")
+
+
+def print_cache_report(cache: GenerationCache, freed: int) -> None:
+    stats = cache.stats
+    mb = 1024 * 1024
+    print(f"🗄️  Cache: {stats.hits} hits, {stats.misses} misses, {stats.stored} stored; "
+          f"{cache.size() / mb:.1f} of {cache.max_bytes / mb:.0f} MB used"
+          + (f", evicted {stats.evicted} ({freed / mb:.1f} MB)" if stats.evicted else ""))
+
+
+def print_job_list(jobs: List[ImageJob]) -> None:
+    width = max([len(job.name) for job in jobs] + [3])
+    print(f"{'Job':<{width}} | {'Prompt':>6} | Output")
+    print(f"{'-' * width}-+-{'-' * 6}-+-{'-' * 30}")
+    for job in jobs:
+        print(f"{job.name:<{width}} | {len(job.prompt):>6} | {display_path(job.output)}")
+    print(f"\n{len(jobs)} images")
+
+
+def print_batch_status(queue: JobQueue, batch: int) -> None:
+    rows = queue.jobs(batch)
+    width = max([len(f"{r.brand} {r.kind}") for r in rows] + [3])
+    print(f"Batch {batch}")
+    print(f"\n{'Job':<{width}} | {'Status':<7} | {'Tries':>5} | Output / last error")
+    print(f"{'-' * width}-+-{'-' * 7}-+-{'-' * 5}-+-{'-' * 30}")
+    for r in rows:
+        detail = display_path(Path(r.output)) if r.status == 'done' or not r.error else r.error
+        print(f"{r.brand + ' ' + r.kind:<{width}} | {r.status:<7} | {r.attempts:>5} | {detail}")
+    counts = queue.counts(batch)
+    print(f"\n📊 {', '.join(f'{count} {status}' for status, count in counts.items())}")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+async def _main(args, jobs: List[ImageJob], queue: JobQueue) -> List[JobResult]:
+    # The queue owns retries, so the client does not retry on its own
+    client = AsyncOpenAI(api_key=get_api_key(), base_url=args.base_url, timeout=args.timeout, max_retries=0)
+    cache = None if args.no_cache else GenerationCache(max_bytes=args.cache_size * 1024 * 1024)
+    bucket = TokenBucket(args.rpm / 60, burst=args.concurrency) if args.rpm else None
+    driver = Driver(client, args.concurrency, args.timeout, args.max_attempts, bucket, cache, queue, args.force,
+                    pipeline=pipeline_options(args), shrink_refs=not args.full_ref, ref_size=args.ref_size,
+                    candidates=args.candidates)
+    progress = Progress(jobs)
+    start = time.perf_counter()
+    try:
+        return await driver.run(jobs, progress)
+    finally:
+        results = progress.in_job_order()
+        print_summary(results, time.perf_counter() - start)
+        if cache:
+            print_cache_report(cache, cache.evict())
+        save_renditions(results)
+        await client.close()
+
+
+def pipeline_options(args) -> Optional[PipelineOptions]:
+    if args.raw:
+        return None
+    stroke_target = None
+    if args.normalize_strokes or args.stroke_target is not None:
+        stroke_target = args.stroke_target if args.stroke_target is not None else reference_stroke(STYLE_REF)
+    return PipelineOptions(threshold=args.threshold, variants=args.variants or (), quantize=args.quantize,
+                           renditions=args.renditions, stroke_target=stroke_target)
+
+
+def save_renditions(results: List[JobResult]) -> None:
+    """Record the renditions the pipeline built in the image manifest (also after a cancelled run)."""
+    entries = {r.pipeline.url: r.pipeline.manifest_entry for r in results
+               if r.pipeline and r.pipeline.manifest_entry}
+    if not entries:
+        return
+    manifest = load_manifest()
+    removed = update_manifest(manifest, entries)
+    save_manifest(manifest)
+    print(f"📝 Manifest: {MANIFEST_PATH.relative_to(PROJECT_ROOT)} ({len(entries)} images updated, "
+          f"{removed} stale files removed)")
+
+
+def execute(args, queue: JobQueue, batch: int, jobs: List[ImageJob]) -> None:
+    print(f"Batch {batch}: generating {len(jobs)} images ({args.concurrency} at a time, "
+          f"{f'{args.rpm:g}' if args.rpm else 'unlimited'} per minute, {args.timeout:.0f}s timeout, "
+          f"up to {args.max_attempts} attempts)")
+    try:
+        results = asyncio.run(_main(args, jobs, queue))
+    except KeyboardInterrupt:
+        print("\n⚠️  Cancelled; images already saved were kept")
+        print(f"   Continue with: python scripts/generate_images.py resume --batch {batch}")
+        sys.exit(130)
+
+    written = [str(r.job.output) for r in results if r.status == DONE]
+    if written and args.raw:
+        print(f"\nNext step: Run post-processing to fix background color:")
+        print(f"  python scripts/fix_image_background.py {' '.join(written)}")
+    if any(r.status != DONE for r in results):
+        print(f"\nRetry failed jobs with: python scripts/generate_images.py resume --batch {batch} --retry-failed")
+        sys.exit(1)
+
+
+def main():
+    run_options = argparse.ArgumentParser(add_help=False)
+    run_options.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                             help=f'Requests in flight at once (default: {DEFAULT_CONCURRENCY})')
+    run_options.add_argument('--rpm', type=float, default=DEFAULT_RPM,
+                             help=f'Requests per minute, 0 for no limit (default: {DEFAULT_RPM})')
+    run_options.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                             help=f'Seconds before an attempt is abandoned (default: {DEFAULT_TIMEOUT})')
+    run_options.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                             help=f'Attempts per job for retryable errors (default: {DEFAULT_MAX_ATTEMPTS})')
+    run_options.add_argument('--base-url', help='API base URL, e.g. http://127.0.0.1:8011/v1 for '
+                                                'mock_images_server.py (default: OPENAI_BASE_URL or OpenAI)')
+    run_options.add_argument('--candidates', type=int, default=1, choices=range(1, 11), metavar='N',
+                             help='Generate N images per job and keep the closest to the style reference '
+                                  '(scores in <output>.scores.json)')
+    run_options.add_argument('--ref-size', type=int, metavar='PX',
+                             help='Longest side of the uploaded style reference (default: the image size)')
+    run_options.add_argument('--full-ref', action='store_true',
+                             help='Upload the style reference file as is instead of the compact version')
+    run_options.add_argument('--raw', action='store_true',
+                             help='Write generated images untouched (no background fix, variants or renditions)')
+    run_options.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD,
+                             help=f'Background fix: RGB below this is background (default: {DEFAULT_THRESHOLD})')
+    run_options.add_argument('--variants', nargs='+', choices=sorted(COLORS), metavar='NAME',
+                             help=f'Also write background variants ({", ".join(COLORS)})')
+    run_options.add_argument('--normalize-strokes', action='store_true',
+                             help="Thicken or thin line work to the style reference's stroke width")
+    run_options.add_argument('--stroke-target', type=float, metavar='PX',
+                             help='Stroke width to normalize to, in px at 1024 wide (implies --normalize-strokes)')
+    run_options.add_argument('--quantize', action='store_true', help='Write indexed PNGs in the site palette')
+    run_options.add_argument('--renditions', action='store_true',
+                             help='Build WebP/AVIF renditions and update src/data/image-manifest.json')
+    run_options.add_argument('--force', action='store_true', help='Regenerate even if a cached result exists')
+    run_options.add_argument('--no-cache', action='store_true', help='Neither read nor write the cache')
+    run_options.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024), metavar='MB',
+                             help=f'Cache size limit; least recently used entries are evicted '
+                                  f'(default: {DEFAULT_MAX_BYTES // (1024 * 1024)})')
+
+    parser = argparse.ArgumentParser(description='Generate GDT images concurrently with images.edit')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', parents=[run_options], help='Queue images as a new batch and run it')
+    run.add_argument('sources', type=Path, nargs='*', default=[SPEC_DIR],
+                     help='Spec files (.toml), JSON job lists or directories of specs '
+                          '(default: scripts/image_specs/)')
+    run.add_argument('--only', nargs='+', metavar='BRAND', help='Run only these brands')
+    run.add_argument('--kind', nargs='+', help='Run only these image kinds (cover, growth-summary, ...)')
+    run.add_argument('--list', action='store_true', help='List the selected images and exit')
+    resume = commands.add_parser('resume', parents=[run_options],
+                                 help='Run the unfinished jobs of a batch (default: the latest)')
+    resume.add_argument('--batch', type=int)
+    resume.add_argument('--retry-failed', action='store_true', help='Also re-run jobs that failed for good')
+    status = commands.add_parser('status', help='Show the jobs of a batch (default: the latest)')
+    status.add_argument('--batch', type=int)
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        jobs = load_sources(args.sources)
+        if args.only:
+            jobs = [job for job in jobs if job.brand in args.only]
+        if args.kind:
+            jobs = [job for job in jobs if job.kind in args.kind]
+        if not jobs:
+            print("Error: no jobs to run")
+            sys.exit(1)
+        if args.list:
+            print_job_list(jobs)
+            return
+
+    with JobQueue() as queue:
+        if args.command == 'run':
+            batch = queue.add_batch([queue_fields(job) for job in jobs])
+            jobs = [from_queue(row) for row in queue.jobs(batch)]
+            execute(args, queue, batch, jobs)
+            return
+
+        batch = args.batch or queue.latest_batch()
+        if batch is None:
+            print("Error: the queue has no batches yet")
+            sys.exit(1)
+        if args.command == 'status':
+            print_batch_status(queue, batch)
+            return
+
+        jobs = [from_queue(row) for row in queue.reopen(batch, args.retry_failed)]
+        if not jobs:
+            print(f"✅ Batch {batch} has nothing left to run")
+            print_batch_status(queue, batch)
+            return
+        execute(args, queue, batch, jobs)
+
+
+if __name__ == "__main__":
+    main()
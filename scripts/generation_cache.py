@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Content-addressed disk cache for images.edit results.
+
+An entry is keyed on everything the generated image depends on: the style
+reference bytes, the full prompt (BASE_STYLE + subject), the model and the
+size. Re-running a job whose inputs are unchanged returns the stored PNG
+instead of paying for another generation, so editing one brand's prompt only
+re-bills that brand.
+
+Entries are plain <key>.png files. A hit refreshes the file's mtime, and
+evict() deletes the least recently used files until the cache fits its size
+budget.
+
+    cache = GenerationCache(CACHE_DIR, max_bytes=512 * 1024 * 1024)
+    key = cache_key(hash_bytes(style_ref_bytes), prompt, model, size)
+    data = cache.get(key)
+    if data is None:
+        data = generate(...)
+        cache.put(key, data)
+    cache.evict()
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from conversion_cache import hash_bytes
+from fix_image_background import atomic_output
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / '.image-cache'
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # roughly 300 images at 1024x1024
+
+
+def cache_key(style_ref_hash: str, prompt: str, model: str, size: str, candidates: int = 1) -> str:
+    """
+    SHA-256 of every input that shapes a generated image (style_ref_hash:
+    hash_bytes of the reference). A best-of-N pick is a different result
+    from a single generation, so candidates > 1 is part of the key.
+    """
+    inputs = {
+        'style_ref': style_ref_hash,
+        'prompt': prompt,
+        'model': model,
+        'size': size
+    }
+    if candidates > 1:
+        inputs['candidates'] = candidates
+    inputs = json.dumps(inputs, sort_keys=True)
+    return hash_bytes(inputs.encode('utf-8'))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    evicted: int = 0
+    evicted_bytes: int = 0
+
+
+class GenerationCache:
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.png"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Stored bytes for key, or None. A hit marks the entry as recently used."""
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with atomic_output(self.path(key)) as f:
+            f.write(data)
+        self.stats.stored += 1
+
+    def size(self) -> int:
+        if not self.directory.exists():
+            return 0
+        return sum(entry.stat().st_size for entry in os.scandir(self.directory)
+                   if entry.name.endswith('.png'))
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits max_bytes; returns bytes freed."""
+        if not self.directory.exists():
+            return 0
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.png') and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        for _, size, path in sorted(entries):
+            if total - freed <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            freed += size
+            self.stats.evicted += 1
+        self.stats.evicted_bytes += freed
+        return freed
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Persistent job queue, retry policy and rate limiter for image generation.
+
+Every job of a batch is a row in a small SQLite database (.image-queue.db)
+that moves through pending -> running -> done | failed. State is committed
+on every transition, so after a crash, a Ctrl-C or a dropped connection the
+database says exactly which images landed, and `generate_images.py resume`
+re-runs only the rest of the batch.
+
+Transient errors (rate limits, connection drops, timeouts, 5xx) are retried
+with exponential backoff and full jitter; the time of the next attempt is
+stored with the job so a resumed batch honors it. TokenBucket spaces out
+requests so a batch stays under the account's images-per-minute limit
+instead of discovering it through 429s.
+"""
+
+import asyncio
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+QUEUE_PATH = Path(__file__).resolve().parent.parent / '.image-queue.db'
+
+# Queue states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+DEFAULT_MAX_ATTEMPTS = 5
+BACKOFF_BASE = 2.0   # seconds before the first retry
+BACKOFF_CAP = 120.0  # longest wait between attempts
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    batch INTEGER NOT NULL,
+    brand TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    output TEXT NOT NULL,
+    style_ref TEXT NOT NULL,
+    model TEXT NOT NULL,
+    size TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_batch_status ON jobs (batch, status);
+"""
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Seconds to wait after failed attempt number `attempt` (1-based): full jitter over base * 2^(n-1)."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+# ============================================================================
+# QUEUE
+# ============================================================================
+
+@dataclass
+class QueuedJob:
+    id: int
+    batch: int
+    brand: str
+    kind: str
+    prompt: str
+    output: str
+    style_ref: str
+    model: str
+    size: str
+    status: str
+    attempts: int
+    next_attempt_at: float
+    error: Optional[str]
+    updated_at: float
+
+
+class JobQueue:
+    """
+    SQLite-backed job states. Used from the event loop thread only; every
+    method commits before returning.
+    """
+
+    def __init__(self, path: Path = QUEUE_PATH):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _update(self, job_id: int, **fields) -> None:
+        fields['updated_at'] = time.time()
+        assignments = ', '.join(f"{name} = ?" for name in fields)
+        with self.db:
+            self.db.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def latest_batch(self) -> Optional[int]:
+        return self.db.execute("SELECT MAX(batch) FROM jobs").fetchone()[0]
+
+    def add_batch(self, jobs: List[dict]) -> int:
+        """Insert jobs (dicts of brand, kind, prompt, output, style_ref, model, size) as a new batch."""
+        batch = (self.latest_batch() or 0) + 1
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO jobs (batch, brand, kind, prompt, output, style_ref, model, size, updated_at) "
+                "VALUES (:batch, :brand, :kind, :prompt, :output, :style_ref, :model, :size, :updated_at)",
+                [{**job, 'batch': batch, 'updated_at': now} for job in jobs]
+            )
+        return batch
+
+    def jobs(self, batch: int, statuses: Optional[List[str]] = None) -> List[QueuedJob]:
+        query = "SELECT * FROM jobs WHERE batch = ?"
+        params: list = [batch]
+        if statuses:
+            query += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            params += statuses
+        return [QueuedJob(**row) for row in self.db.execute(query + " ORDER BY id", params)]
+
+    def reopen(self, batch: int, retry_failed: bool = False) -> List[QueuedJob]:
+        """
+        Jobs of `batch` still to run: pending ones, running ones (a crashed
+        run left them there) and, with retry_failed, failed ones with a fresh
+        attempt budget.
+        """
+        statuses = [RUNNING] + ([FAILED] if retry_failed else [])
+        with self.db:
+            self.db.execute(
+                f"UPDATE jobs SET status = ?, attempts = CASE WHEN status = ? THEN 0 ELSE attempts END, "
+                f"updated_at = ? WHERE batch = ? AND status IN ({', '.join('?' for _ in statuses)})",
+                (PENDING, FAILED, time.time(), batch, *statuses)
+            )
+        return self.jobs(batch, [PENDING])
+
+    def mark_running(self, job_id: int) -> int:
+        """Record the start of an attempt; returns the attempt number."""
+        with self.db:
+            self.db.execute("UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                            (RUNNING, time.time(), job_id))
+        return self.db.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()[0]
+
+    def mark_done(self, job_id: int) -> None:
+        self._update(job_id, status=DONE, error=None)
+
+    def mark_retry(self, job_id: int, error: str, delay: float) -> None:
+        self._update(job_id, status=PENDING, error=error, next_attempt_at=time.time() + delay)
+
+    def mark_failed(self, job_id: int, error: str) -> None:
+        self._update(job_id, status=FAILED, error=error)
+
+    def mark_pending(self, job_id: int) -> None:
+        """Put an interrupted job back so resume runs it again."""
+        self._update(job_id, status=PENDING)
+
+    def counts(self, batch: int) -> dict:
+        counts = {status: 0 for status in (PENDING, RUNNING, DONE, FAILED)}
+        for status, count in self.db.execute(
+                "SELECT status, COUNT(*) FROM jobs WHERE batch = ? GROUP BY status", (batch,)):
+            counts[status] = count
+        return counts
+
+
+# ============================================================================
+# RATE LIMIT
+# ============================================================================
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, holding at most `burst`.
+    acquire() waits until a token is available; waiters are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+In-memory post-processing for freshly generated images.
+
+Takes the PNG bytes an images.edit call returned and, with one decode and
+one dark-pixel mask, produces everything that used to need separate passes
+over files in public/:
+
+  - optional stroke weight normalization (normalize_strokes.py)
+  - the background fix (fix_image_background.py) for the image's section
+  - optional background variants (e.g. zyn-cover-card.png)
+  - optional palette quantization of every written PNG (quantize_palette.py)
+  - optional responsive WebP/AVIF renditions and their manifest entry
+    (build_image_variants.py)
+
+Each output file is encoded once and written once (atomically); nothing is
+re-read from disk.
+
+    options = PipelineOptions(variants=('card',), renditions=True)
+    result = process_image(png_bytes, Path('public/zyn-cover.png'), COLORS['page'], options)
+"""
+
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from PIL import Image
+
+from build_image_variants import DEFAULT_WIDTHS, public_url, renditions_from_pixels
+from fix_image_background import (
+    COLORS,
+    DEFAULT_THRESHOLD,
+    apply_background,
+    atomic_output,
+    dark_mask,
+    hex_to_rgb,
+    variant_path,
+)
+from normalize_strokes import normalize_strokes
+from quantize_palette import DEFAULT_STEPS, brand_accent, brand_accents, encode_png, quantize_pixels
+
+
+@dataclass
+class PipelineOptions:
+    threshold: int = DEFAULT_THRESHOLD
+    variants: Sequence[str] = ()        # COLORS names written beside the output
+    quantize: bool = False              # indexed PNGs in site colors
+    accent: Optional[str] = None        # quantize accent; None: the brand's, else detected
+    steps: int = DEFAULT_STEPS
+    renditions: bool = False            # WebP/AVIF renditions for outputs under public/
+    widths: Sequence[int] = tuple(DEFAULT_WIDTHS)
+    stroke_target: Optional[float] = None  # stroke width (px at 1024 wide) to normalize to; None: leave as is
+
+
+@dataclass
+class PipelineResult:
+    outputs: Dict[Path, int] = field(default_factory=dict)  # written path -> bytes
+    changed: int = 0                    # background pixels replaced
+    total: int = 0
+    url: Optional[str] = None           # manifest key, if renditions were built
+    manifest_entry: Optional[dict] = None
+    strokes: Optional[dict] = None      # normalize_strokes() stats, if it ran
+
+    @property
+    def bytes(self) -> int:
+        return sum(self.outputs.values())
+
+
+def encode(pixels, background, options: PipelineOptions, accent=None) -> bytes:
+    """PNG bytes for a fixed RGBA array: plain, or quantized to the site palette."""
+    if options.quantize:
+        indexed, _ = quantize_pixels(pixels, background, accent, options.steps)
+        return encode_png(indexed)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels, 'RGBA').save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def _write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_output(path) as f:
+        f.write(data)
+
+
+def process_image(data: bytes, output: Path, background: str,
+                  options: Optional[PipelineOptions] = None) -> PipelineResult:
+    """Fix, encode and write one generated image (and its variants and renditions)."""
+    options = options or PipelineOptions()
+    with Image.open(io.BytesIO(data)) as img:
+        pixels = np.asarray(img.convert('RGBA'))
+    strokes = None
+    if options.stroke_target is not None:
+        pixels, strokes = normalize_strokes(pixels, options.stroke_target, options.threshold)
+    mask = dark_mask(pixels, options.threshold)
+    result = PipelineResult(changed=int(mask.sum()), total=mask.size, strokes=strokes)
+
+    accent = options.accent
+    if options.quantize and accent is None:
+        accent = brand_accent(output, brand_accents())
+    fixed = apply_background(pixels, mask, hex_to_rgb(background))
+    encoded = encode(fixed, background, options, accent)
+    _write(output, encoded)
+    result.outputs[output] = len(encoded)
+
+    for name in options.variants:
+        if COLORS[name] == background:
+            continue
+        path = variant_path(output, name)
+        variant = encode(apply_background(pixels, mask, hex_to_rgb(COLORS[name])), COLORS[name], options, accent)
+        _write(path, variant)
+        result.outputs[path] = len(variant)
+
+    if options.renditions:
+        try:
+            result.url = public_url(output)
+        except ValueError:
+            return result  # only files under public/ are served
+        result.manifest_entry = renditions_from_pixels(fixed, encoded, result.url, options.widths)
+    return result
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Selective JSON loading for GDT component outputs.
+
+Component JSON files carry a large `metadata` block (research sources,
+competitors analyzed, market metrics, methodology) and many `finding` fields
+the converter never reads. load_json_subset() decodes only the keys named in
+a field tree and skips everything else by scanning past it, without building
+Python objects for the skipped values. Once every selected top-level key has
+been found the rest of the document is not scanned at all.
+
+    fields = {'finding': {'strengths': True, 'weaknesses': True}, 'rating': True}
+    data = load_json_subset(path, fields)
+    # {'finding': {'strengths': [...], 'weaknesses': [...]}, 'rating': {...}}
+
+True decodes the whole value; a nested dict selects keys inside an object.
+"""
+
+import json
+import re
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Dict, Iterable, Union
+
+FieldTree = Dict[str, Union[bool, 'FieldTree']]
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Everything up to the next bracket, stepping over whole strings (unrolled-loop
+# form, so long strings and runs of scalars are consumed in one regex call)
+_NEXT_BRACKET = re.compile(r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}])', re.DOTALL)
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(r'[^,\]}\s]+')
+
+
+def fields_from_paths(paths: Iterable[str]) -> FieldTree:
+    """Build a field tree from dot-notation paths ('finding.strengths', ...)."""
+    tree: FieldTree = {}
+    for path in paths:
+        node = tree
+        keys = path.split('.')
+        for key in keys[:-1]:
+            child = node.get(key)
+            if child is True:
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[keys[-1]] = True
+    return tree
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _error(msg: str, text: str, pos: int) -> json.JSONDecodeError:
+    return json.JSONDecodeError(msg, text, pos)
+
+
+def _skip_value(text: str, pos: int) -> int:
+    """Return the index just past the JSON value starting at pos."""
+    if pos >= len(text):
+        raise _error("Expecting value", text, pos)
+    char = text[pos]
+
+    if char == '"':
+        match = _STRING.match(text, pos)
+        if not match:
+            raise _error("Unterminated string", text, pos)
+        return match.end()
+
+    if char in '{[':
+        depth = 1
+        pos += 1
+        while depth:
+            match = _NEXT_BRACKET.match(text, pos)
+            if not match:
+                raise _error("Unterminated container", text, pos)
+            depth += 1 if match.group(1) in '{[' else -1
+            pos = match.end()
+        return pos
+
+    match = _SCALAR.match(text, pos)
+    if not match:
+        raise _error("Expecting value", text, pos)
+    return match.end()
+
+
+def _decode_object(text: str, pos: int, fields: FieldTree, stop_when_complete: bool = False):
+    """
+    Decode the selected keys of the object at pos. Returns (dict, end). With
+    stop_when_complete, returns (dict, None) as soon as every selected key has
+    been decoded, without scanning the rest of the object.
+    """
+    if text[pos:pos + 1] != '{':
+        # Not an object: nothing to select from, keep the value as-is
+        return _decoder.raw_decode(text, pos)
+
+    result = {}
+    pos = _skip_ws(text, pos + 1)
+    if text[pos:pos + 1] == '}':
+        return result, pos + 1
+
+    while True:
+        if text[pos:pos + 1] != '"':
+            raise _error("Expecting property name enclosed in double quotes", text, pos)
+        key, pos = scanstring(text, pos + 1)
+        pos = _skip_ws(text, pos)
+        if text[pos:pos + 1] != ':':
+            raise _error("Expecting ':' delimiter", text, pos)
+        pos = _skip_ws(text, pos + 1)
+
+        wanted = fields.get(key)
+        if wanted is True:
+            result[key], pos = _decoder.raw_decode(text, pos)
+        elif wanted:
+            result[key], pos = _decode_object(text, pos, wanted)
+        else:
+            pos = _skip_value(text, pos)
+
+        if wanted and stop_when_complete and len(result) == len(fields):
+            return result, None
+
+        pos = _skip_ws(text, pos)
+        char = text[pos:pos + 1]
+        if char == '}':
+            return result, pos + 1
+        if char != ',':
+            raise _error("Expecting ',' delimiter", text, pos)
+        pos = _skip_ws(text, pos + 1)
+
+
+def loads_json_subset(text: str, fields: FieldTree) -> dict:
+    """
+    Decode only the selected fields of a JSON object document. Scanning stops
+    once every selected top-level field is found, so a trailing `metadata`
+    block is never read past (or validated).
+    """
+    pos = _skip_ws(text, 0)
+    result, pos = _decode_object(text, pos, fields, stop_when_complete=True)
+    if pos is not None and _skip_ws(text, pos) != len(text):
+        raise _error("Extra data", text, pos)
+    return result
+
+
+def load_json_subset(path: Path, fields: FieldTree) -> dict:
+    """Read a JSON file, decoding only the selected fields."""
+    with open(path, 'r') as f:
+        return loads_json_subset(f.read(), fields)
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI images.edit endpoint.
+
+Speaks enough of the API for the OpenAI SDK (and generate_images.py) to run
+against it with no network or API key: POST /v1/images/edits takes the same
+multipart form (model, prompt, size, image, n, response_format) and returns
+deterministic synthetic line art - a noisy near-black background, bold cream
+strokes and an accent shape, like a raw generation before
+fix_image_background.py - as b64_json or as a URL served by the same server.
+
+The same prompt, size and style reference always give the same PNG, so
+outputs can be checked byte for byte. Latency, server errors and 429s (at a
+random rate, or by enforcing a requests-per-minute limit) are configurable
+for exercising the driver's concurrency, retries and throughput, and
+--uplink-mbps simulates the client's upload bandwidth so request size shows
+up in latency as it does over a real connection.
+
+Point a client at it with base_url=http://127.0.0.1:8011/v1, e.g.
+    OPENAI_API_KEY=test python scripts/generate_images.py run \\
+        --base-url http://127.0.0.1:8011/v1 --only geico
+
+Usage:
+  python scripts/mock_images_server.py
+  python scripts/mock_images_server.py --latency 2 --jitter 0.5 --error-rate 0.1 --rate-limit-rate 0.1
+  python scripts/mock_images_server.py --rpm 20 --response-format url --port 8011
+  python scripts/mock_images_server.py --uplink-mbps 20
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+DEFAULT_PORT = 8011
+
+CREAM = (237, 232, 223)
+DEFAULT_ACCENT = (229, 75, 123)
+HEX_COLOR = re.compile(r'#([0-9A-Fa-f]{6})\b')
+
+# Generated PNGs kept for URL responses and repeated prompts
+_KEPT_IMAGES = 64
+
+
+@dataclass
+class ServerConfig:
+    latency: float = 0.5          # mean seconds per request
+    jitter: float = 0.1           # standard deviation of the latency
+    error_rate: float = 0.0       # fraction of requests answered with a 500
+    rate_limit_rate: float = 0.0  # fraction of requests answered with a 429
+    rpm: int = 0                  # enforced requests per minute (0: no limit)
+    retry_after: float = 1.0      # Retry-After seconds on random 429s
+    response_format: str = 'b64_json'
+    seed: int = 0
+    uplink_mbps: float = 0.0      # simulated client upload bandwidth (0: loopback speed)
+
+
+# ============================================================================
+# SYNTHETIC IMAGES
+# ============================================================================
+
+def synthetic_image(prompt: str, size: str, style_ref: bytes = b'', index: int = 0) -> bytes:
+    """Deterministic line-art PNG for a request; the first #RRGGBB in the prompt is the accent."""
+    width, height = (int(v) for v in size.split('x'))
+    digest = hashlib.sha256(b'\0'.join([prompt.encode('utf-8'), size.encode(), style_ref, bytes([index])]))
+    rng = np.random.default_rng(int.from_bytes(digest.digest()[:8], 'big'))
+
+    base = rng.integers(0, 24, size=(height, width, 3), dtype=np.uint8)
+    img = Image.fromarray(base, 'RGB')
+    draw = ImageDraw.Draw(img)
+    # Candidates of one request differ in stroke weight, like real generations do
+    stroke = max(min(width, height) // int(rng.integers(60, 180)), 2)
+
+    for _ in range(int(rng.integers(6, 12))):
+        points = [(int(rng.integers(0, width)), int(rng.integers(0, height))) for _ in range(3)]
+        draw.line(points, fill=CREAM, width=stroke, joint='curve')
+    for _ in range(int(rng.integers(2, 5))):
+        x, y = int(rng.integers(0, width * 3 // 4)), int(rng.integers(0, height * 3 // 4))
+        r = int(rng.integers(min(width, height) // 16, min(width, height) // 4))
+        draw.arc([x, y, x + r, y + r], int(rng.integers(0, 180)), int(rng.integers(180, 360)),
+                 fill=CREAM, width=stroke)
+
+    match = HEX_COLOR.search(prompt)
+    accent = tuple(bytes.fromhex(match.group(1))) if match else DEFAULT_ACCENT
+    cx, cy = int(rng.integers(width // 4, width * 3 // 4)), int(rng.integers(height // 4, height * 3 // 4))
+    r = min(width, height) // 10
+    draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=accent, outline=CREAM, width=stroke)
+
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def parse_multipart(content_type: str, body: bytes) -> dict:
+    """Form fields of a multipart/form-data body: str for text fields, bytes for files."""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        raise ValueError("no multipart boundary")
+    fields = {}
+    for part in body.split(b'--' + match.group(1).encode('latin-1'))[1:-1]:
+        head, _, payload = part[2:-2].partition(b'\r\n\r\n')  # strip the CRLFs around the part
+        disposition = next((line for line in head.decode('latin-1').split('\r\n')
+                            if line.lower().startswith('content-disposition')), '')
+        name = re.search(r'\bname="([^"]*)"', disposition)
+        if not name:
+            continue
+        # images.edit accepts image or image[] for multiple references
+        key = name.group(1).removesuffix('[]')
+        if 'filename=' in disposition:
+            fields.setdefault(key, payload)
+        else:
+            fields[key] = payload.decode('utf-8')
+    return fields
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class MockImagesServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config: ServerConfig, verbose: bool = True):
+        super().__init__(address, MockImagesHandler)
+        self.config = config
+        self.verbose = verbose
+        self.rng = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.recent = deque()  # request times inside the last minute, for --rpm
+        self.images = OrderedDict()
+        self.stats = Counter()
+        self.received_bytes = 0
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def admit(self):
+        """None to serve the request, or (status, error type, message, retry_after) to reject it."""
+        config = self.config
+        with self.lock:
+            now = time.monotonic()
+            while self.recent and now - self.recent[0] >= 60:
+                self.recent.popleft()
+            if config.rpm and len(self.recent) >= config.rpm:
+                wait = 60 - (now - self.recent[0])
+                return 429, 'requests', f"Rate limit reached: {config.rpm} images per min", wait
+            self.recent.append(now)
+
+            roll = self.rng.random()
+            if roll < config.rate_limit_rate:
+                return 429, 'requests', "Rate limit reached (simulated)", config.retry_after
+            if roll < config.rate_limit_rate + config.error_rate:
+                return 500, 'server_error', "The server had an error processing your request (simulated)", None
+            return None
+
+    def upload_time(self, size: int) -> float:
+        """Seconds a `size`-byte request body takes over the simulated uplink."""
+        with self.lock:
+            self.received_bytes += size
+        return size * 8 / (self.config.uplink_mbps * 1e6) if self.config.uplink_mbps else 0.0
+
+    def latency(self) -> float:
+        with self.lock:
+            return max(0.0, self.rng.gauss(self.config.latency, self.config.jitter))
+
+    def keep(self, key: str, data: bytes) -> None:
+        with self.lock:
+            self.images[key] = data
+            self.images.move_to_end(key)
+            while len(self.images) > _KEPT_IMAGES:
+                self.images.popitem(last=False)
+
+    def kept(self, key: str):
+        with self.lock:
+            return self.images.get(key)
+
+
+class MockImagesHandler(BaseHTTPRequestHandler):
+    server: MockImagesServer
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.stats[status] += 1
+
+    def _json(self, status: int, payload: dict, headers: dict = None) -> None:
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json', headers)
+
+    def _error(self, status: int, error_type: str, message: str, headers: dict = None) -> None:
+        self._json(status, {'error': {'message': message, 'type': error_type, 'param': None, 'code': None}},
+                   headers)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            with self.server.lock:
+                self._json(200, {str(status): count for status, count in self.server.stats.items()})
+            return
+        match = re.fullmatch(r'/files/([0-9a-f]+)\.png', self.path)
+        data = match and self.server.kept(match.group(1))
+        if not data:
+            self._error(404, 'invalid_request_error', f"No such file: {self.path}")
+            return
+        self._send(200, data, 'image/png')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path.rstrip('/') != '/v1/images/edits':
+            self._error(404, 'invalid_request_error', f"Unknown endpoint: POST {self.path}")
+            return
+
+        time.sleep(self.server.upload_time(len(body)) + self.server.latency())
+        rejection = self.server.admit()
+        if rejection:
+            status, error_type, message, retry_after = rejection
+            headers = {'Retry-After': f"{retry_after:.3g}"} if retry_after is not None else None
+            self._error(status, error_type, message, headers)
+            return
+
+        try:
+            fields = parse_multipart(self.headers.get('Content-Type', ''), body)
+        except Exception as e:
+            self._error(400, 'invalid_request_error', f"Could not parse multipart body: {e}")
+            return
+        missing = [name for name in ('model', 'prompt', 'image') if not fields.get(name)]
+        if missing:
+            self._error(400, 'invalid_request_error', f"Missing required parameter: {missing[0]}")
+            return
+        size = fields.get('size', '1024x1024')
+        if size == 'auto':
+            size = '1024x1024'
+        if not re.fullmatch(r'\d{2,4}x\d{2,4}', size):
+            self._error(400, 'invalid_request_error', f"Invalid size: {size}")
+            return
+
+        response_format = fields.get('response_format') or self.server.config.response_format
+        data = []
+        for index in range(int(fields.get('n') or 1)):
+            key = hashlib.sha256(f"{fields['prompt']}|{size}|{index}".encode('utf-8')
+                                 + fields['image']).hexdigest()[:32]
+            png = self.server.kept(key) or synthetic_image(fields['prompt'], size, fields['image'], index)
+            self.server.keep(key, png)
+            if response_format == 'url':
+                host, port = self.server.server_address[:2]
+                data.append({'url': f"http://{host}:{port}/files/{key}.png"})
+            else:
+                data.append({'b64_json': base64.b64encode(png).decode('ascii')})
+        self._json(200, {'created': int(time.time()), 'data': data})
+
+
+def serve_in_background(config: ServerConfig, port: int = 0, verbose: bool = False) -> MockImagesServer:
+    """Start a server on a daemon thread (port 0: any free port); stop it with shutdown()."""
+    server = MockImagesServer(('127.0.0.1', port), config, verbose)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the OpenAI images.edit endpoint')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument('--latency', type=float, default=0.5, help='Mean seconds per request (default: 0.5)')
+    parser.add_argument('--jitter', type=float, default=0.1, help='Latency standard deviation (default: 0.1)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failing with 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of requests failing with 429')
+    parser.add_argument('--rpm', type=int, default=0, help='Enforce a requests-per-minute limit with 429s')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After on simulated 429s')
+    parser.add_argument('--response-format', choices=['b64_json', 'url'], default='b64_json',
+                        help='Used when the request does not ask for one (default: b64_json)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for latency and fault injection')
+    parser.add_argument('--uplink-mbps', type=float, default=0.0,
+                        help='Simulated client upload bandwidth in Mbit/s (default: unlimited)')
+    args = parser.parse_args()
+
+    config = ServerConfig(args.latency, args.jitter, args.error_rate, args.rate_limit_rate, args.rpm,
+                          args.retry_after, args.response_format, args.seed, args.uplink_mbps)
+    server = MockImagesServer(('127.0.0.1', args.port), config)
+    print(f"Serving images.edit at {server.base_url} ({config.response_format}, "
+          f"{config.latency:g}s ± {config.jitter:g}s, {config.error_rate:.0%} errors, "
+          f"{config.rate_limit_rate:.0%} 429s{f', {config.rpm} rpm' if config.rpm else ''}"
+          f"{f', {config.uplink_mbps:g} Mbit/s uplink' if config.uplink_mbps else ''})")
+    print(f"   OPENAI_BASE_URL={server.base_url} OPENAI_API_KEY=test python scripts/...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 Responses: {', '.join(f'{count} x {status}' for status, count in sorted(server.stats.items()))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Normalize the stroke weight of line-art images toward the style reference.
+
+Thin line weight is the most common reason a cover gets regenerated (the
+"CRITICAL LINE WEIGHT" blocks of the old Hogwarts prompts). A near miss can
+be fixed locally instead: the median stroke width of the cream and accent
+line work (every pixel fix_image_background.py does not count as
+background) is measured, and the line work is grown or shrunk by the
+radius that brings it to the target width.
+
+Both directions are grayscale morphology on whole arrays, alternating
+4- and 8-neighbour steps so the structuring element is close to a disk:
+
+  - thicken: each pixel takes the color of its brightest line neighbour, so
+    strokes (with their anti-aliased edges) grow outward into the background
+  - thin: line pixels take the color of their darkest neighbour, so the
+    background eats into strokes; strokes already at or under the target
+    width are left alone so fine detail does not disappear
+
+Background pixels away from the line work are never modified. Widths are
+measured as at a 1024 px wide image, like style_score.py; the default target
+is the style reference's own median stroke width.
+
+Usage:
+  python scripts/normalize_strokes.py public/hogwarts-legacy-cover.png
+  python scripts/normalize_strokes.py "public/growth-systems/*.png" --target 8
+  python scripts/normalize_strokes.py public --dry-run
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from fix_image_background import (DEFAULT_THRESHOLD, dark_mask, expand_inputs, load_rgba, run_files,
+                                  save_png_atomic)
+from png_strips import metadata_chunks
+from style_score import DEFAULT_REF, REFERENCE_WIDTH, luminance, stroke_widths
+
+MAX_RADIUS = 8             # steps (pixels grown or shrunk per side), at most
+CROSS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+SQUARE = CROSS + [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+def median_stroke(pixels, threshold=DEFAULT_THRESHOLD):
+    """Median stroke width of the line work, in pixels as at REFERENCE_WIDTH (0.0 if there is none)."""
+    widths = stroke_widths(~dark_mask(pixels, threshold))
+    return float(np.median(widths)) * REFERENCE_WIDTH / pixels.shape[1] if widths.size else 0.0
+
+
+def reference_stroke(path=DEFAULT_REF, threshold=DEFAULT_THRESHOLD):
+    return median_stroke(load_rgba(path), threshold)
+
+
+def _shift(array, dy, dx, fill):
+    """array moved by (dy, dx), so out[y, x] = array[y - dy, x - dx]; uncovered cells get fill."""
+    out = np.full_like(array, fill)
+    h, w = array.shape
+    out[max(dy, 0):h + min(dy, 0), max(dx, 0):w + min(dx, 0)] = \
+        array[max(-dy, 0):h + min(-dy, 0), max(-dx, 0):w + min(-dx, 0)]
+    return out
+
+
+def morph_step(key, source, step, grow, movable):
+    """
+    One step of grayscale dilation (grow) or erosion of `key`, changing only
+    cells where `movable`; `source` tracks the flat index of the pixel each
+    cell's value came from. Steps alternate 4- and 8-neighbourhoods.
+    """
+    fill = np.iinfo(key.dtype).min if grow else np.iinfo(key.dtype).max
+    new_key, new_source = key.copy(), source.copy()
+    for dy, dx in (SQUARE if step % 2 else CROSS):
+        neighbour = _shift(key, dy, dx, fill)
+        better = (neighbour > new_key if grow else neighbour < new_key) & movable
+        new_key = np.where(better, neighbour, new_key)
+        new_source = np.where(better, _shift(source, dy, dx, 0), new_source)
+    return new_key, new_source
+
+
+def normalize_strokes(pixels, target, threshold=DEFAULT_THRESHOLD):
+    """
+    (pixels with line work grown or shrunk toward `target` width, stats).
+    `target` and the reported widths are in pixels as at REFERENCE_WIDTH.
+
+    Each step moves every stroke edge by one pixel; the width is measured
+    again after it, because strokes that grow into each other widen faster
+    than 2 px a step. The step closest to the target wins.
+    """
+    scale = pixels.shape[1] / REFERENCE_WIDTH
+    line = ~dark_mask(pixels, threshold)
+    widths = stroke_widths(line)
+    before = float(np.median(widths)) / scale if widths.size else 0.0
+    stats = {'before': before, 'after': before, 'radius': 0, 'changed': 0}
+    if not widths.size or abs(target - before) * scale < 1:
+        return pixels, stats
+
+    grow = target > before
+    if grow:
+        key = np.where(line, luminance(pixels), -1)
+        movable = np.ones(line.shape, dtype=bool)
+    else:
+        key = luminance(pixels)
+        movable = np.zeros(line.shape, dtype=bool)
+        movable[line] = widths > target * scale  # strokes already thin enough stay
+    source = np.arange(key.size).reshape(key.shape)
+
+    flat = pixels.reshape(-1, pixels.shape[-1])
+    best, best_error = pixels, abs(target - before)
+    for step in range(MAX_RADIUS):
+        key, source = morph_step(key, source, step, grow, movable)
+        candidate = flat[source.ravel()].reshape(pixels.shape)
+        width = median_stroke(candidate, threshold)
+        if abs(target - width) < best_error:
+            best, best_error = candidate, abs(target - width)
+            stats.update(after=width, radius=step + 1 if grow else -(step + 1))
+        if (width >= target) if grow else (width <= target):
+            break
+    stats['changed'] = int(np.count_nonzero((best != pixels).any(axis=-1)))
+    return best, stats
+
+
+# ============================================================================
+# BATCH
+# ============================================================================
+
+def normalize_file(image_path, target, threshold=DEFAULT_THRESHOLD, dry_run=False):
+    """Normalize one image in place in a batch worker; returns its result fields."""
+    pixels = load_rgba(image_path)
+    normalized, stats = normalize_strokes(pixels, target, threshold)
+    if stats['changed'] and not dry_run:
+        save_png_atomic(normalized, image_path, metadata_chunks(image_path))
+    return dict(stats, total=pixels.shape[0] * pixels.shape[1])
+
+
+def run_batch(paths, target, threshold=DEFAULT_THRESHOLD, dry_run=False, workers=None):
+    """Normalize every image on a process pool. Returns result rows sorted by path."""
+    return run_files(normalize_file, [(path, (target, threshold, dry_run)) for path in paths],
+                     {'before': 0.0, 'after': 0.0, 'radius': 0, 'changed': 0, 'total': 0}, workers)
+
+
+def print_results_table(results):
+    width = max([len(r['path']) for r in results] + [4])
+    print(f"\n{'File':<{width}} | {'Before':>6} | {'After':>6} | {'Radius':>6} | {'Changed px':>11} | {'Changed':>7}")
+    print(f"{'-' * width}-+-{'-' * 6}-+-{'-' * 6}-+-{'-' * 6}-+-{'-' * 11}-+-{'-' * 7}")
+    for r in results:
+        if r['error']:
+            print(f"{r['path']:<{width}} | {'-':>6} | {'-':>6} | {'-':>6} | {'-':>11} | {'failed':>7}  {r['error']}")
+        else:
+            percent = r['changed'] / r['total'] * 100 if r['total'] else 0.0
+            print(f"{r['path']:<{width}} | {r['before']:>6.1f} | {r['after']:>6.1f} | {r['radius']:>+6} | "
+                  f"{r['changed']:>11,} | {percent:>6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Thicken or thin line art toward a target stroke width')
+    parser.add_argument('inputs', nargs='+', metavar='PATH',
+                        help='Image file(s) to normalize in place, directories of PNGs, or quoted globs')
+    parser.add_argument('--target', type=float,
+                        help=f'Stroke width in pixels at {REFERENCE_WIDTH} px wide '
+                             f'(default: the median of {DEFAULT_REF.name})')
+    parser.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD,
+                        help=f'Channels below this value count as background (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--dry-run', action='store_true', help='Measure and report, but write nothing')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print(f"Error: no images matched {' '.join(args.inputs)}")
+        sys.exit(1)
+
+    target = args.target if args.target is not None else reference_stroke(threshold=args.threshold)
+    print(f"Normalizing {len(paths)} images to {target:.1f} px strokes"
+          + (" (dry run)" if args.dry_run else ""))
+    start = time.perf_counter()
+    results = run_batch(paths, target, args.threshold, args.dry_run, args.workers)
+    print_results_table(results)
+
+    failed = sum(1 for r in results if r['error'])
+    print(f"\nDone! {len(results) - failed}/{len(results)} images "
+          f"{'measured' if args.dry_run else 'normalized'} in {time.perf_counter() - start:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
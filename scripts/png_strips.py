@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Band-by-band PNG reading and writing, so large renders never sit in memory whole.
+
+PngStripReader inflates only the IDAT bytes for one band of rows at a time and
+hands them to Pillow as a small standalone PNG. The band's first row is
+preceded by the previous band's last (unfiltered) row, so the Up and Paeth
+filters on that row still see the correct neighbour.
+
+PngStripWriter reproduces Pillow's PNG encoder for RGBA images exactly:
+adaptive row filters tried in the order None, Up, Sub, Paeth (least sum of
+absolute values; ties go to the earlier filter), zlib level 6 with Z_FILTERED
+and memLevel 9, and IDAT chunks of one encoder buffer each. Those are Pillow
+internals, not a documented format, so matches_pillow() checks that a file
+written band by band is still byte-identical to
+Image.fromarray(pixels, 'RGBA').save(path, 'PNG') with the installed Pillow.
+Either way the writer's output is a valid PNG of the same pixels.
+
+Color-space and text chunks (ICC profile, gAMA, cHRM, sRGB, tEXt/zTXt/iTXt)
+are carried over: metadata_chunks() reads them from the source,
+save_options() turns them into Image.save() arguments, and the writer takes
+the same list and lays them out as Pillow does.
+
+    with PngStripReader(src) as reader, open(dst, 'wb') as f:
+        writer = PngStripWriter(f, reader.width, reader.height, metadata_chunks(src))
+        for band in reader.iter_rgba(rows=256):
+            writer.write(band)
+        writer.close()
+
+Usage (check the writer against the installed Pillow):
+  python scripts/png_strips.py
+"""
+
+import io
+import struct
+import sys
+import zlib
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageFile, PngImagePlugin
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Samples per pixel by IHDR color type
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Chunks a band needs to decode like the original (palette and transparency)
+_COPIED_CHUNKS = (b'PLTE', b'tRNS')
+
+# Chunks describing how to display the pixels, carried from a source to what is written from it
+METADATA_CHUNKS = (b'iCCP', b'cHRM', b'gAMA', b'sRGB', b'tEXt', b'zTXt', b'iTXt')
+_TEXT_CHUNKS = (b'tEXt', b'zTXt', b'iTXt')
+
+# Pillow's PNG encoder settings (ZipEncode.c / PngImagePlugin.py defaults)
+_ZLIB_LEVEL = 6
+_ZLIB_MEM_LEVEL = 9
+
+# Filter cost of a byte: its distance from zero read as signed
+_BYTE_COST = np.minimum(np.arange(256), 256 - np.arange(256)).astype(np.uint8)
+
+
+def _chunk(chunk_type, data):
+    return (struct.pack('>I', len(data)) + chunk_type + data
+            + struct.pack('>I', zlib.crc32(chunk_type + data)))
+
+
+def _read_chunk_header(f):
+    header = f.read(8)
+    if len(header) < 8:
+        raise ValueError("truncated PNG")
+    return struct.unpack('>I4s', header)
+
+
+def can_stream(path):
+    """True if path is a PNG the strip reader handles (8-bit samples, not interlaced)."""
+    with open(path, 'rb') as f:
+        if f.read(8) != PNG_SIGNATURE:
+            return False
+        length, chunk_type = _read_chunk_header(f)
+        if chunk_type != b'IHDR':
+            return False
+        _, _, bit_depth, color_type, _, _, interlace = struct.unpack('>IIBBBBB', f.read(13))
+    return bit_depth == 8 and color_type in _CHANNELS and interlace == 0
+
+
+def metadata_chunks(path):
+    """[(type, data)] of the METADATA_CHUNKS in a PNG, in file order ([] if path is not a PNG)."""
+    chunks = []
+    with open(path, 'rb') as f:
+        if f.read(8) != PNG_SIGNATURE:
+            return chunks
+        while True:
+            length, chunk_type = _read_chunk_header(f)
+            if chunk_type == b'IEND':
+                return chunks
+            if chunk_type in METADATA_CHUNKS:
+                chunks.append((chunk_type, f.read(length)))
+                f.seek(4, io.SEEK_CUR)
+            else:
+                f.seek(length + 4, io.SEEK_CUR)
+
+
+def _icc_profile(chunks):
+    """Uncompressed ICC profile of an iCCP chunk among chunks, or None."""
+    for chunk_type, data in chunks:
+        if chunk_type == b'iCCP':
+            name_end = data.index(b'\0')
+            return zlib.decompress(data[name_end + 2:])
+    return None
+
+
+def _pillow_chunks(chunks):
+    """
+    The metadata chunks as Pillow writes them for save_options(chunks): the ICC
+    profile first (renamed and recompressed), then gAMA/cHRM/sRGB once each
+    (no sRGB beside a profile) and every text chunk, in order.
+    """
+    icc = _icc_profile(chunks)
+    out = [(b'iCCP', b'ICC Profile\0\0' + zlib.compress(icc))] if icc else []
+    seen = set()
+    for chunk_type, data in chunks:
+        if chunk_type in _TEXT_CHUNKS:
+            out.append((chunk_type, data))
+        elif chunk_type != b'iCCP' and chunk_type not in seen and not (icc and chunk_type == b'sRGB'):
+            seen.add(chunk_type)
+            out.append((chunk_type, data))
+    return out
+
+
+def save_options(chunks):
+    """Image.save() arguments that write `chunks` (from metadata_chunks) into a PNG."""
+    options = {}
+    icc = _icc_profile(chunks)
+    if icc:
+        options['icc_profile'] = icc
+    info = PngImagePlugin.PngInfo()
+    for chunk_type, data in chunks:
+        if chunk_type != b'iCCP':
+            info.add(chunk_type, data)
+    if info.chunks:
+        options['pnginfo'] = info
+    return options
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+class PngStripReader:
+    """Decode a PNG as RGBA bands of rows without decoding the whole image."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._read_header()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_header(self):
+        if self._file.read(8) != PNG_SIGNATURE:
+            raise ValueError(f"{self.path} is not a PNG")
+
+        self._extra_chunks = []
+        while True:
+            length, chunk_type = _read_chunk_header(self._file)
+            if chunk_type == b'IDAT':
+                self._idat_remaining = length
+                break
+            data = self._file.read(length)
+            self._file.read(4)  # CRC
+            if chunk_type == b'IHDR':
+                self._ihdr = data
+                (self.width, self.height, bit_depth, color_type,
+                 _, _, interlace) = struct.unpack('>IIBBBBB', data)
+                if bit_depth != 8 or color_type not in _CHANNELS or interlace:
+                    raise ValueError(f"{self.path}: strips need 8-bit, non-interlaced PNGs "
+                                     f"(bit depth {bit_depth}, interlace {interlace})")
+                self.stride = self.width * _CHANNELS[color_type]
+            elif chunk_type in _COPIED_CHUNKS:
+                self._extra_chunks.append(_chunk(chunk_type, data))
+            elif chunk_type == b'IEND':
+                raise ValueError(f"{self.path} has no image data")
+
+    def _idat_data(self, block_size=65536):
+        """Compressed image data, read across consecutive IDAT chunks."""
+        while True:
+            while self._idat_remaining:
+                data = self._file.read(min(self._idat_remaining, block_size))
+                if not data:
+                    raise ValueError(f"{self.path} is truncated")
+                self._idat_remaining -= len(data)
+                yield data
+            self._file.read(4)  # CRC
+            length, chunk_type = _read_chunk_header(self._file)
+            if chunk_type != b'IDAT':
+                return
+            self._idat_remaining = length
+
+    def _band_png(self, height, filtered):
+        ihdr = struct.pack('>II', self.width, height) + self._ihdr[8:]
+        return b''.join([
+            PNG_SIGNATURE,
+            _chunk(b'IHDR', ihdr),
+            *self._extra_chunks,
+            _chunk(b'IDAT', zlib.compress(filtered, 0)),
+            _chunk(b'IEND', b'')
+        ])
+
+    def iter_rgba(self, rows=256):
+        """Yield (band height, width, 4) uint8 arrays from top to bottom."""
+        inflater = zlib.decompressobj()
+        source = self._idat_data()
+        previous = bytes(self.stride)  # the row above the image is all zeros
+
+        for top in range(0, self.height, rows):
+            count = min(rows, self.height - top)
+            size = count * (self.stride + 1)
+            parts = []
+            while size:
+                data = inflater.unconsumed_tail or next(source, None)
+                if data is None:
+                    raise ValueError(f"{self.path} is truncated")
+                part = inflater.decompress(data, size)
+                parts.append(part)
+                size -= len(part)
+
+            # Filter type 0 for the seed row, then the band's rows as stored
+            png = self._band_png(count + 1, b'\x00' + previous + b''.join(parts))
+            with Image.open(io.BytesIO(png)) as band:
+                band.load()
+                previous = band.crop((0, count, self.width, count + 1)).tobytes()
+                yield np.asarray(band.convert('RGBA'))[1:]
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def filter_rows(rows, previous):
+    """
+    Adaptive PNG filtering of (n, stride) RGBA rows, as Pillow chooses it.
+    previous is the raw row above rows[0]. Returns (n, stride + 1) with the
+    filter type byte first.
+    """
+    current = rows.astype(np.int16)
+    up = np.empty_like(current)
+    up[0] = previous
+    up[1:] = current[:-1]
+    left = np.zeros_like(current)
+    left[:, 4:] = current[:, :-4]
+    upper_left = np.zeros_like(current)
+    upper_left[:, 4:] = up[:, :-4]
+
+    estimate = left + up - upper_left
+    pa = np.abs(estimate - left)
+    pb = np.abs(estimate - up)
+    pc = np.abs(estimate - upper_left)
+    paeth = np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, upper_left))
+
+    # Pillow's evaluation order (it never tries Average): None, Up, Sub, Paeth
+    candidates = np.stack([current, current - up, current - left, current - paeth]).astype(np.uint8)
+    cost = _BYTE_COST[candidates].sum(axis=2, dtype=np.int64)
+    choice = cost.argmin(axis=0)
+
+    filtered = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+    filtered[:, 0] = np.array([0, 2, 1, 4], dtype=np.uint8)[choice]
+    filtered[:, 1:] = candidates[choice, np.arange(rows.shape[0])]
+    return filtered
+
+
+class PngStripWriter:
+    """Encode RGBA bands to an open binary file, as Pillow would (see matches_pillow)."""
+
+    def __init__(self, file, width, height, metadata=()):
+        self._file = file
+        self.width = width
+        self.height = height
+        self._rows_written = 0
+        self._previous = np.zeros(width * 4, dtype=np.uint8)
+        self._compressor = zlib.compressobj(_ZLIB_LEVEL, zlib.DEFLATED, 15, _ZLIB_MEM_LEVEL, zlib.Z_FILTERED)
+        self._pending = bytearray()
+        # Pillow writes one IDAT per encoder buffer (ImageFile._save)
+        self._idat_size = max(ImageFile.MAXBLOCK, width * 4)
+
+        file.write(PNG_SIGNATURE)
+        file.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+        for chunk_type, data in _pillow_chunks(metadata):
+            file.write(_chunk(chunk_type, data))
+
+    def write(self, band):
+        """Append a (rows, width, 4) uint8 band below the rows already written."""
+        rows = np.ascontiguousarray(band, dtype=np.uint8).reshape(len(band), self.width * 4)
+        if self._rows_written + len(rows) > self.height:
+            raise ValueError(f"too many rows for a {self.width}x{self.height} image")
+        self._pending += self._compressor.compress(filter_rows(rows, self._previous).tobytes())
+        self._previous = rows[-1].copy()
+        self._rows_written += len(rows)
+        self._write_idat(final=False)
+
+    def _write_idat(self, final):
+        while len(self._pending) >= self._idat_size or (final and self._pending):
+            data = bytes(self._pending[:self._idat_size])
+            del self._pending[:self._idat_size]
+            self._file.write(_chunk(b'IDAT', data))
+
+    def close(self):
+        """Finish the image (the caller closes the file)."""
+        if self._rows_written != self.height:
+            raise ValueError(f"wrote {self._rows_written} of {self.height} rows")
+        self._pending += self._compressor.flush()
+        self._write_idat(final=True)
+        self._file.write(_chunk(b'IEND', b''))
+
+
+# ============================================================================
+# PILLOW CHECK
+# ============================================================================
+
+def _sample_image(width=256, height=192, seed=0):
+    """Line art on a dark ground plus a noise band, so every filter is chosen and the IDAT spans chunks."""
+    rng = np.random.default_rng(seed)
+    pixels = np.full((height, width, 4), (12, 12, 14, 255), dtype=np.uint8)
+    y, x = np.mgrid[:height, :width]
+    pixels[(x + 2 * y) % 37 < 6] = (237, 232, 223, 255)
+    pixels[..., 0] = np.where(x > y, pixels[..., 0], (x * 255 // width).astype(np.uint8))
+    pixels[height // 2:, :, :3] = rng.integers(0, 256, (height - height // 2, width, 3), dtype=np.uint8)
+    return pixels
+
+
+# A profile-tagged render: iCCP, gamma, a redundant sRGB and text chunks
+_SAMPLE_METADATA = [
+    (b'iCCP', b'Display P3\0\0' + zlib.compress(bytes(range(256)) * 2)),
+    (b'gAMA', struct.pack('>I', 45455)),
+    (b'sRGB', b'\0'),
+    (b'tEXt', b'Software\0gpt-image-1.5'),
+    (b'iTXt', b'Description\0\0\0\0\0line art cover'),
+]
+
+
+def _encodings_match(pixels, metadata, rows):
+    expected = io.BytesIO()
+    Image.fromarray(pixels, 'RGBA').save(expected, 'PNG', **save_options(metadata))
+
+    actual = io.BytesIO()
+    writer = PngStripWriter(actual, pixels.shape[1], pixels.shape[0], metadata)
+    for start in range(0, pixels.shape[0], rows):
+        writer.write(pixels[start:start + rows])
+    writer.close()
+    return actual.getvalue() == expected.getvalue()
+
+
+@lru_cache(maxsize=None)
+def matches_pillow(rows=24):
+    """True if PngStripWriter output is byte-identical to the installed Pillow's PNG encoder."""
+    pixels = _sample_image()
+    return _encodings_match(pixels, [], rows) and _encodings_match(pixels, _SAMPLE_METADATA, rows)
+
+
+if __name__ == "__main__":
+    if matches_pillow():
+        print(f"✅ PngStripWriter output is byte-identical to Pillow {Image.__version__}")
+    else:
+        print(f"❌ PngStripWriter output differs from Pillow {Image.__version__} (still a valid PNG); "
+              f"fix_image_background.py processes large images whole")
+        sys.exit(1)
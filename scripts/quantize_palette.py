@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Quantize GDT images to the site palette and write 8-bit indexed PNGs.
+
+IMAGE-STANDARDS.md allows three colors per image: the background (#0C0C0E for
+covers, #141418 for growth summaries), cream line art (#EDE8DF) and one brand
+accent. The palette is those anchors plus the anti-aliasing ramps between
+them (background→cream, background→accent, cream→accent), so edges keep their
+smoothing. Every pixel is snapped to its nearest palette entry (Euclidean RGB).
+
+The accent comes from the brand's accentColor in src/data/<brand>.ts when the
+file name starts with a brand id, otherwise from the image's most common
+saturated hue. --fit moves the anchors to the colors the image actually uses
+(a few k-means steps on the ramp endpoints), for renders whose cream or accent
+drifted from the standard; without it the standard colors are enforced.
+
+Each result reports the size reduction and the maximum and mean color error.
+
+Usage:
+  python scripts/quantize_palette.py public/zyn-cover.png            # writes zyn-cover-indexed.png
+  python scripts/quantize_palette.py public/growth-systems --dry-run  # report only
+  python scripts/quantize_palette.py public/geico-cover.png --fit --in-place
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from fix_image_background import atomic_output, default_target, expand_inputs, hex_to_rgb, run_files, variant_path
+from ts_emitter import module_accent
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BRAND_DATA_DIR = PROJECT_ROOT / 'src' / 'data'
+
+LINE_COLOR = "#EDE8DF"  # Off-white cream line art
+
+DEFAULT_STEPS = 16
+FIT_ITERATIONS = 3
+
+# Pixels considered at once when measuring distances to the palette
+_CHUNK = 65536
+
+
+# ============================================================================
+# PALETTE
+# ============================================================================
+
+def to_hex(rgb):
+    return "#{:02X}{:02X}{:02X}".format(*(int(round(c)) for c in rgb))
+
+
+def brand_accents(data_dir=BRAND_DATA_DIR):
+    """{brand id: accentColor} from the generated brand modules."""
+    accents = {}
+    for path in sorted(data_dir.glob('*.ts')):
+        accent = module_accent(path)
+        if accent:
+            accents[path.stem] = accent
+    return accents
+
+
+def brand_accent(image_path, accents):
+    """Accent of the longest brand id the file name starts with (zyn-cover.png → zyn)."""
+    stem = Path(image_path).stem
+    matches = [brand for brand in accents if stem == brand or stem.startswith(brand + '-')]
+    return accents[max(matches, key=len)] if matches else None
+
+
+def unique_colors(pixels):
+    """(colors (n, 3) float, counts (n,), inverse index per pixel) of an (h, w, 3) array."""
+    flat = pixels.reshape(-1, 3)
+    packed = (flat[:, 0].astype(np.uint32) << 16) | (flat[:, 1].astype(np.uint32) << 8) | flat[:, 2]
+    values, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+    colors = np.stack([(values >> 16) & 255, (values >> 8) & 255, values & 255], axis=1).astype(np.float64)
+    return colors, counts, inverse.reshape(-1)
+
+
+def detect_accent(colors, counts, min_saturation=0.4, min_value=80, bins=24):
+    """Count-weighted mean color of the most common saturated hue, or None."""
+    high = colors.max(axis=1)
+    low = colors.min(axis=1)
+    saturation = np.where(high > 0, (high - low) / np.maximum(high, 1), 0)
+    saturated = (saturation >= min_saturation) & (high >= min_value)
+    if not saturated.any():
+        return None
+
+    r, g, b = colors[saturated].T
+    hue = np.arctan2(np.sqrt(3) * (g - b), 2 * r - g - b)
+    hue_bin = ((hue + np.pi) / (2 * np.pi) * bins).astype(int) % bins
+    weights = counts[saturated]
+    top = np.bincount(hue_bin, weights=weights, minlength=bins).argmax()
+    members = hue_bin == top
+    return colors[saturated][members].T @ weights[members] / weights[members].sum()
+
+
+def _ramp(start, end, steps):
+    return start + (end - start) * np.linspace(0, 1, steps)[:, None]
+
+
+def build_palette(background, line, accent=None, steps=DEFAULT_STEPS):
+    """
+    Anchors plus anti-aliasing ramps, as (n, 3) float. The background is
+    entry 0, the line color entry steps - 1 and the accent (if any) entry
+    2 * steps - 2, which fit_anchors() relies on.
+    """
+    background, line = np.asarray(background, float), np.asarray(line, float)
+    parts = [_ramp(background, line, steps)]
+    if accent is not None:
+        accent = np.asarray(accent, float)
+        parts.append(_ramp(background, accent, steps)[1:])
+        parts.append(_ramp(line, accent, max(steps // 2, 2))[1:-1])
+    return np.vstack(parts)
+
+
+def nearest(colors, palette):
+    """(palette index, distance) of each color, in chunks to bound memory."""
+    index = np.empty(len(colors), dtype=np.intp)
+    distance = np.empty(len(colors))
+    for start in range(0, len(colors), _CHUNK):
+        block = colors[start:start + _CHUNK]
+        squared = ((block[:, None, :] - palette[None, :, :]) ** 2).sum(axis=2)
+        index[start:start + _CHUNK] = squared.argmin(axis=1)
+        distance[start:start + _CHUNK] = np.sqrt(squared.min(axis=1))
+    return index, distance
+
+
+def fit_anchors(colors, counts, anchors, steps=DEFAULT_STEPS, iterations=FIT_ITERATIONS):
+    """Move each anchor to the weighted mean of the colors snapped onto it."""
+    anchors = [np.asarray(a, float) if a is not None else None for a in anchors]
+    for _ in range(iterations):
+        index, _ = nearest(colors, build_palette(*anchors, steps=steps))
+        for i, entry in enumerate((0, steps - 1, 2 * steps - 2)):
+            members = index == entry
+            if anchors[i] is not None and counts[members].sum():
+                anchors[i] = colors[members].T @ counts[members] / counts[members].sum()
+    return anchors
+
+
+# ============================================================================
+# QUANTIZE
+# ============================================================================
+
+def quantize_image(image_path, accent=None, background=None, steps=DEFAULT_STEPS, fit=False, accents=None):
+    """
+    Quantize one image. Returns (indexed PIL image, stats) where stats has
+    the palette anchors, color count and max/mean Euclidean RGB error.
+    """
+    with Image.open(image_path) as img:
+        rgba = np.asarray(img.convert('RGBA'))
+    if accent is None:
+        accent = brand_accent(image_path, brand_accents() if accents is None else accents)
+    return quantize_pixels(rgba, background or default_target(image_path), accent, steps, fit)
+
+
+def quantize_pixels(rgba, background, accent=None, steps=DEFAULT_STEPS, fit=False):
+    """quantize_image() for a decoded (h, w, 4) array; accent None or '' detects it from the pixels."""
+    if rgba[..., 3].min() < 255:
+        raise ValueError("image has transparency; only opaque images are quantized")
+    pixels = rgba[..., :3]
+    colors, counts, inverse = unique_colors(pixels)
+
+    accent_rgb = hex_to_rgb(accent) if accent else detect_accent(colors, counts)
+    anchors = [hex_to_rgb(background), hex_to_rgb(LINE_COLOR), accent_rgb]
+    if fit:
+        anchors = fit_anchors(colors, counts, anchors, steps)
+
+    palette = build_palette(*anchors, steps=steps)
+    palette_bytes = np.clip(np.round(palette), 0, 255).astype(np.uint8)
+    index, _ = nearest(colors, palette)
+    # Error against the stored (rounded) palette colors
+    error = np.sqrt(((colors - palette_bytes[index]) ** 2).sum(axis=1))
+
+    indexed = Image.fromarray(index[inverse].reshape(pixels.shape[:2]).astype(np.uint8), 'P')
+    indexed.putpalette(palette_bytes.tobytes())
+    stats = {
+        'anchors': [to_hex(a) if a is not None else None for a in anchors],
+        'colors': len(palette),
+        'max_error': float(error.max()),
+        'mean_error': float(error @ counts / counts.sum())
+    }
+    return indexed, stats
+
+
+def encode_png(image):
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def quantize_file(image_path, output_path=None, accent=None, background=None, steps=DEFAULT_STEPS,
+                  fit=False, max_error=None, accents=None):
+    """Worker: quantize, encode and (unless output_path is None) write; returns the result fields."""
+    indexed, stats = quantize_image(image_path, accent, background, steps, fit, accents)
+    encoded = encode_png(indexed)
+    result = dict(stats, before=Path(image_path).stat().st_size, after=len(encoded))
+    if max_error is not None and stats['max_error'] > max_error:
+        result['error'] = f"max error {stats['max_error']:.1f} > {max_error}; not written"
+    elif output_path is not None:
+        with atomic_output(output_path) as f:
+            f.write(encoded)
+        result['output'] = str(output_path)
+    return result
+
+
+def print_results_table(results):
+    width = max([len(r['path']) for r in results] + [4])
+    print(f"\n{'File':<{width}} | {'Colors':>6} | {'Before KB':>9} | {'After KB':>8} | {'Reduction':>9} | "
+          f"{'Max err':>7} | {'Mean err':>8} | Anchors (bg, line, accent)")
+    print(f"{'-' * width}-+-{'-' * 6}-+-{'-' * 9}-+-{'-' * 8}-+-{'-' * 9}-+-{'-' * 7}-+-{'-' * 8}-+-{'-' * 26}")
+    for r in results:
+        if 'colors' not in r:
+            print(f"{r['path']:<{width}} | failed: {r['error']}")
+            continue
+        reduction = r['before'] / r['after'] if r['after'] else 0
+        anchors = ', '.join(a or '-' for a in r['anchors'])
+        note = f"  ⚠️  {r['error']}" if r['error'] else ""
+        print(f"{r['path']:<{width}} | {r['colors']:>6} | {r['before'] / 1024:>9.0f} | {r['after'] / 1024:>8.0f} | "
+              f"{reduction:>8.1f}x | {r['max_error']:>7.1f} | {r['mean_error']:>8.2f} | {anchors}{note}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Quantize images to the GDT palette as indexed PNGs')
+    parser.add_argument('inputs', nargs='+', metavar='PATH', help='Images, directories of PNGs, or quoted globs')
+    parser.add_argument('--accent', help='Brand accent hex (default: from src/data, else detected)')
+    parser.add_argument('--background', help='Background hex (default: #0C0C0E for covers, #141418 otherwise)')
+    parser.add_argument('--steps', type=int, default=DEFAULT_STEPS,
+                        help=f'Colors per anti-aliasing ramp (default: {DEFAULT_STEPS})')
+    parser.add_argument('--fit', action='store_true', help="Fit the anchors to the image's own colors")
+    parser.add_argument('--max-error', type=float,
+                        help='Do not write images whose max color error exceeds this')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--in-place', action='store_true', help='Replace the source files')
+    output.add_argument('--dry-run', action='store_true', help='Report only; write nothing')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print(f"Error: no images matched {' '.join(args.inputs)}")
+        sys.exit(1)
+
+    accents = brand_accents()
+    print(f"Quantizing {len(paths)} images ({args.steps}-step ramps{', fitted anchors' if args.fit else ''})")
+    start = time.perf_counter()
+    tasks = []
+    for path in paths:
+        output_path = None if args.dry_run else (path if args.in_place else variant_path(path, 'indexed'))
+        tasks.append((path, (output_path, args.accent, args.background, args.steps, args.fit, args.max_error,
+                             accents)))
+    results = run_files(quantize_file, tasks, {'output': None, 'before': 0, 'after': 0}, args.workers,
+                        lambda r: ("❌" if r['error'] else "✅", r['output'] or r['path']))
+    print_results_table(results)
+
+    done = [r for r in results if 'colors' in r]
+    if done:
+        before = sum(r['before'] for r in done)
+        after = sum(r['after'] for r in done)
+        print(f"\n📊 {before / 1e6:.1f} MB → {after / 1e6:.1f} MB ({before / after:.1f}x smaller), "
+              f"worst max error {max(r['max_error'] for r in done):.1f}")
+    print(f"Done in {time.perf_counter() - start:.2f}s")
+    if any(r['error'] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Recolor the accent of finished images to derive other brands' variants.
+
+Several brands share the same growth-profile art, and variants like
+zyn-foundation-purple.png differ from their source only in the accent color,
+so a new generation is not needed to change it. Accent pixels are found by
+hue and saturation: within --hue-tolerance degrees of the old accent's hue
+and saturated enough not to be cream line work or background. Each one is
+remapped in HSV, with the hue shifted and saturation and value scaled by
+new/old, so the accent maps exactly to the new accent and its anti-aliasing
+ramps (toward the background, toward the cream lines) keep their shape.
+Hues near the edge of the tolerance are blended so no hard seam appears.
+
+The old accent is the brand's accentColor (src/data/*.ts) when the file
+name starts with a brand id, otherwise the most common saturated hue in the
+image; --from overrides it. --to is a brand id or a hex color. Outputs are
+written beside the input as <brand>-<name>.png (the source brand prefix
+replaced) or <name>-<hex>.png, unless --in-place or --output-dir.
+
+Usage:
+  python scripts/recolor_accent.py public/growth-systems/foundation-reinforcement.png --to zyn
+  python scripts/recolor_accent.py public/growth-systems --to "#0066CC" --output-dir /tmp/geico
+  python scripts/recolor_accent.py public/zyn-cover.png --from "#6B46C1" --to ripple --in-place
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from fix_image_background import DEFAULT_THRESHOLD, expand_inputs, hex_to_rgb, run_files, save_png_atomic
+from png_strips import metadata_chunks
+from quantize_palette import brand_accent, brand_accents, detect_accent, to_hex, unique_colors
+
+DEFAULT_HUE_TOLERANCE = 30.0   # degrees either side of the old accent's hue
+DEFAULT_MIN_SATURATION = 0.25  # cream (#EDE8DF) is 0.06, the site backgrounds under 0.15
+FEATHER = 1 / 3                # outer share of the tolerance blended toward the original
+HEX_COLOR = re.compile(r'#[0-9A-Fa-f]{6}')
+
+
+def rgb_to_hsv(rgb):
+    """(n, 3) float RGB in 0-255 → (n, 3) HSV with hue in degrees and saturation, value in 0-1."""
+    rgb = rgb / 255.0
+    high = rgb.max(axis=1)
+    delta = high - rgb.min(axis=1)
+    r, g, b = rgb.T
+    safe = np.where(delta > 0, delta, 1)
+    hue = np.select([delta == 0, high == r, high == g],
+                    [0.0, ((g - b) / safe) % 6, (b - r) / safe + 2],
+                    (r - g) / safe + 4) * 60
+    saturation = np.where(high > 0, delta / np.where(high > 0, high, 1), 0)
+    return np.stack([hue, saturation, high], axis=1)
+
+
+def hsv_to_rgb(hsv):
+    """Inverse of rgb_to_hsv, back to float RGB in 0-255."""
+    hue, saturation, value = hsv.T
+    sector = hue / 60 % 6
+    chroma = value * saturation
+    x = chroma * (1 - np.abs(sector % 2 - 1))
+    zero = np.zeros_like(chroma)
+    index = sector.astype(int)
+    r = np.choose(index, [chroma, x, zero, zero, x, chroma])
+    g = np.choose(index, [x, chroma, chroma, x, zero, zero])
+    b = np.choose(index, [zero, zero, x, chroma, chroma, x])
+    return (np.stack([r, g, b], axis=1) + (value - chroma)[:, None]) * 255
+
+
+def hue_distance(hue, reference):
+    return np.abs((hue - reference + 180) % 360 - 180)
+
+
+def recolor_colors(colors, old_accent, new_accent, hue_tolerance=DEFAULT_HUE_TOLERANCE,
+                   min_saturation=DEFAULT_MIN_SATURATION, threshold=DEFAULT_THRESHOLD):
+    """(recolored (n, 3) float colors, weight per color: 0 untouched .. 1 fully remapped)."""
+    hsv = rgb_to_hsv(colors)
+    old_h, old_s, old_v = rgb_to_hsv(np.array([hex_to_rgb(old_accent)], dtype=np.float64))[0]
+    new_h, new_s, new_v = rgb_to_hsv(np.array([hex_to_rgb(new_accent)], dtype=np.float64))[0]
+
+    # Full weight inside the tolerance, fading to zero over its outer FEATHER
+    feather = hue_tolerance * FEATHER
+    weight = np.clip((hue_tolerance - hue_distance(hsv[:, 0], old_h)) / feather, 0, 1)
+    weight[hsv[:, 1] < min_saturation] = 0
+    weight[(colors < threshold).all(axis=1)] = 0  # background, as fix_image_background.py sees it
+
+    remapped = np.stack([
+        (hsv[:, 0] + new_h - old_h) % 360,
+        np.clip(hsv[:, 1] * new_s / max(old_s, 1e-6), 0, 1),
+        np.clip(hsv[:, 2] * new_v / max(old_v, 1e-6), 0, 1)
+    ], axis=1)
+    recolored = colors + weight[:, None] * (hsv_to_rgb(remapped) - colors)
+    return recolored, weight
+
+
+def recolor_pixels(rgba, old_accent, new_accent, **options):
+    """(recolored copy of an (h, w, 4) uint8 array, pixels changed). Alpha is kept."""
+    colors, counts, inverse = unique_colors(rgba[..., :3])
+    recolored, _ = recolor_colors(colors, old_accent, new_accent, **options)
+    recolored = np.clip(np.rint(recolored), 0, 255)
+    out = rgba.copy()
+    out[..., :3] = recolored.astype(np.uint8)[inverse].reshape(rgba.shape[:2] + (3,))
+    return out, int(counts[(recolored != colors).any(axis=1)].sum())
+
+
+# ============================================================================
+# BATCH
+# ============================================================================
+
+def resolve_accent(value, accents):
+    """Hex color for a brand id or a hex color."""
+    if HEX_COLOR.fullmatch(value):
+        return value.upper()
+    if value in accents:
+        return accents[value]
+    raise ValueError(f"not a brand id or #RRGGBB color: {value}")
+
+
+def source_accent(image_path, rgba, accents, old=None):
+    """The accent to replace: --from, the file's brand accent, or the image's most common saturated hue."""
+    if old:
+        return resolve_accent(old, accents)
+    accent = brand_accent(image_path, accents)
+    if accent:
+        return accent
+    colors, counts, _ = unique_colors(rgba[..., :3])
+    detected = detect_accent(colors, counts)
+    if detected is None:
+        raise ValueError("no accent color found; pass --from")
+    return to_hex(detected)
+
+
+def output_path(image_path, new, accents, output_dir=None, in_place=False):
+    image_path = Path(image_path)
+    if in_place:
+        return image_path
+    stem = image_path.stem
+    if new in accents:
+        source_brands = [brand for brand in accents if stem.startswith(brand + '-')]
+        if source_brands:
+            stem = stem[len(max(source_brands, key=len)) + 1:]
+        name = f"{new}-{stem}.png"
+    else:
+        name = f"{stem}-{new.lstrip('#').lower()}.png"
+    return Path(output_dir or image_path.parent) / name
+
+
+def recolor_file(image_path, new, old=None, output_dir=None, in_place=False, hue_tolerance=DEFAULT_HUE_TOLERANCE,
+                 min_saturation=DEFAULT_MIN_SATURATION, accents=None, overwrite=False):
+    """Recolor one image in a batch worker; returns its result fields."""
+    accents = brand_accents() if accents is None else accents
+    target = output_path(image_path, new, accents, output_dir, in_place)
+    if target.exists() and not (in_place or overwrite):
+        raise FileExistsError(f"{target} exists; pass --overwrite to replace it")
+    with Image.open(image_path) as img:
+        rgba = np.asarray(img.convert('RGBA'))
+    old_color, new_color = source_accent(image_path, rgba, accents, old), resolve_accent(new, accents)
+    recolored, changed = recolor_pixels(rgba, old_color, new_color, hue_tolerance=hue_tolerance,
+                                        min_saturation=min_saturation)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    save_png_atomic(recolored, target, metadata_chunks(image_path))
+    return {'output': str(target), 'from': old_color, 'to': new_color, 'changed': changed,
+            'total': rgba.shape[0] * rgba.shape[1]}
+
+
+def run_batch(paths, new, old=None, output_dir=None, in_place=False, hue_tolerance=DEFAULT_HUE_TOLERANCE,
+              min_saturation=DEFAULT_MIN_SATURATION, workers=None, overwrite=False, accents=None):
+    """Recolor every image on a process pool. Returns result rows sorted by path."""
+    accents = brand_accents() if accents is None else accents
+    args = (new, old, output_dir, in_place, hue_tolerance, min_saturation, accents, overwrite)
+    return run_files(recolor_file, [(path, args) for path in paths],
+                     {'output': None, 'from': None, 'to': None, 'changed': 0, 'total': 0}, workers)
+
+
+def print_results_table(results):
+    width = max([len(r['path']) for r in results] + [4])
+    print(f"\n{'File':<{width}} | {'From':<7} | {'To':<7} | {'Recolored px':>12} | {'Share':>6} | Output")
+    print(f"{'-' * width}-+-{'-' * 7}-+-{'-' * 7}-+-{'-' * 12}-+-{'-' * 6}-+-{'-' * 30}")
+    for r in results:
+        if r['error']:
+            print(f"{r['path']:<{width}} | {'-':<7} | {'-':<7} | {'-':>12} | {'-':>6} | failed: {r['error']}")
+        else:
+            percent = r['changed'] / r['total'] * 100 if r['total'] else 0.0
+            print(f"{r['path']:<{width}} | {r['from']:<7} | {r['to']:<7} | {r['changed']:>12,} | "
+                  f"{percent:>5.1f}% | {r['output']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recolor the accent of images to another brand or color')
+    parser.add_argument('inputs', nargs='+', metavar='PATH',
+                        help='Image file(s), directories of PNGs, or quoted globs')
+    parser.add_argument('--to', required=True, metavar='BRAND|#RRGGBB', help='New accent: brand id or hex color')
+    parser.add_argument('--from', dest='old', metavar='BRAND|#RRGGBB',
+                        help="Accent to replace (default: the file's brand accent, else detected)")
+    parser.add_argument('--hue-tolerance', type=float, default=DEFAULT_HUE_TOLERANCE,
+                        help=f'Degrees of hue around the old accent that count as accent '
+                             f'(default: {DEFAULT_HUE_TOLERANCE:g})')
+    parser.add_argument('--min-saturation', type=float, default=DEFAULT_MIN_SATURATION,
+                        help=f'Less saturated pixels are never recolored (default: {DEFAULT_MIN_SATURATION:g})')
+    location = parser.add_mutually_exclusive_group()
+    location.add_argument('--output-dir', type=Path, help='Write recolored images here')
+    location.add_argument('--in-place', action='store_true', help='Overwrite the inputs')
+    parser.add_argument('--overwrite', action='store_true', help='Replace existing output files')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print(f"Error: no images matched {' '.join(args.inputs)}")
+        sys.exit(1)
+
+    # zyn-growth-summary.png and geico-growth-summary.png both become <brand>-growth-summary.png
+    accents = brand_accents()
+    outputs = {}
+    for path in paths:
+        outputs.setdefault(output_path(path, args.to, accents, args.output_dir, args.in_place), []).append(path)
+    clashes = {output: sources for output, sources in outputs.items() if len(sources) > 1}
+    if clashes:
+        for output, sources in clashes.items():
+            print(f"Error: {', '.join(map(str, sources))} would all be written to {output}")
+        sys.exit(1)
+
+    print(f"Recoloring {len(paths)} images to {args.to}")
+    start = time.perf_counter()
+    results = run_batch(paths, args.to, args.old, args.output_dir, args.in_place, args.hue_tolerance,
+                        args.min_saturation, args.workers, args.overwrite, accents)
+    print_results_table(results)
+
+    failed = sum(1 for r in results if r['error'])
+    print(f"\nDone! {len(results) - failed}/{len(results)} images recolored in {time.perf_counter() - start:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
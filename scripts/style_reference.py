@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Compact style references for images.edit uploads.
+
+Every generation uploads the Espolon cover (IMAGE-STANDARDS.md) as its style
+reference, and the file as saved is a 1.8 MB full-color PNG - mostly noise
+in the near-black background. The model only needs the look of it, so
+before upload the reference is:
+
+  - scaled down to no more than the size being generated (a 1024x1024 job
+    gains nothing from a larger reference; --ref-size caps it further)
+  - quantized to the site palette with anchors fitted to the image itself
+    (quantize_palette.py), so its background, cream and accent keep their
+    exact hues
+  - re-encoded as an optimized indexed PNG
+
+The result is cached in .image-cache/style-refs/ keyed on the source bytes
+and the settings, so it is built once, not once per run. If shrinking does
+not make the file smaller the original bytes are uploaded unchanged.
+
+    data = style_ref_bytes(STYLE_REF, max_side=1024)
+
+Usage:
+  python scripts/style_reference.py
+  python scripts/style_reference.py public/espolon-cover.png --size 768
+"""
+
+import argparse
+import io
+import json
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from build_image_variants import dominant_color
+from conversion_cache import hash_bytes
+from fix_image_background import atomic_output
+from generation_cache import CACHE_DIR
+from quantize_palette import DEFAULT_STEPS, encode_png, quantize_pixels
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_REF = PROJECT_ROOT / 'public' / 'espolon-cover.png'
+DEFAULT_SIDE = 1024  # generate_images.py SIZE
+REF_CACHE_DIR = CACHE_DIR / 'style-refs'
+
+# Bump when the shrinking itself changes, so cached references are rebuilt
+_VERSION = 1
+
+
+def size_side(size: str) -> Optional[int]:
+    """Longest side of an images API size ('1536x1024' -> 1536); None for 'auto'."""
+    match = re.fullmatch(r'(\d+)x(\d+)', size)
+    return max(int(match.group(1)), int(match.group(2))) if match else None
+
+
+def shrink_style_ref(data: bytes, max_side: Optional[int] = None, steps: int = DEFAULT_STEPS) -> bytes:
+    """Downscaled (to max_side), palette-quantized PNG bytes of a reference; `data` if that is not smaller."""
+    with Image.open(io.BytesIO(data)) as img:
+        image = img.convert('RGBA')
+    if max_side and max(image.size) > max_side:
+        scale = max_side / max(image.size)
+        image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                             Image.LANCZOS)
+    pixels = np.asarray(image)
+
+    if pixels[..., 3].min() == 255:
+        indexed, _ = quantize_pixels(pixels, dominant_color(pixels), None, steps, fit=True)
+        shrunk = encode_png(indexed)
+    else:
+        shrunk = encode_png(image)  # transparent references are only resized
+    return shrunk if len(shrunk) < len(data) else data
+
+
+def style_ref_bytes(path: Path, max_side: Optional[int] = None, steps: int = DEFAULT_STEPS,
+                    cache_dir: Optional[Path] = REF_CACHE_DIR) -> bytes:
+    """The upload-ready reference for `path`, from the cache when it was built before (cache_dir None: no cache)."""
+    data = Path(path).read_bytes()
+    settings = json.dumps({'max_side': max_side, 'steps': steps, 'version': _VERSION}, sort_keys=True)
+    cached = cache_dir / f"{hash_bytes(data + settings.encode('utf-8'))}.png" if cache_dir else None
+    if cached:
+        try:
+            return cached.read_bytes()
+        except FileNotFoundError:
+            pass
+
+    shrunk = shrink_style_ref(data, max_side, steps)
+    if cached:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(cached) as f:
+            f.write(shrunk)
+    return shrunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the compact style reference uploaded with images.edit')
+    parser.add_argument('path', nargs='?', type=Path, default=DEFAULT_REF,
+                        help=f'Reference image (default: {DEFAULT_REF.relative_to(PROJECT_ROOT)})')
+    parser.add_argument('--size', type=int, default=DEFAULT_SIDE,
+                        help=f'Longest side in pixels (default: {DEFAULT_SIDE})')
+    parser.add_argument('--steps', type=int, default=DEFAULT_STEPS,
+                        help=f'Palette ramp steps (default: {DEFAULT_STEPS})')
+    parser.add_argument('--output', type=Path, help='Also write the result here')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    original = args.path.read_bytes()
+    shrunk = style_ref_bytes(args.path, args.size, args.steps)
+    with Image.open(io.BytesIO(original)) as before, Image.open(io.BytesIO(shrunk)) as after:
+        print(f"✅ {args.path.name}: {before.width}x{before.height} {before.mode}, {len(original) / 1024:.0f} KB -> "
+              f"{after.width}x{after.height} {after.mode}, {len(shrunk) / 1024:.0f} KB "
+              f"({1 - len(shrunk) / len(original):.0%} smaller, {time.perf_counter() - start:.2f}s)")
+    if args.output:
+        with atomic_output(args.output) as f:
+            f.write(shrunk)
+        print(f"📝 Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
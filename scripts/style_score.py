@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Style-consistency scoring of generated images against the style reference.
+
+IMAGE-STANDARDS.md asks for the look of the Espolon cover: bold, thick cream
+strokes on a dark ground with a little accent color. Getting there used to
+mean rewriting a prompt and regenerating one image at a time
+(generate_hogwarts_cover.py through _v4.py). generate_images.py --candidates N
+instead asks for N images per job and keeps the one closest to the reference
+on three vectorized measurements:
+
+  - stroke width histogram: per line pixel, the shorter of its horizontal and
+    vertical run through the line mask (scaled to a 1024 px wide image),
+    compared as the earth mover's distance between the two histograms
+  - edge density: share of pixels with a strong luminance gradient
+  - accent coverage: share of saturated, bright pixels
+
+Each is turned into a relative distance from the reference and the weighted
+sum ranks the candidates (lower is closer). The ranking is written next to
+the promoted image as <output>.scores.json.
+
+Usage:
+  python scripts/style_score.py public/*-cover.png
+  python scripts/style_score.py public/hogwarts-legacy-cover.png --reference public/espolon-cover.png
+"""
+
+import argparse
+import io
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from PIL import Image
+
+from fix_image_background import atomic_output
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_REF = PROJECT_ROOT / 'public' / 'espolon-cover.png'
+
+LINE_MIN_VALUE = 140          # strokes: bright ...
+LINE_MAX_SATURATION = 0.3     # ... and near neutral (cream)
+ACCENT_MIN_SATURATION = 0.4   # same cut-offs as quantize_palette.detect_accent
+ACCENT_MIN_VALUE = 80
+EDGE_THRESHOLD = 64           # |dx| + |dy| of luminance
+REFERENCE_WIDTH = 1024        # stroke widths are measured as if at this width
+MAX_STROKE = 48               # last histogram bin collects everything wider
+
+WEIGHTS = {'stroke': 1.0, 'edges': 1.0, 'accent': 0.5}
+
+
+@dataclass
+class StyleProfile:
+    stroke_histogram: List[float]  # share of line pixels per stroke width (px at REFERENCE_WIDTH)
+    stroke_median: float
+    line_coverage: float
+    edge_density: float
+    accent_coverage: float
+
+    def summary(self) -> dict:
+        """Profile without the histogram, rounded for the sidecar."""
+        return {name: round(value, 4) for name, value in asdict(self).items() if name != 'stroke_histogram'}
+
+
+def run_lengths(mask: np.ndarray) -> np.ndarray:
+    """For each True pixel, the length of the horizontal run of True pixels it belongs to (0 elsewhere)."""
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1).ravel()
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+
+    lengths_per_pixel = np.zeros(height * (width + 1), dtype=np.int32)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    lengths_per_pixel[np.repeat(starts, lengths) + offsets] = np.repeat(lengths, lengths)
+    return lengths_per_pixel.reshape(height, width + 1)[:, :width]
+
+
+def stroke_widths(mask: np.ndarray) -> np.ndarray:
+    """Per True pixel (in mask[mask] order), the shorter of its horizontal and vertical runs: the local stroke width."""
+    return np.minimum(run_lengths(mask), run_lengths(mask.T).T)[mask]
+
+
+def luminance(pixels: np.ndarray) -> np.ndarray:
+    """Integer Rec. 601 luma (0-255) of an (h, w, 3 or 4) uint8 image."""
+    rgb = pixels[..., :3].astype(np.int32)
+    return (rgb[..., 0] * 77 + rgb[..., 1] * 150 + rgb[..., 2] * 29) >> 8
+
+
+def style_profile(pixels: np.ndarray) -> StyleProfile:
+    """Profile of an (h, w, 3 or 4) uint8 image."""
+    rgb = pixels[..., :3].astype(np.int16)
+    value = rgb.max(axis=-1)
+    saturation = (value - rgb.min(axis=-1)) / np.maximum(value, 1)
+
+    line = (value >= LINE_MIN_VALUE) & (saturation <= LINE_MAX_SATURATION)
+    widths = stroke_widths(line) * (REFERENCE_WIDTH / line.shape[1])
+    histogram = np.bincount(np.minimum(np.rint(widths), MAX_STROKE).astype(np.int64), minlength=MAX_STROKE + 1)
+    histogram = histogram / max(histogram.sum(), 1)
+
+    luma = luminance(pixels)
+    gradient = np.abs(np.diff(luma, axis=1))[:-1] + np.abs(np.diff(luma, axis=0))[:, :-1]
+
+    return StyleProfile(
+        stroke_histogram=histogram.tolist(),
+        stroke_median=float(np.median(widths)) if widths.size else 0.0,
+        line_coverage=float(line.mean()),
+        edge_density=float((gradient > EDGE_THRESHOLD).mean()),
+        accent_coverage=float(((saturation >= ACCENT_MIN_SATURATION) & (value >= ACCENT_MIN_VALUE)).mean())
+    )
+
+
+def profile_bytes(data: bytes) -> StyleProfile:
+    with Image.open(io.BytesIO(data)) as img:
+        return style_profile(np.asarray(img.convert('RGB')))
+
+
+def profile_file(path: Path) -> StyleProfile:
+    return profile_bytes(Path(path).read_bytes())
+
+
+def style_distance(candidate: StyleProfile, reference: StyleProfile) -> Dict[str, float]:
+    """Relative distance per measurement and their weighted 'total' (0: same style as the reference)."""
+    # Earth mover's distance between the width histograms, in pixels, relative to the reference stroke
+    cdf_gap = np.abs(np.cumsum(candidate.stroke_histogram) - np.cumsum(reference.stroke_histogram))
+    distances = {
+        'stroke': float(cdf_gap.sum()) / max(reference.stroke_median, 1.0),
+        'edges': abs(candidate.edge_density - reference.edge_density) / max(reference.edge_density, 1e-3),
+        'accent': abs(candidate.accent_coverage - reference.accent_coverage) / max(reference.accent_coverage, 5e-3)
+    }
+    distances['total'] = sum(WEIGHTS[name] * value for name, value in distances.items())
+    return distances
+
+
+def rank_candidates(candidates: List[bytes], reference: StyleProfile) -> List[dict]:
+    """One entry per candidate ({index, distance, profile}), closest to the reference first."""
+    ranking = []
+    for index, data in enumerate(candidates):
+        profile = profile_bytes(data)
+        ranking.append({
+            'index': index,
+            'distance': {name: round(value, 4) for name, value in style_distance(profile, reference).items()},
+            'profile': profile.summary()
+        })
+    return sorted(ranking, key=lambda entry: entry['distance']['total'])
+
+
+def scores_path(output: Path) -> Path:
+    """Sidecar of an image: public/zyn-cover.png -> public/zyn-cover.scores.json."""
+    return output.with_suffix('.scores.json')
+
+
+def write_scores(output: Path, reference_path: Path, reference: StyleProfile, ranking: List[dict]) -> Path:
+    path = scores_path(output)
+    sidecar = {
+        'image': output.name,
+        'reference': reference_path.name,
+        'reference_profile': reference.summary(),
+        'weights': WEIGHTS,
+        'promoted': ranking[0]['index'],
+        'candidates': ranking
+    }
+    with atomic_output(path) as f:
+        f.write((json.dumps(sidecar, indent=2) + '\n').encode('utf-8'))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score images for style consistency with the style reference')
+    parser.add_argument('inputs', nargs='+', type=Path, metavar='PATH', help='Images to score')
+    parser.add_argument('--reference', type=Path, default=DEFAULT_REF,
+                        help=f'Style reference (default: {DEFAULT_REF.relative_to(PROJECT_ROOT)})')
+    args = parser.parse_args()
+
+    reference = profile_file(args.reference)
+    ranking = rank_candidates([path.read_bytes() for path in args.inputs], reference)
+
+    width = max([len(path.name) for path in args.inputs] + [len(args.reference.name) + 2, 5])
+    print(f"{'Image':<{width}} | {'Distance':>8} | {'Stroke':>6} | {'Edges':>6} | {'Accent':>6} | "
+          f"{'Stroke px':>9} | {'Edge %':>6} | {'Accent %':>8}")
+    print(f"{'-' * width}-+-{'-' * 8}-+-{'-' * 6}-+-{'-' * 6}-+-{'-' * 6}-+-{'-' * 9}-+-{'-' * 6}-+-{'-' * 8}")
+    rows = [(args.reference.name + ' *', None, reference.summary())]
+    rows += [(args.inputs[entry['index']].name, entry['distance'], entry['profile']) for entry in ranking]
+    for name, distance, profile in rows:
+        scores = (f"{distance['total']:>8.3f} | {distance['stroke']:>6.3f} | {distance['edges']:>6.3f} | "
+                  f"{distance['accent']:>6.3f}") if distance else f"{'-':>8} | {'-':>6} | {'-':>6} | {'-':>6}"
+        print(f"{name:<{width}} | {scores} | {profile['stroke_median']:>9.1f} | "
+              f"{profile['edge_density']:>6.1%} | {profile['accent_coverage']:>8.1%}")
+    print("\n* reference; lower distance is closer to its style")
+
+
+if __name__ == "__main__":
+    main()
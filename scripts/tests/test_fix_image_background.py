@@ -0,0 +1,28 @@
+"""Fixed images keep the source's color profile and text, whole or band by band."""
+
+import numpy as np
+from PIL import Image
+
+from fix_image_background import fix_image
+from png_strips import _SAMPLE_METADATA, metadata_chunks, save_options
+
+
+def tagged_render(path, size=96):
+    pixels = np.full((size, size, 4), (12, 12, 14, 255), dtype=np.uint8)
+    pixels[::5] = (237, 232, 223, 255)
+    Image.fromarray(pixels, 'RGBA').save(path, 'PNG', **save_options(_SAMPLE_METADATA))
+
+
+def test_fix_keeps_icc_profile_and_text(tmp_path):
+    source, whole, banded = tmp_path / 'render.png', tmp_path / 'whole.png', tmp_path / 'banded.png'
+    tagged_render(source)
+
+    fix_image(source, [(whole, '#141418')], strip_rows=0)
+    fix_image(source, [(banded, '#141418')], strip_rows=16)
+
+    with Image.open(whole) as img:
+        img.load()
+        assert img.info['icc_profile'] == Image.open(source).info['icc_profile']
+        assert img.info['Software'] == 'gpt-image-1.5'
+    assert [chunk for chunk, _ in metadata_chunks(whole)] == [b'iCCP', b'gAMA', b'tEXt', b'iTXt']
+    assert banded.read_bytes() == whole.read_bytes()
@@ -0,0 +1,89 @@
+"""Reconverting a brand must not lose what was added to its module by hand."""
+
+from pathlib import Path
+
+import pytest
+
+from gdt_bench.corpus import generate_corpus
+from gdt_converter_v3 import find_brand_folders, reconvert_brand, run_batch
+from ts_emitter import DEFAULT_BUDGET_KB, module_entries, object_entries
+
+
+@pytest.fixture
+def converted(tmp_path):
+    """(outputs root, output dir, module path) after a first batch conversion of one synthetic brand."""
+    outputs_root, output_dir = tmp_path / 'outputs', tmp_path / 'data'
+    generate_corpus(outputs_root, brands=1, words=20)
+    [result] = run_batch(outputs_root, output_dir, '#E54B7B', write_report=False, workers=1)
+    assert not result['errors']
+    return outputs_root, output_dir, Path(result['output'])
+
+
+def add_hand_edits(module: Path) -> None:
+    """Edit a generated module the way src/data modules are maintained: password, growthSummary, own accent."""
+    text = module.read_text()
+    text = text.replace("accentColor: '#E54B7B'", "accentColor: '#FFD700', // brand yellow\n    password: 'secret2026'")
+    text = text.replace("  totalScore:", "  // Hand-written\n  growthSummary: {\n    headline: 'It\\'s built, not bought',\n"
+                                          "    sequence: 'Build → Scale'\n  },\n  totalScore:", 1)
+    module.write_text(text)
+
+
+def test_batch_keeps_hand_added_fields(converted):
+    outputs_root, output_dir, module = converted
+    add_hand_edits(module)
+
+    [result] = run_batch(outputs_root, output_dir, '#123456', write_report=False, workers=1, force=True)
+
+    assert not result['errors']
+    entries = module_entries(module)
+    brand = object_entries(entries['brand'])
+    assert brand['password'] == "'secret2026'"
+    assert brand['accentColor'] == "'#FFD700'"
+    summary = object_entries(entries['growthSummary'])
+    assert summary == {'headline': "'It\\'s built, not bought'", 'sequence': "'Build → Scale'"}
+    assert 'growthSystem' in entries and 'components' in entries
+
+
+def test_batch_gives_new_brands_the_fallback_accent(converted):
+    outputs_root, output_dir, module = converted
+    module.unlink()
+
+    run_batch(outputs_root, output_dir, '#123456', write_report=False, workers=1, force=True)
+
+    brand = object_entries(module_entries(module)['brand'])
+    assert brand['accentColor'] == "'#123456'"
+    assert 'password' not in brand
+
+
+def test_batch_refuses_to_overwrite_an_unreadable_module(converted):
+    outputs_root, output_dir, module = converted
+    module.write_text("export const broken: GDTAnalysis = { brand: { name: 'x' ")
+
+    [result] = run_batch(outputs_root, output_dir, '#123456', write_report=False, workers=1, force=True)
+
+    assert result['errors'] and 'cannot read the module back' in result['errors'][0]
+    assert module.read_text() == "export const broken: GDTAnalysis = { brand: { name: 'x' "
+
+
+def test_watch_reconversion_keeps_hand_added_fields(converted):
+    outputs_root, output_dir, module = converted
+    add_hand_edits(module)
+    [gdt_folder] = find_brand_folders(outputs_root)
+
+    result = reconvert_brand(gdt_folder, set(), output_dir, '#123456', compact=False,
+                             budget_kb=DEFAULT_BUDGET_KB, component_cache={})
+
+    assert result['output'] == module
+    brand = object_entries(module_entries(module)['brand'])
+    assert brand['password'] == "'secret2026'"
+    assert brand['accentColor'] == "'#FFD700'"
+    assert 'growthSummary' in module_entries(module)
+
+
+def test_unchanged_reconversion_writes_nothing(converted):
+    outputs_root, output_dir, _ = converted
+    run_batch(outputs_root, output_dir, '#E54B7B', write_report=True, workers=1, force=True)
+
+    [result] = run_batch(outputs_root, output_dir, '#E54B7B', write_report=True, workers=1, force=True)
+
+    assert result['written'] == 0
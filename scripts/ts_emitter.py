@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Streaming TypeScript emitter shared by the GDT converters.
+
+Writes a brand's GDTAnalysis module straight to a file handle instead of
+building nested strings in memory. Strings are escaped with the C-accelerated
+JSON encoder (so newlines, tabs, quotes and control characters are all safe)
+and emitted single-quoted to match the hand-maintained src/data modules.
+
+Two layouts:
+- pretty: the layout the converters have always produced (2-space indent,
+  short string lists inline)
+- compact: no whitespace, for the smallest possible module
+
+emit_module() streams to a temp file while hashing and counting bytes, only
+replaces the target when the bytes differ, and flags modules that exceed a
+size budget.
+
+module_entries() reads the top-level fields of an existing module back as
+source text, so fields added by hand (brand.password, growthSummary) can be
+re-emitted verbatim as RawTS values when a brand is reconverted.
+"""
+
+import ast
+import hashlib
+import io
+import os
+import re
+from dataclasses import dataclass
+from json.encoder import encode_basestring  # C implementation when available
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+from conversion_cache import hash_file
+
+DEFAULT_BUDGET_KB = 512
+
+# Keys that can be written without quotes
+IDENTIFIER = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
+IDENTIFIER_PREFIX = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*')
+
+# Flush the write buffer once it holds this many characters
+FLUSH_CHARS = 64 * 1024
+
+# The brand accent as either layout writes it
+ACCENT_COLOR = re.compile(r"accentColor:\s*'(#[0-9A-Fa-f]{6})'")
+
+# Start of a module's exported object: `export const zynAnalysis: GDTAnalysis = {`
+EXPORT_OBJECT = re.compile(r'export\s+const\s+[A-Za-z_$][\w$]*\s*(?::\s*[\w$.<>\[\]]+\s*)?=\s*\{')
+
+
+class RawTS(str):
+    """TypeScript source emitted as is (a field copied from an existing module)."""
+
+
+def ts_string(value: str) -> str:
+    """Escape a string as a single-quoted TypeScript literal."""
+    encoded = encode_basestring(value)
+    if '"' in value:
+        encoded = encoded.replace('\\"', '"')
+    if "'" in value:
+        encoded = encoded.replace("'", "\\'")
+    return "'" + encoded[1:-1] + "'"
+
+
+def ts_key(key) -> str:
+    """Object key, quoted only when it is not a plain identifier."""
+    key = str(key)
+    return key if IDENTIFIER.match(key) else ts_string(key)
+
+
+def emit_value(value, write: Callable[[str], object], compact: bool = False, depth: int = 0) -> None:
+    """Write a Python value as a TypeScript literal through `write`."""
+    if isinstance(value, RawTS):
+        write(value)
+    elif value is None:
+        write('null')
+    elif isinstance(value, bool):
+        write('true' if value else 'false')
+    elif isinstance(value, (int, float)):
+        write(str(value))
+    elif isinstance(value, str):
+        write(ts_string(value))
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            write('[]')
+            return
+        if compact or (len(value) <= 3 and all(isinstance(item, str) for item in value)):
+            separator = ',' if compact else ', '
+            write('[')
+            for i, item in enumerate(value):
+                if i:
+                    write(separator)
+                emit_value(item, write, compact, depth + 1)
+            write(']')
+            return
+        pad = '  ' * (depth + 1)
+        last = len(value) - 1
+        write('[\n')
+        for i, item in enumerate(value):
+            write(pad)
+            emit_value(item, write, compact, depth + 1)
+            write(',\n' if i < last else '\n')
+        write('  ' * depth + ']')
+    elif isinstance(value, dict):
+        if not value:
+            write('{}')
+            return
+        if compact:
+            write('{')
+            for i, (key, item) in enumerate(value.items()):
+                if i:
+                    write(',')
+                write(ts_key(key) + ':')
+                emit_value(item, write, compact, depth + 1)
+            write('}')
+            return
+        pad = '  ' * (depth + 1)
+        last = len(value) - 1
+        write('{\n')
+        for i, (key, item) in enumerate(value.items()):
+            write(f"{pad}{ts_key(key)}: ")
+            emit_value(item, write, compact, depth + 1)
+            write(',\n' if i < last else '\n')
+        write('  ' * depth + '}')
+    else:
+        write(ts_string(str(value)))
+
+
+def write_typescript(fh: TextIO, data: dict, var_name: str, header_lines: List[str],
+                     compact: bool = False) -> None:
+    """Stream a complete GDTAnalysis module to a text file handle."""
+    fh.write("import { GDTAnalysis } from '@/lib/types';\n\n/**\n")
+    for line in header_lines:
+        fh.write(f" * {line}\n")
+    fh.write(f" */\nexport const {var_name}Analysis: GDTAnalysis = ")
+    emit_value(data, fh.write, compact)
+    fh.write(';\n')
+
+
+def render_typescript(data: dict, var_name: str, header_lines: List[str],
+                      compact: bool = False) -> str:
+    """Render the module to a string (for callers that need it in memory)."""
+    buffer = io.StringIO()
+    write_typescript(buffer, data, var_name, header_lines, compact)
+    return buffer.getvalue()
+
+
+def _skip_blank(text: str, i: int) -> int:
+    """Index of the next character that is not whitespace or inside a comment."""
+    while i < len(text):
+        if text[i].isspace():
+            i += 1
+        elif text.startswith('//', i):
+            end = text.find('\n', i)
+            i = len(text) if end < 0 else end + 1
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            if end < 0:
+                raise ValueError("unterminated comment")
+            i = end + 2
+        else:
+            break
+    return i
+
+
+def _string_end(text: str, i: int) -> int:
+    """Index just past the string literal starting at text[i]."""
+    quote = text[i]
+    i += 1
+    while i < len(text):
+        if text[i] == '\\':
+            i += 2
+        elif text[i] == quote:
+            return i + 1
+        else:
+            i += 1
+    raise ValueError("unterminated string")
+
+
+def _value_end(text: str, i: int) -> Tuple[int, int]:
+    """
+    For the value starting at text[i]: (index of the ',' or closing bracket
+    that ends it, index just past its last character outside comments).
+    """
+    depth = 0
+    last = i
+    while i < len(text):
+        char = text[i]
+        if char in '\'"`':
+            i = last = _string_end(text, i)
+            continue
+        if text.startswith('//', i) or text.startswith('/*', i):
+            i = _skip_blank(text, i)
+            continue
+        if char in '{[(':
+            depth += 1
+        elif char in '}])':
+            if depth == 0:
+                return i, last
+            depth -= 1
+        elif char == ',' and depth == 0:
+            return i, last
+        i += 1
+        if not char.isspace():
+            last = i
+    raise ValueError("unterminated object")
+
+
+def object_entries(text: str, start: int = 0) -> Dict[str, str]:
+    """{key: value source} of the object literal whose '{' is at text[start] (comments are dropped)."""
+    if text[start] != '{':
+        raise ValueError(f"expected '{{' at offset {start}")
+    entries = {}
+    i = _skip_blank(text, start + 1)
+    while text[i] != '}':
+        if text[i] in '\'"':
+            end = _string_end(text, i)
+            key = ast.literal_eval(text[i:end])
+        else:
+            match = IDENTIFIER_PREFIX.match(text, i)
+            if not match:
+                raise ValueError(f"unsupported object key at offset {i}")
+            key, end = match.group(0), match.end()
+        i = _skip_blank(text, end)
+        if text[i] != ':':
+            raise ValueError(f"expected ':' after {key!r}")
+        value_start = _skip_blank(text, i + 1)
+        stop, value_end = _value_end(text, value_start)
+        entries[key] = text[value_start:value_end]
+        i = stop
+        if text[i] == ',':
+            i = _skip_blank(text, i + 1)
+    return entries
+
+
+def module_entries(path: Path) -> Optional[Dict[str, str]]:
+    """
+    Top-level {key: value source} of an existing module's exported object;
+    None if there is no module. Raises ValueError if it cannot be read back.
+    """
+    try:
+        text = Path(path).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    match = EXPORT_OBJECT.search(text)
+    if not match:
+        raise ValueError(f"{path}: no exported object literal")
+    try:
+        return object_entries(text, match.end() - 1)
+    except (IndexError, ValueError) as e:
+        raise ValueError(f"{path}: cannot read the module back ({e or 'unexpected end'})") from None
+
+
+def module_accent(path: Path) -> Optional[str]:
+    """accentColor of an existing brand module; None if there is no module or no accent in it."""
+    try:
+        match = ACCENT_COLOR.search(Path(path).read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+    return match.group(1) if match else None
+
+
+class _HashingWriter:
+    """Text sink that batches writes, then hashes, counts and writes them as UTF-8."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self._chunks: List[str] = []
+        self._pending = 0
+
+    def write(self, text: str) -> None:
+        self._chunks.append(text)
+        self._pending += len(text)
+        if self._pending >= FLUSH_CHARS:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._chunks:
+            return
+        data = ''.join(self._chunks).encode('utf-8')
+        self._chunks = []
+        self._pending = 0
+        self.digest.update(data)
+        self.size += len(data)
+        self.raw.write(data)
+
+
+@dataclass
+class EmitResult:
+    path: Path
+    size: int
+    sha256: str
+    changed: bool
+    over_budget: bool
+
+    def budget_warning(self, budget_kb: int) -> str:
+        return (f"Module {self.path.name} is {self.size / 1024:.0f} KB, "
+                f"over the {budget_kb} KB budget")
+
+
+def emit_module(path: Path, data: dict, var_name: str, header_lines: List[str],
+                compact: bool = False, budget_kb: int = DEFAULT_BUDGET_KB) -> EmitResult:
+    """
+    Stream the module to a temp file beside `path` and move it into place
+    only if its bytes differ from the existing file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+
+    try:
+        with open(tmp_path, 'wb') as raw:
+            writer = _HashingWriter(raw)
+            write_typescript(writer, data, var_name, header_lines, compact)
+            writer.flush()
+
+        sha256 = writer.digest.hexdigest()
+        unchanged = (path.exists() and path.stat().st_size == writer.size
+                     and hash_file(path) == sha256)
+        if unchanged:
+            tmp_path.unlink()
+        else:
+            os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return EmitResult(
+        path=path,
+        size=writer.size,
+        sha256=sha256,
+        changed=not unchanged,
+        over_budget=writer.size > budget_kb * 1024
+    )
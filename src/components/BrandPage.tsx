@@ -1,6 +1,7 @@
 import { GDTAnalysis, getScoreTier, getScoreColor } from '@/lib/types';
 import { ExpandableAnalysis } from '@/components/ExpandableAnalysis';
 import FallbackImage from '@/components/FallbackImage';
+import { getResponsiveImage } from '@/lib/images';
 import PasswordGate from '@/components/PasswordGate';
 import Link from 'next/link';
 import {
@@ -70,10 +71,11 @@ export default function BrandPage({ data }: BrandPageProps) {
 
           {/* Right Square: Cover Illustration */}
           <div className="aspect-square overflow-hidden">
-            <img
-              src={`/${data.brand.id}-cover.png`}
+            <FallbackImage
+              image={getResponsiveImage(`/${data.brand.id}-cover.png`)}
               alt={`${data.brand.name} Growth Diagnosis Cover`}
               className="w-full h-full object-cover"
+              sizes="(min-width: 1024px) 512px, 100vw"
             />
           </div>
         </div>
@@ -95,10 +97,11 @@ export default function BrandPage({ data }: BrandPageProps) {
               <div className="lg:col-span-1 order-2 lg:order-1">
                 <div className="aspect-square rounded-lg overflow-hidden">
                   <FallbackImage
-                    src={`/growth-systems/${data.growthSummary.image ?? 'foundation-reinforcement.png'}`}
-                    fallbackSrc={`/growth-systems/foundation-reinforcement.png`}
+                    image={getResponsiveImage(`/growth-systems/${data.growthSummary.image ?? 'foundation-reinforcement.png'}`)}
+                    fallback={getResponsiveImage('/growth-systems/foundation-reinforcement.png')}
                     alt={`${data.brand.name} Growth Summary`}
                     className="w-full h-full object-cover"
+                    sizes="(min-width: 1024px) 320px, 100vw"
                   />
                 </div>
               </div>
@@ -134,10 +137,11 @@ export default function BrandPage({ data }: BrandPageProps) {
               <div className="lg:col-span-1 order-2 lg:order-1">
                 <div className="aspect-square rounded-lg overflow-hidden">
                   <FallbackImage
-                    src={`/growth-systems/${data.brand.id}-${data.growthProfile.id}.png`}
-                    fallbackSrc={`/growth-systems/${data.growthProfile.id}.png`}
+                    image={getResponsiveImage(`/growth-systems/${data.brand.id}-${data.growthProfile.id}.png`)}
+                    fallback={getResponsiveImage(`/growth-systems/${data.growthProfile.id}.png`)}
                     alt={`${data.growthProfile.name} Growth Profile`}
                     className="w-full h-full object-cover"
+                    sizes="(min-width: 1024px) 320px, 100vw"
                   />
                 </div>
               </div>
@@ -1,21 +1,46 @@
 'use client';
 
+import { useState } from 'react';
+import type { ResponsiveImage } from '@/lib/images';
+
 interface FallbackImageProps {
-  src: string;
-  fallbackSrc: string;
+  image: ResponsiveImage;
+  fallback?: ResponsiveImage;
   alt: string;
   className?: string;
+  sizes?: string;
 }
 
-export default function FallbackImage({ src, fallbackSrc, alt, className }: FallbackImageProps) {
-  return (
+export default function FallbackImage({ image, fallback, alt, className, sizes = '100vw' }: FallbackImageProps) {
+  // Each failure moves on: image, then fallback, then the last one as a plain <img> without <source>s
+  const candidates = fallback ? [image, fallback] : [image];
+  const [attempt, setAttempt] = useState(0);
+  const current = candidates[Math.min(attempt, candidates.length - 1)];
+  const plain = attempt >= candidates.length || current.sources.length === 0;
+
+  const img = (
     <img
-      src={src}
+      key={current.src}
+      src={current.src}
       alt={alt}
       className={className}
-      onError={(e) => {
-        e.currentTarget.src = fallbackSrc;
-      }}
+      width={current.width}
+      height={current.height}
+      style={current.background ? { backgroundColor: current.background } : undefined}
+      onError={() => setAttempt((a) => Math.min(a + 1, candidates.length))}
     />
   );
+
+  if (plain) {
+    return img;
+  }
+
+  return (
+    <picture key={current.src} className="contents">
+      {current.sources.map((source) => (
+        <source key={source.type} type={source.type} srcSet={source.srcSet} sizes={sizes} />
+      ))}
+      {img}
+    </picture>
+  );
 }
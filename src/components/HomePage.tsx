@@ -2,6 +2,7 @@
 
 import { useState, useEffect, useMemo } from 'react';
 import Link from 'next/link';
+import FallbackImage from '@/components/FallbackImage';
 import { getScoreTier } from '@/lib/types';
 import type { BrandMeta } from '@/data';
 
@@ -172,10 +173,11 @@ export default function HomePage({ brands }: HomePageProps) {
                 >
                   {/* Cover Image */}
                   <div className="aspect-[2/1] overflow-hidden gdt-bg-tertiary">
-                    <img
-                      src={brand.coverImage}
+                    <FallbackImage
+                      image={brand.coverImage}
                       alt={`${brand.name} cover`}
                       className="w-full h-full object-cover transition-transform duration-500 group-hover:scale-105"
+                      sizes="(min-width: 1152px) 576px, (min-width: 768px) 50vw, 100vw"
                     />
                   </div>
 
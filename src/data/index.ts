@@ -1,4 +1,5 @@
 import { GDTAnalysis } from '@/lib/types';
+import { getResponsiveImage, ResponsiveImage } from '@/lib/images';
 import { zynAnalysis } from './zyn';
 import { espolonAnalysis } from './espolon';
 import { survodutideAnalysis } from './survodutide';
@@ -42,7 +43,7 @@ export interface BrandMeta {
   accentColor: string;
   totalScore: number;
   growthProfile: string;
-  coverImage: string;
+  coverImage: ResponsiveImage;
 }
 
 export const getAllBrandsMeta = (): BrandMeta[] => {
@@ -55,6 +56,6 @@ export const getAllBrandsMeta = (): BrandMeta[] => {
     accentColor: analysis.brand.accentColor,
     totalScore: analysis.totalScore,
     growthProfile: analysis.growthProfile?.name || analysis.growthSummary?.sequence?.split(' → ')[0] || 'Analysis',
-    coverImage: `/${analysis.brand.id}-cover.png`,
+    coverImage: getResponsiveImage(`/${analysis.brand.id}-cover.png`),
   }));
 };
@@ -0,0 +1,62 @@
+/**
+ * Responsive image lookup (server side)
+ *
+ * Resolves a public image path to its WebP/AVIF renditions from the manifest
+ * generated by scripts/build_image_variants.py. Call this from server
+ * components and pass the result to FallbackImage, so the manifest never
+ * ships in a client bundle.
+ */
+
+import imageManifest from '@/data/image-manifest.json';
+
+interface ImageRendition {
+  src: string;
+  width: number;
+  height: number;
+  bytes: number;
+}
+
+interface ImageManifestEntry {
+  width: number;
+  height: number;
+  background: string;
+  sources: Record<string, ImageRendition[]>;
+}
+
+// One <source> of a <picture>
+export interface ImageSource {
+  type: string;
+  srcSet: string;
+}
+
+// Everything FallbackImage needs to render one image
+export interface ResponsiveImage {
+  src: string;
+  width?: number;
+  height?: number;
+  background?: string;
+  sources: ImageSource[];
+}
+
+const images = imageManifest.images as Record<string, ImageManifestEntry | undefined>;
+
+// Preferred first: the browser takes the first <source> type it supports
+const FORMATS = ['avif', 'webp'];
+
+export const getResponsiveImage = (src: string): ResponsiveImage => {
+  const entry = images[src];
+  if (!entry) {
+    return { src, sources: [] };
+  }
+
+  return {
+    src,
+    width: entry.width,
+    height: entry.height,
+    background: entry.background,
+    sources: FORMATS.filter((format) => entry.sources[format]?.length).map((format) => ({
+      type: `image/${format}`,
+      srcSet: entry.sources[format].map((r) => `${r.src} ${r.width}w`).join(', '),
+    })),
+  };
+};